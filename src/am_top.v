@@ -1,108 +1,108 @@
-/* Generated by Amaranth Yosys 0.40 (PyPI ver 0.40.0.0.post101, git sha1 a1bb0255d) */
+/* Generated by Amaranth Yosys 0.50 (PyPI ver 0.50.0.0.post129, git sha1 b5170e139) */
 
 (* top =  1  *)
-(* src = "/home/virantha/tinytapeout/tt10-enigma/src/top.py:31" *)
+(* src = "/root/package/src/top.py:33" *)
 (* generator = "Amaranth" *)
 module top(clk, rst, uo_out, uio_out, ui_in);
-  reg \$auto$verilog_backend.cc:2352:dump_module$1  = 0;
+  reg \$auto$verilog_backend.cc:2355:dump_module$1  = 0;
   wire \$1 ;
   wire \$2 ;
   reg [4:0] \$3 ;
-  (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_ir.py:215" *)
+  (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_ir.py:283" *)
   input clk;
   wire clk;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:12" *)
+  (* src = "/root/package/src/fsm.py:12" *)
   wire [2:0] cmd;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/lcd.py:19" *)
+  (* src = "/root/package/src/lcd.py:19" *)
   reg [4:0] din = 5'h00;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:10" *)
+  (* src = "/root/package/src/rotor.py:10" *)
   wire [4:0] \din$17 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:174" *)
+  (* src = "/root/package/src/rotor.py:174" *)
   wire [4:0] \din$19 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:30" *)
+  (* src = "/root/package/src/rotor.py:30" *)
   wire [1:0] din_sel;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:23" *)
+  (* src = "/root/package/src/fsm.py:23" *)
   wire [1:0] \din_sel$34 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/lcd.py:20" *)
+  (* src = "/root/package/src/lcd.py:20" *)
   wire [7:0] dout;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:175" *)
+  (* src = "/root/package/src/rotor.py:175" *)
   wire [4:0] \dout$21 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:11" *)
+  (* src = "/root/package/src/rotor.py:11" *)
   wire [4:0] \dout$9 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:16" *)
+  (* src = "/root/package/src/rotor.py:16" *)
   wire [2:0] en;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:17" *)
+  (* src = "/root/package/src/fsm.py:17" *)
   wire [2:0] \en$23 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:46" *)
+  (* src = "/root/package/src/plugboard.py:65" *)
   wire enable;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:50" *)
+  (* src = "/root/package/src/plugboard.py:69" *)
   wire [4:0] in_ltor;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:51" *)
+  (* src = "/root/package/src/plugboard.py:70" *)
   wire [4:0] in_rtol;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:24" *)
+  (* src = "/root/package/src/rotor.py:24" *)
   wire inc;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:21" *)
+  (* src = "/root/package/src/fsm.py:21" *)
   wire \inc$29 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:13" *)
+  (* src = "/root/package/src/fsm.py:13" *)
   wire [2:0] is_at_turnover;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:15" *)
+  (* src = "/root/package/src/rotor.py:15" *)
   wire [2:0] \is_at_turnover$36 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:22" *)
+  (* src = "/root/package/src/fsm.py:22" *)
   wire is_ltor;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:49" *)
+  (* src = "/root/package/src/plugboard.py:68" *)
   wire \is_ltor$32 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:20" *)
+  (* src = "/root/package/src/rotor.py:20" *)
   wire load_ring;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:19" *)
+  (* src = "/root/package/src/fsm.py:19" *)
   wire \load_ring$27 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:21" *)
+  (* src = "/root/package/src/rotor.py:21" *)
   wire load_rotor_type;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:19" *)
+  (* src = "/root/package/src/rotor.py:19" *)
   wire load_start;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:18" *)
+  (* src = "/root/package/src/fsm.py:18" *)
   wire \load_start$25 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:27" *)
+  (* src = "/root/package/src/rotor.py:27" *)
   wire ltor;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:53" *)
+  (* src = "/root/package/src/plugboard.py:72" *)
   wire [4:0] out;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:27" *)
+  (* src = "/root/package/src/fsm.py:27" *)
   wire plugboard_en;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:25" *)
+  (* src = "/root/package/src/fsm.py:25" *)
   wire plugboard_wr_addr;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:26" *)
+  (* src = "/root/package/src/fsm.py:26" *)
   wire plugboard_wr_data;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:15" *)
+  (* src = "/root/package/src/fsm.py:15" *)
   wire ready;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:13" *)
+  (* src = "/root/package/src/rotor.py:13" *)
   wire [4:0] reflector_in;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:16" *)
+  (* src = "/root/package/src/fsm.py:16" *)
   wire result_ready;
-  (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_ir.py:215" *)
+  (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_ir.py:283" *)
   input rst;
   wire rst;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:20" *)
+  (* src = "/root/package/src/fsm.py:20" *)
   wire set_rotors;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/top.py:11" *)
+  (* src = "/root/package/src/top.py:11" *)
   input [7:0] ui_in;
   wire [7:0] ui_in;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/top.py:14" *)
+  (* src = "/root/package/src/top.py:14" *)
   output [5:0] uio_out;
   wire [5:0] uio_out;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/lcd.py:20" *)
+  (* src = "/root/package/src/lcd.py:20" *)
   output [7:0] uo_out;
   wire [7:0] uo_out;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:57" *)
+  (* src = "/root/package/src/plugboard.py:76" *)
   wire wr_addr_en;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:55" *)
+  (* src = "/root/package/src/plugboard.py:74" *)
   wire [4:0] wr_data;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:56" *)
+  (* src = "/root/package/src/plugboard.py:75" *)
   wire wr_data_en;
-  assign \$1  = ui_in[7:5] == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/top.py:70" *) 3'h4;
-  assign \$2  = \$1  & (* src = "/home/virantha/tinytapeout/tt10-enigma/src/top.py:70" *) result_ready;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/top.py:14" *)
+  assign \$1  = ui_in[7:5] == (* src = "/root/package/src/top.py:72" *) 3'h4;
+  assign \$2  = \$1  & (* src = "/root/package/src/top.py:72" *) result_ready;
+  (* src = "/root/package/src/top.py:14" *)
   always @(posedge clk)
     din <= \$3 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/top.py:34" *)
+  (* src = "/root/package/src/top.py:36" *)
   \top.fsm  fsm (
     .clk(clk),
     .cmd(ui_in[7:5]),
@@ -121,24 +121,24 @@ module top(clk, rst, uo_out, uio_out, ui_in);
     .rst(rst),
     .set_rotors(load_rotor_type)
   );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/top.py:37" *)
+  (* src = "/root/package/src/top.py:39" *)
   \top.lcd  lcd (
     .din(din),
     .dout(uo_out)
   );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/top.py:35" *)
+  (* src = "/root/package/src/top.py:37" *)
   \top.plugboard  plugboard (
     .clk(clk),
+    .d(ui_in[4:0]),
     .enable(enable),
     .in_ltor(in_ltor),
     .is_ltor(ltor),
     .out(\din$17 ),
     .rst(rst),
     .wr_addr_en(wr_addr_en),
-    .wr_data(ui_in[4:0]),
     .wr_data_en(wr_data_en)
   );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/top.py:32" *)
+  (* src = "/root/package/src/top.py:34" *)
   \top.r  r (
     .clk(clk),
     .din(\din$17 ),
@@ -154,13 +154,13 @@ module top(clk, rst, uo_out, uio_out, ui_in);
     .reflector_in(reflector_in),
     .rst(rst)
   );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/top.py:33" *)
+  (* src = "/root/package/src/top.py:35" *)
   \top.ref  \ref  (
     .din(in_ltor),
     .dout(reflector_in)
   );
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$1 ) begin end
     \$3  = din;
     if (\$2 ) begin
       \$3  = \din$17 ;
@@ -192,10 +192,10 @@ module top(clk, rst, uo_out, uio_out, ui_in);
   assign uio_out = { ready, din };
 endmodule
 
-(* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:34" *)
+(* src = "/root/package/src/fsm.py:34" *)
 (* generator = "Amaranth" *)
 module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start, load_ring, ready, plugboard_en, plugboard_wr_addr, plugboard_wr_data, set_rotors, result_ready, cmd);
-  reg \$auto$verilog_backend.cc:2352:dump_module$2  = 0;
+  reg \$auto$verilog_backend.cc:2355:dump_module$2  = 0;
   wire \$1 ;
   wire \$10 ;
   wire \$11 ;
@@ -226,122 +226,100 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
   wire \$7 ;
   wire \$8 ;
   wire \$9 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:36" *)
+  (* src = "/root/package/src/fsm.py:36" *)
   reg [1:0] active;
-  (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_ir.py:215" *)
+  (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_ir.py:283" *)
   input clk;
   wire clk;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:12" *)
+  (* src = "/root/package/src/fsm.py:12" *)
   input [2:0] cmd;
   wire [2:0] cmd;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:35" *)
+  (* src = "/root/package/src/fsm.py:35" *)
   reg [1:0] cnt = 2'h0;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:23" *)
+  (* src = "/root/package/src/fsm.py:23" *)
   output [1:0] din_sel;
   reg [1:0] din_sel;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:37" *)
+  (* src = "/root/package/src/fsm.py:37" *)
   reg double_step = 1'h0;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:17" *)
+  (* src = "/root/package/src/fsm.py:17" *)
   output [2:0] en;
   reg [2:0] en;
-  (* enum_base_type = "fsmState" *)
-  (* enum_value_00000 = "Initial/0" *)
-  (* enum_value_00001 = "Get command/1" *)
-  (* enum_value_00010 = "Load start/2" *)
-  (* enum_value_00011 = "Load ring/3" *)
-  (* enum_value_00100 = "Set rotors/4" *)
-  (* enum_value_00101 = "Load plug addr/5" *)
-  (* enum_value_00110 = "Load plug data/6" *)
-  (* enum_value_00111 = "Scramble/7" *)
-  (* enum_value_01000 = "Delay plug/8" *)
-  (* enum_value_01001 = "Inc Rotor 1/9" *)
-  (* enum_value_01010 = "Rotor 0/10" *)
-  (* enum_value_01011 = "Rotor 1/11" *)
-  (* enum_value_01100 = "Rotor 2/12" *)
-  (* enum_value_01101 = "Rotor 2 back/13" *)
-  (* enum_value_01110 = "Rotor 1 back/14" *)
-  (* enum_value_01111 = "Rotor 0 back/15" *)
-  (* enum_value_10000 = "Delay/16" *)
-  (* enum_value_10001 = "Delay 2/17" *)
-  (* enum_value_10010 = "Check turnover/18" *)
-  (* enum_value_10011 = "Inc Rotor 2/19" *)
-  (* enum_value_10100 = "Activate double step/20" *)
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:54" *)
+  (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/contextlib.py:144" *)
   reg [4:0] fsm_state = 5'h00;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:21" *)
+  (* src = "/root/package/src/fsm.py:21" *)
   output inc;
   reg inc;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:13" *)
+  (* src = "/root/package/src/fsm.py:13" *)
   input [2:0] is_at_turnover;
   wire [2:0] is_at_turnover;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:22" *)
+  (* src = "/root/package/src/fsm.py:22" *)
   output is_ltor;
   reg is_ltor;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:19" *)
+  (* src = "/root/package/src/fsm.py:19" *)
   output load_ring;
   reg load_ring;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:18" *)
+  (* src = "/root/package/src/fsm.py:18" *)
   output load_start;
   reg load_start;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:27" *)
+  (* src = "/root/package/src/fsm.py:27" *)
   output plugboard_en;
   reg plugboard_en;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:25" *)
+  (* src = "/root/package/src/fsm.py:25" *)
   output plugboard_wr_addr;
   reg plugboard_wr_addr;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:26" *)
+  (* src = "/root/package/src/fsm.py:26" *)
   output plugboard_wr_data;
   reg plugboard_wr_data;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:15" *)
+  (* src = "/root/package/src/fsm.py:15" *)
   output ready;
   reg ready;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:16" *)
+  (* src = "/root/package/src/fsm.py:16" *)
   output result_ready;
   reg result_ready;
-  (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_ir.py:215" *)
+  (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_ir.py:283" *)
   input rst;
   wire rst;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:20" *)
+  (* src = "/root/package/src/fsm.py:20" *)
   output set_rotors;
   reg set_rotors;
-  assign \$1  = ! (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) fsm_state;
-  assign \$2  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 1'h1;
-  assign \$3  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 2'h2;
-  assign \$4  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 2'h3;
-  assign \$5  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 3'h4;
-  assign \$6  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 3'h5;
-  assign \$7  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 3'h6;
-  assign \$8  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 3'h7;
-  assign \$9  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'h8;
-  assign \$10  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'h9;
-  assign \$11  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'ha;
-  assign \$12  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'hb;
-  assign \$13  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'hc;
-  assign \$14  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'hd;
-  assign \$15  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'he;
-  assign \$16  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'hf;
-  assign \$17  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 5'h10;
-  assign \$18  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 5'h11;
-  assign \$19  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 5'h12;
-  assign \$20  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 5'h13;
-  assign \$21  = fsm_state == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 5'h14;
-  assign \$22  = cnt + (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:80" *) 1'h1;
-  assign \$23  = cnt + (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:83" *) 1'h1;
-  assign \$24  = cnt + (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:86" *) 1'h1;
-  assign \$25  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:116" *) 2'h3;
-  assign \$26  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:127" *) 2'h3;
-  assign \$27  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:137" *) 2'h3;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:35" *)
+  assign \$1  = ! (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) fsm_state;
+  assign \$2  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 1'h1;
+  assign \$3  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 2'h2;
+  assign \$4  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 2'h3;
+  assign \$5  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 3'h4;
+  assign \$6  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 3'h5;
+  assign \$7  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 3'h6;
+  assign \$8  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 3'h7;
+  assign \$9  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'h8;
+  assign \$10  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'h9;
+  assign \$11  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'ha;
+  assign \$12  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'hb;
+  assign \$13  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'hc;
+  assign \$14  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'hd;
+  assign \$15  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'he;
+  assign \$16  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 4'hf;
+  assign \$17  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 5'h10;
+  assign \$18  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 5'h11;
+  assign \$19  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 5'h12;
+  assign \$20  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 5'h13;
+  assign \$21  = fsm_state == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_dsl.py:486" *) 5'h14;
+  assign \$22  = cnt + (* src = "/root/package/src/fsm.py:80" *) 1'h1;
+  assign \$23  = cnt + (* src = "/root/package/src/fsm.py:83" *) 1'h1;
+  assign \$24  = cnt + (* src = "/root/package/src/fsm.py:86" *) 1'h1;
+  assign \$25  = cnt == (* src = "/root/package/src/fsm.py:116" *) 2'h3;
+  assign \$26  = cnt == (* src = "/root/package/src/fsm.py:127" *) 2'h3;
+  assign \$27  = cnt == (* src = "/root/package/src/fsm.py:137" *) 2'h3;
+  (* src = "/root/package/src/fsm.py:35" *)
   always @(posedge clk)
     cnt <= \$28 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:37" *)
+  (* src = "/root/package/src/fsm.py:37" *)
   always @(posedge clk)
     double_step <= \$29 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/fsm.py:54" *)
+  (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/contextlib.py:144" *)
   always @(posedge clk)
     fsm_state <= \$30 ;
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     (* full_case = 32'd1 *)
     casez (active)
       2'h1:
@@ -355,7 +333,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     inc = 1'h0;
     casez (fsm_state)
       5'h00:
@@ -401,7 +379,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     din_sel = 2'h0;
     casez (fsm_state)
       5'h00:
@@ -437,7 +415,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     is_ltor = 1'h0;
     casez (fsm_state)
       5'h00:
@@ -477,7 +455,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     load_start = 1'h0;
     casez (fsm_state)
       5'h00:
@@ -495,7 +473,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     load_ring = 1'h0;
     casez (fsm_state)
       5'h00:
@@ -515,7 +493,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     ready = 1'h0;
     casez (fsm_state)
       5'h00:
@@ -525,7 +503,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     plugboard_en = 1'h0;
     casez (fsm_state)
       5'h00:
@@ -565,7 +543,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     plugboard_wr_addr = 1'h0;
     casez (fsm_state)
       5'h00:
@@ -577,7 +555,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     plugboard_wr_data = 1'h0;
     casez (fsm_state)
       5'h00:
@@ -591,7 +569,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     active = 2'h0;
     casez (fsm_state)
       5'h00:
@@ -637,7 +615,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     set_rotors = 1'h0;
     casez (fsm_state)
       5'h00:
@@ -659,7 +637,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     result_ready = 1'h0;
     casez (fsm_state)
       5'h00:
@@ -697,7 +675,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     \$28  = cnt;
     casez (fsm_state)
       5'h00:
@@ -737,7 +715,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     \$29  = double_step;
     casez (fsm_state)
       5'h00:
@@ -788,7 +766,7 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$2 ) begin end
     \$30  = fsm_state;
     casez (fsm_state)
       5'h00:
@@ -877,19 +855,19 @@ module \top.fsm (clk, rst, is_at_turnover, en, inc, din_sel, is_ltor, load_start
   end
 endmodule
 
-(* src = "/home/virantha/tinytapeout/tt10-enigma/src/lcd.py:65" *)
+(* src = "/root/package/src/lcd.py:65" *)
 (* generator = "Amaranth" *)
 module \top.lcd (dout, din);
-  reg \$auto$verilog_backend.cc:2352:dump_module$3  = 0;
+  reg \$auto$verilog_backend.cc:2355:dump_module$3  = 0;
   reg [6:0] \$1 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/lcd.py:19" *)
+  (* src = "/root/package/src/lcd.py:19" *)
   input [4:0] din;
   wire [4:0] din;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/lcd.py:20" *)
+  (* src = "/root/package/src/lcd.py:20" *)
   output [7:0] dout;
   wire [7:0] dout;
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$3 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$3 ) begin end
     \$1  = 7'h00;
     casez (din)
       5'h00:
@@ -950,10 +928,10 @@ module \top.lcd (dout, din);
   assign dout[6:0] = \$1 ;
 endmodule
 
-(* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:64" *)
+(* src = "/root/package/src/plugboard.py:84" *)
 (* generator = "Amaranth" *)
-module \top.plugboard (clk, rst, out, in_ltor, is_ltor, enable, wr_addr_en, wr_data_en, wr_data);
-  reg \$auto$verilog_backend.cc:2352:dump_module$4  = 0;
+module \top.plugboard (clk, rst, out, in_ltor, is_ltor, enable, wr_addr_en, wr_data_en, d);
+  reg \$auto$verilog_backend.cc:2355:dump_module$4  = 0;
   wire [4:0] \$1 ;
   wire \$10 ;
   wire \$11 ;
@@ -987,2416 +965,306 @@ module \top.plugboard (clk, rst, out, in_ltor, is_ltor, enable, wr_addr_en, wr_d
   wire \$7 ;
   wire \$8 ;
   wire \$9 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$102 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$108 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$114 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$12 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$120 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$126 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$132 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$138 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$144 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$150 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$159 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$170 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$18 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$181 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$192 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$203 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$214 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$225 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$236 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$24 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$247 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$258 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$269 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$280 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$291 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$30 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$302 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$313 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$324 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$335 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$346 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$357 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$36 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$368 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$379 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$390 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$401 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$412 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$42 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$423 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:77" *)
-  wire \$signal$434 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$48 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$54 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$6 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$60 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$66 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$72 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$78 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$84 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$90 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:67" *)
-  wire [4:0] \$signal$96 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:83" *)
+  (* src = "/root/package/src/plugboard.py:94" *)
   reg [4:0] addr;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:95" *)
+  (* src = "/root/package/src/plugboard.py:106" *)
   wire allow_plug;
-  (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_ir.py:215" *)
+  (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_ir.py:283" *)
   input clk;
   wire clk;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:87" *)
+  (* src = "/root/package/src/plugboard.py:98" *)
   reg [4:0] cnt = 5'h00;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire d;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$160 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$162 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$164 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$166 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$168 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$171 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$173 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$175 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$177 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$179 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$182 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$184 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$186 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$188 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$190 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$193 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$195 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$197 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$199 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$201 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$204 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$206 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$208 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$210 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$212 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$215 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$217 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$219 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$221 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$223 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$226 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$228 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$230 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$232 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$234 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$237 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$239 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$241 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$243 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$245 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$248 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$250 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$252 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$254 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$256 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$259 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$261 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$263 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$265 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$267 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$270 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$272 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$274 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$276 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$278 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$281 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$283 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$285 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$287 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$289 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$292 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$294 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$296 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$298 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$300 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$303 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$305 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$307 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$309 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$311 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$314 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$316 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$318 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$320 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$322 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$325 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$327 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$329 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$331 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$333 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$336 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$338 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$340 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$342 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$344 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$347 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$349 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$351 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$353 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$355 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$358 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$360 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$362 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$364 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$366 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$369 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$371 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$373 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$375 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$377 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$380 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$382 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$384 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$386 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$388 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$391 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$393 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$395 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$397 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$399 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$402 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$404 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$406 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$408 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$410 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$413 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$415 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$417 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$419 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$421 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$424 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$426 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$428 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$430 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$432 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$435 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$437 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$439 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:10" *)
-  wire \d$441 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg en;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$161 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$163 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$165 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$167 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$169 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$172 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$174 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$176 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$178 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$180 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$183 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$185 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$187 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$189 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$191 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$194 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$196 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$198 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$200 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$202 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$205 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$207 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$209 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$211 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$213 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$216 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$218 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$220 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$222 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$224 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$227 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$229 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$231 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$233 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$235 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$238 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$240 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$242 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$244 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$246 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$249 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$251 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$253 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$255 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$257 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$260 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$262 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$264 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$266 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$268 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$271 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$273 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$275 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$277 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$279 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$282 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$284 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$286 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$288 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$290 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$293 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$295 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$297 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$299 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$301 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$304 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$306 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$308 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$310 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$312 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$315 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$317 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$319 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$321 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$323 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$326 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$328 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$330 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$332 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$334 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$337 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$339 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$341 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$343 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$345 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$348 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$350 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$352 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$354 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$356 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$359 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$361 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$363 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$365 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$367 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$370 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$372 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$374 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$376 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$378 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$381 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$383 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$385 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$387 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$389 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$392 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$394 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$396 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$398 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$400 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$403 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$405 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$407 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$409 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$411 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$414 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$416 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$418 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$420 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$422 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$425 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$427 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$429 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$431 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  reg \en$433 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$436 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$438 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$440 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:12" *)
-  wire \en$442 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:46" *)
+  (* src = "/root/package/src/plugboard.py:70" *)
+  input [4:0] d;
+  wire [4:0] d;
+  (* src = "/root/package/src/plugboard.py:26" *)
+  reg [25:0] en;
+  (* src = "/root/package/src/plugboard.py:65" *)
   input enable;
   wire enable;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:50" *)
+  (* src = "/root/package/src/plugboard.py:69" *)
   input [4:0] in_ltor;
   wire [4:0] in_ltor;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:51" *)
+  (* src = "/root/package/src/plugboard.py:70" *)
   wire [4:0] in_rtol;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:49" *)
+  (* src = "/root/package/src/plugboard.py:68" *)
   input is_ltor;
   wire is_ltor;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:53" *)
+  (* src = "/root/package/src/plugboard.py:72" *)
   output [4:0] out;
   wire [4:0] out;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:60" *)
+  (* src = "/root/package/src/plugboard.py:79" *)
   reg [4:0] plug_limiter = 5'h00;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire q;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$10 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$100 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$101 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$103 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$104 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$105 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$106 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$107 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$109 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$11 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$110 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$111 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$112 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$113 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$115 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$116 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$117 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$118 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$119 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$121 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$122 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$123 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$124 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$125 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$127 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$128 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$129 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$13 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$130 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$131 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$133 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$134 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$135 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$136 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$137 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$139 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$14 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$140 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$141 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$142 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$143 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$145 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$146 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$147 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$148 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$149 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$15 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$151 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$152 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$153 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$154 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$155 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$16 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$17 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$19 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$2 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$20 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$21 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$22 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$23 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$25 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$26 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$27 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$28 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$29 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$3 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$31 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$32 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$33 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$34 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$35 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$37 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$38 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$39 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$4 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$40 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$41 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$43 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$44 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$45 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$46 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$47 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$49 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$5 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$50 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$51 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$52 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$53 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$55 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$56 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$57 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$58 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$59 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$61 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$62 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$63 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$64 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$65 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$67 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$68 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$69 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$7 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$70 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$71 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$73 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$74 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$75 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$76 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$77 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$79 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$8 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$80 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$81 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$82 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$83 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$85 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$86 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$87 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$88 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$89 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$9 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$91 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$92 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$93 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$94 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$95 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$97 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$98 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:11" *)
-  wire \q$99 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:84" *)
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [129:0] q;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[0] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[10] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[11] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[12] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[13] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[14] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[15] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[16] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[17] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[18] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[19] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[1] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[20] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[21] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[22] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[23] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[24] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[25] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[2] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[3] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[4] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[5] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[6] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[7] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[8] ;
+  (* src = "/root/package/src/plugboard.py:24" *)
+  wire [4:0] \q[9] ;
+  (* src = "/root/package/src/plugboard.py:95" *)
   reg [4:0] read;
-  (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_ir.py:215" *)
+  (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_ir.py:283" *)
   input rst;
   wire rst;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:57" *)
+  (* src = "/root/package/src/plugboard.py:76" *)
   input wr_addr_en;
   wire wr_addr_en;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:51" *)
-  input [4:0] wr_data;
+  (* src = "/root/package/src/plugboard.py:74" *)
   wire [4:0] wr_data;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:56" *)
+  (* src = "/root/package/src/plugboard.py:75" *)
   input wr_data_en;
   wire wr_data_en;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:87" *)
+  assign allow_plug = \$1  < (* src = "/root/package/src/plugboard.py:107" *) 2'h3;
+  assign \$2  = wr_data_en & (* src = "/root/package/src/plugboard.py:114" *) allow_plug;
+  assign \$3  = ! (* src = "/root/package/src/plugboard.py:116" *) cnt;
+  assign \$4  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 1'h1;
+  assign \$5  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 2'h2;
+  assign \$6  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 2'h3;
+  assign \$7  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 3'h4;
+  assign \$8  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 3'h5;
+  assign \$9  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 3'h6;
+  assign \$10  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 3'h7;
+  assign \$11  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 4'h8;
+  assign \$12  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 4'h9;
+  assign \$13  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 4'ha;
+  assign \$14  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 4'hb;
+  assign \$15  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 4'hc;
+  assign \$16  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 4'hd;
+  assign \$17  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 4'he;
+  assign \$18  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 4'hf;
+  assign \$19  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 5'h10;
+  assign \$20  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 5'h11;
+  assign \$21  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 5'h12;
+  assign \$22  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 5'h13;
+  assign \$23  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 5'h14;
+  assign \$24  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 5'h15;
+  assign \$25  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 5'h16;
+  assign \$26  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 5'h17;
+  assign \$27  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 5'h18;
+  assign \$28  = cnt == (* src = "/root/package/src/plugboard.py:116" *) 5'h19;
+  assign out = enable ? (* src = "/root/package/src/plugboard.py:127" *) read : addr;
+  assign \$29  = cnt != (* src = "/root/package/src/plugboard.py:109" *) d;
+  assign \$30  = wr_data_en & (* src = "/root/package/src/plugboard.py:109" *) \$29 ;
+  assign \$31  = plug_limiter + (* src = "/root/package/src/plugboard.py:111" *) 1'h1;
+  (* src = "/root/package/src/plugboard.py:98" *)
   always @(posedge clk)
     cnt <= \$32 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:60" *)
+  (* src = "/root/package/src/plugboard.py:79" *)
   always @(posedge clk)
     plug_limiter <= \$33 ;
-  assign allow_plug = \$1  < (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:96" *) 2'h3;
-  assign \$2  = wr_data_en & (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:103" *) allow_plug;
-  assign \$3  = ! (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) cnt;
-  assign \$4  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 1'h1;
-  assign \$5  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 2'h2;
-  assign \$6  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 2'h3;
-  assign \$7  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 3'h4;
-  assign \$8  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 3'h5;
-  assign \$9  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 3'h6;
-  assign \$10  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 3'h7;
-  assign \$11  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 4'h8;
-  assign \$12  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 4'h9;
-  assign \$13  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 4'ha;
-  assign \$14  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 4'hb;
-  assign \$15  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 4'hc;
-  assign \$16  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 4'hd;
-  assign \$17  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 4'he;
-  assign \$18  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 4'hf;
-  assign \$19  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 5'h10;
-  assign \$20  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 5'h11;
-  assign \$21  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 5'h12;
-  assign \$22  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 5'h13;
-  assign \$23  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 5'h14;
-  assign \$24  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 5'h15;
-  assign \$25  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 5'h16;
-  assign \$26  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 5'h17;
-  assign \$27  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 5'h18;
-  assign \$28  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:105" *) 5'h19;
-  assign out = enable ? (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:116" *) read : addr;
-  assign \$29  = cnt != (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:98" *) wr_data;
-  assign \$30  = wr_data_en & (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:98" *) \$29 ;
-  assign \$31  = plug_limiter + (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:100" *) 1'h1;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_0_0 (
-    .clk(en),
-    .d(wr_data[0]),
+  (* src = "/root/package/src/plugboard.py:32" *)
+  latch_array #(
+    .DEPTH(32'd26),
+    .WIDTH(32'd5)
+  ) latches (
+    .d(d),
+    .en(en),
     .q(q)
   );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_0_1 (
-    .clk(en),
-    .d(wr_data[1]),
-    .q(\q$2 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_0_2 (
-    .clk(en),
-    .d(wr_data[2]),
-    .q(\q$3 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_0_3 (
-    .clk(en),
-    .d(wr_data[3]),
-    .q(\q$4 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_0_4 (
-    .clk(en),
-    .d(wr_data[4]),
-    .q(\q$5 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_10_0 (
-    .clk(\en$268 ),
-    .d(wr_data[0]),
-    .q(\q$61 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_10_1 (
-    .clk(\en$268 ),
-    .d(wr_data[1]),
-    .q(\q$62 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_10_2 (
-    .clk(\en$268 ),
-    .d(wr_data[2]),
-    .q(\q$63 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_10_3 (
-    .clk(\en$268 ),
-    .d(wr_data[3]),
-    .q(\q$64 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_10_4 (
-    .clk(\en$268 ),
-    .d(wr_data[4]),
-    .q(\q$65 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_11_0 (
-    .clk(\en$279 ),
-    .d(wr_data[0]),
-    .q(\q$67 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_11_1 (
-    .clk(\en$279 ),
-    .d(wr_data[1]),
-    .q(\q$68 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_11_2 (
-    .clk(\en$279 ),
-    .d(wr_data[2]),
-    .q(\q$69 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_11_3 (
-    .clk(\en$279 ),
-    .d(wr_data[3]),
-    .q(\q$70 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_11_4 (
-    .clk(\en$279 ),
-    .d(wr_data[4]),
-    .q(\q$71 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_12_0 (
-    .clk(\en$290 ),
-    .d(wr_data[0]),
-    .q(\q$73 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_12_1 (
-    .clk(\en$290 ),
-    .d(wr_data[1]),
-    .q(\q$74 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_12_2 (
-    .clk(\en$290 ),
-    .d(wr_data[2]),
-    .q(\q$75 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_12_3 (
-    .clk(\en$290 ),
-    .d(wr_data[3]),
-    .q(\q$76 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_12_4 (
-    .clk(\en$290 ),
-    .d(wr_data[4]),
-    .q(\q$77 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_13_0 (
-    .clk(\en$301 ),
-    .d(wr_data[0]),
-    .q(\q$79 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_13_1 (
-    .clk(\en$301 ),
-    .d(wr_data[1]),
-    .q(\q$80 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_13_2 (
-    .clk(\en$301 ),
-    .d(wr_data[2]),
-    .q(\q$81 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_13_3 (
-    .clk(\en$301 ),
-    .d(wr_data[3]),
-    .q(\q$82 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_13_4 (
-    .clk(\en$301 ),
-    .d(wr_data[4]),
-    .q(\q$83 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_14_0 (
-    .clk(\en$312 ),
-    .d(wr_data[0]),
-    .q(\q$85 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_14_1 (
-    .clk(\en$312 ),
-    .d(wr_data[1]),
-    .q(\q$86 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_14_2 (
-    .clk(\en$312 ),
-    .d(wr_data[2]),
-    .q(\q$87 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_14_3 (
-    .clk(\en$312 ),
-    .d(wr_data[3]),
-    .q(\q$88 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_14_4 (
-    .clk(\en$312 ),
-    .d(wr_data[4]),
-    .q(\q$89 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_15_0 (
-    .clk(\en$323 ),
-    .d(wr_data[0]),
-    .q(\q$91 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_15_1 (
-    .clk(\en$323 ),
-    .d(wr_data[1]),
-    .q(\q$92 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_15_2 (
-    .clk(\en$323 ),
-    .d(wr_data[2]),
-    .q(\q$93 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_15_3 (
-    .clk(\en$323 ),
-    .d(wr_data[3]),
-    .q(\q$94 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_15_4 (
-    .clk(\en$323 ),
-    .d(wr_data[4]),
-    .q(\q$95 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_16_0 (
-    .clk(\en$334 ),
-    .d(wr_data[0]),
-    .q(\q$97 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_16_1 (
-    .clk(\en$334 ),
-    .d(wr_data[1]),
-    .q(\q$98 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_16_2 (
-    .clk(\en$334 ),
-    .d(wr_data[2]),
-    .q(\q$99 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_16_3 (
-    .clk(\en$334 ),
-    .d(wr_data[3]),
-    .q(\q$100 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_16_4 (
-    .clk(\en$334 ),
-    .d(wr_data[4]),
-    .q(\q$101 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_17_0 (
-    .clk(\en$345 ),
-    .d(wr_data[0]),
-    .q(\q$103 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_17_1 (
-    .clk(\en$345 ),
-    .d(wr_data[1]),
-    .q(\q$104 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_17_2 (
-    .clk(\en$345 ),
-    .d(wr_data[2]),
-    .q(\q$105 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_17_3 (
-    .clk(\en$345 ),
-    .d(wr_data[3]),
-    .q(\q$106 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_17_4 (
-    .clk(\en$345 ),
-    .d(wr_data[4]),
-    .q(\q$107 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_18_0 (
-    .clk(\en$356 ),
-    .d(wr_data[0]),
-    .q(\q$109 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_18_1 (
-    .clk(\en$356 ),
-    .d(wr_data[1]),
-    .q(\q$110 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_18_2 (
-    .clk(\en$356 ),
-    .d(wr_data[2]),
-    .q(\q$111 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_18_3 (
-    .clk(\en$356 ),
-    .d(wr_data[3]),
-    .q(\q$112 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_18_4 (
-    .clk(\en$356 ),
-    .d(wr_data[4]),
-    .q(\q$113 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_19_0 (
-    .clk(\en$367 ),
-    .d(wr_data[0]),
-    .q(\q$115 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_19_1 (
-    .clk(\en$367 ),
-    .d(wr_data[1]),
-    .q(\q$116 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_19_2 (
-    .clk(\en$367 ),
-    .d(wr_data[2]),
-    .q(\q$117 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_19_3 (
-    .clk(\en$367 ),
-    .d(wr_data[3]),
-    .q(\q$118 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_19_4 (
-    .clk(\en$367 ),
-    .d(wr_data[4]),
-    .q(\q$119 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_1_0 (
-    .clk(\en$169 ),
-    .d(wr_data[0]),
-    .q(\q$7 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_1_1 (
-    .clk(\en$169 ),
-    .d(wr_data[1]),
-    .q(\q$8 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_1_2 (
-    .clk(\en$169 ),
-    .d(wr_data[2]),
-    .q(\q$9 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_1_3 (
-    .clk(\en$169 ),
-    .d(wr_data[3]),
-    .q(\q$10 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_1_4 (
-    .clk(\en$169 ),
-    .d(wr_data[4]),
-    .q(\q$11 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_20_0 (
-    .clk(\en$378 ),
-    .d(wr_data[0]),
-    .q(\q$121 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_20_1 (
-    .clk(\en$378 ),
-    .d(wr_data[1]),
-    .q(\q$122 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_20_2 (
-    .clk(\en$378 ),
-    .d(wr_data[2]),
-    .q(\q$123 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_20_3 (
-    .clk(\en$378 ),
-    .d(wr_data[3]),
-    .q(\q$124 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_20_4 (
-    .clk(\en$378 ),
-    .d(wr_data[4]),
-    .q(\q$125 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_21_0 (
-    .clk(\en$389 ),
-    .d(wr_data[0]),
-    .q(\q$127 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_21_1 (
-    .clk(\en$389 ),
-    .d(wr_data[1]),
-    .q(\q$128 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_21_2 (
-    .clk(\en$389 ),
-    .d(wr_data[2]),
-    .q(\q$129 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_21_3 (
-    .clk(\en$389 ),
-    .d(wr_data[3]),
-    .q(\q$130 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_21_4 (
-    .clk(\en$389 ),
-    .d(wr_data[4]),
-    .q(\q$131 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_22_0 (
-    .clk(\en$400 ),
-    .d(wr_data[0]),
-    .q(\q$133 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_22_1 (
-    .clk(\en$400 ),
-    .d(wr_data[1]),
-    .q(\q$134 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_22_2 (
-    .clk(\en$400 ),
-    .d(wr_data[2]),
-    .q(\q$135 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_22_3 (
-    .clk(\en$400 ),
-    .d(wr_data[3]),
-    .q(\q$136 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_22_4 (
-    .clk(\en$400 ),
-    .d(wr_data[4]),
-    .q(\q$137 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_23_0 (
-    .clk(\en$411 ),
-    .d(wr_data[0]),
-    .q(\q$139 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_23_1 (
-    .clk(\en$411 ),
-    .d(wr_data[1]),
-    .q(\q$140 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_23_2 (
-    .clk(\en$411 ),
-    .d(wr_data[2]),
-    .q(\q$141 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_23_3 (
-    .clk(\en$411 ),
-    .d(wr_data[3]),
-    .q(\q$142 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_23_4 (
-    .clk(\en$411 ),
-    .d(wr_data[4]),
-    .q(\q$143 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_24_0 (
-    .clk(\en$422 ),
-    .d(wr_data[0]),
-    .q(\q$145 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_24_1 (
-    .clk(\en$422 ),
-    .d(wr_data[1]),
-    .q(\q$146 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_24_2 (
-    .clk(\en$422 ),
-    .d(wr_data[2]),
-    .q(\q$147 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_24_3 (
-    .clk(\en$422 ),
-    .d(wr_data[3]),
-    .q(\q$148 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_24_4 (
-    .clk(\en$422 ),
-    .d(wr_data[4]),
-    .q(\q$149 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_25_0 (
-    .clk(\en$433 ),
-    .d(wr_data[0]),
-    .q(\q$151 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_25_1 (
-    .clk(\en$433 ),
-    .d(wr_data[1]),
-    .q(\q$152 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_25_2 (
-    .clk(\en$433 ),
-    .d(wr_data[2]),
-    .q(\q$153 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_25_3 (
-    .clk(\en$433 ),
-    .d(wr_data[3]),
-    .q(\q$154 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_25_4 (
-    .clk(\en$433 ),
-    .d(wr_data[4]),
-    .q(\q$155 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_2_0 (
-    .clk(\en$180 ),
-    .d(wr_data[0]),
-    .q(\q$13 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_2_1 (
-    .clk(\en$180 ),
-    .d(wr_data[1]),
-    .q(\q$14 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_2_2 (
-    .clk(\en$180 ),
-    .d(wr_data[2]),
-    .q(\q$15 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_2_3 (
-    .clk(\en$180 ),
-    .d(wr_data[3]),
-    .q(\q$16 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_2_4 (
-    .clk(\en$180 ),
-    .d(wr_data[4]),
-    .q(\q$17 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_3_0 (
-    .clk(\en$191 ),
-    .d(wr_data[0]),
-    .q(\q$19 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_3_1 (
-    .clk(\en$191 ),
-    .d(wr_data[1]),
-    .q(\q$20 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_3_2 (
-    .clk(\en$191 ),
-    .d(wr_data[2]),
-    .q(\q$21 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_3_3 (
-    .clk(\en$191 ),
-    .d(wr_data[3]),
-    .q(\q$22 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_3_4 (
-    .clk(\en$191 ),
-    .d(wr_data[4]),
-    .q(\q$23 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_4_0 (
-    .clk(\en$202 ),
-    .d(wr_data[0]),
-    .q(\q$25 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_4_1 (
-    .clk(\en$202 ),
-    .d(wr_data[1]),
-    .q(\q$26 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_4_2 (
-    .clk(\en$202 ),
-    .d(wr_data[2]),
-    .q(\q$27 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_4_3 (
-    .clk(\en$202 ),
-    .d(wr_data[3]),
-    .q(\q$28 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_4_4 (
-    .clk(\en$202 ),
-    .d(wr_data[4]),
-    .q(\q$29 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_5_0 (
-    .clk(\en$213 ),
-    .d(wr_data[0]),
-    .q(\q$31 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_5_1 (
-    .clk(\en$213 ),
-    .d(wr_data[1]),
-    .q(\q$32 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_5_2 (
-    .clk(\en$213 ),
-    .d(wr_data[2]),
-    .q(\q$33 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_5_3 (
-    .clk(\en$213 ),
-    .d(wr_data[3]),
-    .q(\q$34 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_5_4 (
-    .clk(\en$213 ),
-    .d(wr_data[4]),
-    .q(\q$35 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_6_0 (
-    .clk(\en$224 ),
-    .d(wr_data[0]),
-    .q(\q$37 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_6_1 (
-    .clk(\en$224 ),
-    .d(wr_data[1]),
-    .q(\q$38 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_6_2 (
-    .clk(\en$224 ),
-    .d(wr_data[2]),
-    .q(\q$39 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_6_3 (
-    .clk(\en$224 ),
-    .d(wr_data[3]),
-    .q(\q$40 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_6_4 (
-    .clk(\en$224 ),
-    .d(wr_data[4]),
-    .q(\q$41 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_7_0 (
-    .clk(\en$235 ),
-    .d(wr_data[0]),
-    .q(\q$43 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_7_1 (
-    .clk(\en$235 ),
-    .d(wr_data[1]),
-    .q(\q$44 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_7_2 (
-    .clk(\en$235 ),
-    .d(wr_data[2]),
-    .q(\q$45 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_7_3 (
-    .clk(\en$235 ),
-    .d(wr_data[3]),
-    .q(\q$46 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_7_4 (
-    .clk(\en$235 ),
-    .d(wr_data[4]),
-    .q(\q$47 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_8_0 (
-    .clk(\en$246 ),
-    .d(wr_data[0]),
-    .q(\q$49 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_8_1 (
-    .clk(\en$246 ),
-    .d(wr_data[1]),
-    .q(\q$50 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_8_2 (
-    .clk(\en$246 ),
-    .d(wr_data[2]),
-    .q(\q$51 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_8_3 (
-    .clk(\en$246 ),
-    .d(wr_data[3]),
-    .q(\q$52 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_8_4 (
-    .clk(\en$246 ),
-    .d(wr_data[4]),
-    .q(\q$53 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_9_0 (
-    .clk(\en$257 ),
-    .d(wr_data[0]),
-    .q(\q$55 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_9_1 (
-    .clk(\en$257 ),
-    .d(wr_data[1]),
-    .q(\q$56 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_9_2 (
-    .clk(\en$257 ),
-    .d(wr_data[2]),
-    .q(\q$57 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_9_3 (
-    .clk(\en$257 ),
-    .d(wr_data[3]),
-    .q(\q$58 )
-  );
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/plugboard.py:16" *)
-  d_latch bits_9_4 (
-    .clk(\en$257 ),
-    .d(wr_data[4]),
-    .q(\q$59 )
-  );
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$224  = 1'h0;
-    if (\$2 ) begin
-      \en$224  = \$9 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$235  = 1'h0;
-    if (\$2 ) begin
-      \en$235  = \$10 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$246  = 1'h0;
-    if (\$2 ) begin
-      \en$246  = \$11 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$257  = 1'h0;
-    if (\$2 ) begin
-      \en$257  = \$12 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$268  = 1'h0;
-    if (\$2 ) begin
-      \en$268  = \$13 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$279  = 1'h0;
-    if (\$2 ) begin
-      \en$279  = \$14 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$290  = 1'h0;
-    if (\$2 ) begin
-      \en$290  = \$15 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$301  = 1'h0;
-    if (\$2 ) begin
-      \en$301  = \$16 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$312  = 1'h0;
-    if (\$2 ) begin
-      \en$312  = \$17 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$323  = 1'h0;
-    if (\$2 ) begin
-      \en$323  = \$18 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$334  = 1'h0;
-    if (\$2 ) begin
-      \en$334  = \$19 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$345  = 1'h0;
-    if (\$2 ) begin
-      \en$345  = \$20 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$356  = 1'h0;
-    if (\$2 ) begin
-      \en$356  = \$21 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$367  = 1'h0;
-    if (\$2 ) begin
-      \en$367  = \$22 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$378  = 1'h0;
-    if (\$2 ) begin
-      \en$378  = \$23 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$389  = 1'h0;
-    if (\$2 ) begin
-      \en$389  = \$24 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$400  = 1'h0;
-    if (\$2 ) begin
-      \en$400  = \$25 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$411  = 1'h0;
-    if (\$2 ) begin
-      \en$411  = \$26 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$422  = 1'h0;
-    if (\$2 ) begin
-      \en$422  = \$27 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$433  = 1'h0;
-    if (\$2 ) begin
-      \en$433  = \$28 ;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    (* full_case = 32'd1 *)
-    if (is_ltor) begin
-      addr = in_ltor;
-    end else begin
-      addr = wr_data;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \$32  = cnt;
-    if (wr_addr_en) begin
-      \$32  = wr_data;
-    end
-    if (rst) begin
-      \$32  = 5'h00;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \$33  = plug_limiter;
-    if (\$30 ) begin
-      if (allow_plug) begin
-        \$33  = \$31 [4:0];
-      end
-    end
-    if (rst) begin
-      \$33  = 5'h00;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$4 ) begin end
     read = 5'h00;
     casez (addr)
       5'h00:
-          read = \$signal ;
+          read = q[4:0];
       5'h01:
-          read = \$signal$6 ;
+          read = q[9:5];
       5'h02:
-          read = \$signal$12 ;
+          read = q[14:10];
       5'h03:
-          read = \$signal$18 ;
+          read = q[19:15];
       5'h04:
-          read = \$signal$24 ;
+          read = q[24:20];
       5'h05:
-          read = \$signal$30 ;
+          read = q[29:25];
       5'h06:
-          read = \$signal$36 ;
+          read = q[34:30];
       5'h07:
-          read = \$signal$42 ;
+          read = q[39:35];
       5'h08:
-          read = \$signal$48 ;
+          read = q[44:40];
       5'h09:
-          read = \$signal$54 ;
+          read = q[49:45];
       5'h0a:
-          read = \$signal$60 ;
+          read = q[54:50];
       5'h0b:
-          read = \$signal$66 ;
+          read = q[59:55];
       5'h0c:
-          read = \$signal$72 ;
+          read = q[64:60];
       5'h0d:
-          read = \$signal$78 ;
+          read = q[69:65];
       5'h0e:
-          read = \$signal$84 ;
+          read = q[74:70];
       5'h0f:
-          read = \$signal$90 ;
+          read = q[79:75];
       5'h10:
-          read = \$signal$96 ;
+          read = q[84:80];
       5'h11:
-          read = \$signal$102 ;
+          read = q[89:85];
       5'h12:
-          read = \$signal$108 ;
+          read = q[94:90];
       5'h13:
-          read = \$signal$114 ;
+          read = q[99:95];
       5'h14:
-          read = \$signal$120 ;
+          read = q[104:100];
       5'h15:
-          read = \$signal$126 ;
+          read = q[109:105];
       5'h16:
-          read = \$signal$132 ;
+          read = q[114:110];
       5'h17:
-          read = \$signal$138 ;
+          read = q[119:115];
       5'h18:
-          read = \$signal$144 ;
+          read = q[124:120];
       5'h19:
-          read = \$signal$150 ;
+          read = q[129:125];
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    en = 1'h0;
+    if (\$auto$verilog_backend.cc:2355:dump_module$4 ) begin end
+    en = 26'h0000000;
     if (\$2 ) begin
-      en = \$3 ;
+      en[0] = \$3 ;
+      en[1] = \$4 ;
+      en[2] = \$5 ;
+      en[3] = \$6 ;
+      en[4] = \$7 ;
+      en[5] = \$8 ;
+      en[6] = \$9 ;
+      en[7] = \$10 ;
+      en[8] = \$11 ;
+      en[9] = \$12 ;
+      en[10] = \$13 ;
+      en[11] = \$14 ;
+      en[12] = \$15 ;
+      en[13] = \$16 ;
+      en[14] = \$17 ;
+      en[15] = \$18 ;
+      en[16] = \$19 ;
+      en[17] = \$20 ;
+      en[18] = \$21 ;
+      en[19] = \$22 ;
+      en[20] = \$23 ;
+      en[21] = \$24 ;
+      en[22] = \$25 ;
+      en[23] = \$26 ;
+      en[24] = \$27 ;
+      en[25] = \$28 ;
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$169  = 1'h0;
-    if (\$2 ) begin
-      \en$169  = \$4 ;
+    if (\$auto$verilog_backend.cc:2355:dump_module$4 ) begin end
+    (* full_case = 32'd1 *)
+    if (is_ltor) begin
+      addr = in_ltor;
+    end else begin
+      addr = d;
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$180  = 1'h0;
-    if (\$2 ) begin
-      \en$180  = \$5 ;
+    if (\$auto$verilog_backend.cc:2355:dump_module$4 ) begin end
+    \$32  = cnt;
+    if (wr_addr_en) begin
+      \$32  = d;
     end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$191  = 1'h0;
-    if (\$2 ) begin
-      \en$191  = \$6 ;
+    if (rst) begin
+      \$32  = 5'h00;
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$202  = 1'h0;
-    if (\$2 ) begin
-      \en$202  = \$7 ;
+    if (\$auto$verilog_backend.cc:2355:dump_module$4 ) begin end
+    \$33  = plug_limiter;
+    if (\$30 ) begin
+      if (allow_plug) begin
+        \$33  = \$31 [4:0];
+      end
     end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
-    \en$213  = 1'h0;
-    if (\$2 ) begin
-      \en$213  = \$8 ;
+    if (rst) begin
+      \$33  = 5'h00;
     end
   end
-  assign d = wr_data[0];
-  assign \$signal$159  = en;
-  assign \d$160  = wr_data[1];
-  assign \en$161  = en;
-  assign \d$162  = wr_data[2];
-  assign \en$163  = en;
-  assign \d$164  = wr_data[3];
-  assign \en$165  = en;
-  assign \d$166  = wr_data[4];
-  assign \en$167  = en;
-  assign \d$168  = wr_data[0];
-  assign \$signal$170  = \en$169 ;
-  assign \d$171  = wr_data[1];
-  assign \en$172  = \en$169 ;
-  assign \d$173  = wr_data[2];
-  assign \en$174  = \en$169 ;
-  assign \d$175  = wr_data[3];
-  assign \en$176  = \en$169 ;
-  assign \d$177  = wr_data[4];
-  assign \en$178  = \en$169 ;
-  assign \d$179  = wr_data[0];
-  assign \$signal$181  = \en$180 ;
-  assign \d$182  = wr_data[1];
-  assign \en$183  = \en$180 ;
-  assign \d$184  = wr_data[2];
-  assign \en$185  = \en$180 ;
-  assign \d$186  = wr_data[3];
-  assign \en$187  = \en$180 ;
-  assign \d$188  = wr_data[4];
-  assign \en$189  = \en$180 ;
-  assign \d$190  = wr_data[0];
-  assign \$signal$192  = \en$191 ;
-  assign \d$193  = wr_data[1];
-  assign \en$194  = \en$191 ;
-  assign \d$195  = wr_data[2];
-  assign \en$196  = \en$191 ;
-  assign \d$197  = wr_data[3];
-  assign \en$198  = \en$191 ;
-  assign \d$199  = wr_data[4];
-  assign \en$200  = \en$191 ;
-  assign \d$201  = wr_data[0];
-  assign \$signal$203  = \en$202 ;
-  assign \d$204  = wr_data[1];
-  assign \en$205  = \en$202 ;
-  assign \d$206  = wr_data[2];
-  assign \en$207  = \en$202 ;
-  assign \d$208  = wr_data[3];
-  assign \en$209  = \en$202 ;
-  assign \d$210  = wr_data[4];
-  assign \en$211  = \en$202 ;
-  assign \d$212  = wr_data[0];
-  assign \$signal$214  = \en$213 ;
-  assign \d$215  = wr_data[1];
-  assign \en$216  = \en$213 ;
-  assign \d$217  = wr_data[2];
-  assign \en$218  = \en$213 ;
-  assign \d$219  = wr_data[3];
-  assign \en$220  = \en$213 ;
-  assign \d$221  = wr_data[4];
-  assign \en$222  = \en$213 ;
-  assign \d$223  = wr_data[0];
-  assign \$signal$225  = \en$224 ;
-  assign \d$226  = wr_data[1];
-  assign \en$227  = \en$224 ;
-  assign \d$228  = wr_data[2];
-  assign \en$229  = \en$224 ;
-  assign \d$230  = wr_data[3];
-  assign \en$231  = \en$224 ;
-  assign \d$232  = wr_data[4];
-  assign \en$233  = \en$224 ;
-  assign \d$234  = wr_data[0];
-  assign \$signal$236  = \en$235 ;
-  assign \d$237  = wr_data[1];
-  assign \en$238  = \en$235 ;
-  assign \d$239  = wr_data[2];
-  assign \en$240  = \en$235 ;
-  assign \d$241  = wr_data[3];
-  assign \en$242  = \en$235 ;
-  assign \d$243  = wr_data[4];
-  assign \en$244  = \en$235 ;
-  assign \d$245  = wr_data[0];
-  assign \$signal$247  = \en$246 ;
-  assign \d$248  = wr_data[1];
-  assign \en$249  = \en$246 ;
-  assign \d$250  = wr_data[2];
-  assign \en$251  = \en$246 ;
-  assign \d$252  = wr_data[3];
-  assign \en$253  = \en$246 ;
-  assign \d$254  = wr_data[4];
-  assign \en$255  = \en$246 ;
-  assign \d$256  = wr_data[0];
-  assign \$signal$258  = \en$257 ;
-  assign \d$259  = wr_data[1];
-  assign \en$260  = \en$257 ;
-  assign \d$261  = wr_data[2];
-  assign \en$262  = \en$257 ;
-  assign \d$263  = wr_data[3];
-  assign \en$264  = \en$257 ;
-  assign \d$265  = wr_data[4];
-  assign \en$266  = \en$257 ;
-  assign \d$267  = wr_data[0];
-  assign \$signal$269  = \en$268 ;
-  assign \d$270  = wr_data[1];
-  assign \en$271  = \en$268 ;
-  assign \d$272  = wr_data[2];
-  assign \en$273  = \en$268 ;
-  assign \d$274  = wr_data[3];
-  assign \en$275  = \en$268 ;
-  assign \d$276  = wr_data[4];
-  assign \en$277  = \en$268 ;
-  assign \d$278  = wr_data[0];
-  assign \$signal$280  = \en$279 ;
-  assign \d$281  = wr_data[1];
-  assign \en$282  = \en$279 ;
-  assign \d$283  = wr_data[2];
-  assign \en$284  = \en$279 ;
-  assign \d$285  = wr_data[3];
-  assign \en$286  = \en$279 ;
-  assign \d$287  = wr_data[4];
-  assign \en$288  = \en$279 ;
-  assign \d$289  = wr_data[0];
-  assign \$signal$291  = \en$290 ;
-  assign \d$292  = wr_data[1];
-  assign \en$293  = \en$290 ;
-  assign \d$294  = wr_data[2];
-  assign \en$295  = \en$290 ;
-  assign \d$296  = wr_data[3];
-  assign \en$297  = \en$290 ;
-  assign \d$298  = wr_data[4];
-  assign \en$299  = \en$290 ;
-  assign \d$300  = wr_data[0];
-  assign \$signal$302  = \en$301 ;
-  assign \d$303  = wr_data[1];
-  assign \en$304  = \en$301 ;
-  assign \d$305  = wr_data[2];
-  assign \en$306  = \en$301 ;
-  assign \d$307  = wr_data[3];
-  assign \en$308  = \en$301 ;
-  assign \d$309  = wr_data[4];
-  assign \en$310  = \en$301 ;
-  assign \d$311  = wr_data[0];
-  assign \$signal$313  = \en$312 ;
-  assign \d$314  = wr_data[1];
-  assign \en$315  = \en$312 ;
-  assign \d$316  = wr_data[2];
-  assign \en$317  = \en$312 ;
-  assign \d$318  = wr_data[3];
-  assign \en$319  = \en$312 ;
-  assign \d$320  = wr_data[4];
-  assign \en$321  = \en$312 ;
-  assign \d$322  = wr_data[0];
-  assign \$signal$324  = \en$323 ;
-  assign \d$325  = wr_data[1];
-  assign \en$326  = \en$323 ;
-  assign \d$327  = wr_data[2];
-  assign \en$328  = \en$323 ;
-  assign \d$329  = wr_data[3];
-  assign \en$330  = \en$323 ;
-  assign \d$331  = wr_data[4];
-  assign \en$332  = \en$323 ;
-  assign \d$333  = wr_data[0];
-  assign \$signal$335  = \en$334 ;
-  assign \d$336  = wr_data[1];
-  assign \en$337  = \en$334 ;
-  assign \d$338  = wr_data[2];
-  assign \en$339  = \en$334 ;
-  assign \d$340  = wr_data[3];
-  assign \en$341  = \en$334 ;
-  assign \d$342  = wr_data[4];
-  assign \en$343  = \en$334 ;
-  assign \d$344  = wr_data[0];
-  assign \$signal$346  = \en$345 ;
-  assign \d$347  = wr_data[1];
-  assign \en$348  = \en$345 ;
-  assign \d$349  = wr_data[2];
-  assign \en$350  = \en$345 ;
-  assign \d$351  = wr_data[3];
-  assign \en$352  = \en$345 ;
-  assign \d$353  = wr_data[4];
-  assign \en$354  = \en$345 ;
-  assign \d$355  = wr_data[0];
-  assign \$signal$357  = \en$356 ;
-  assign \d$358  = wr_data[1];
-  assign \en$359  = \en$356 ;
-  assign \d$360  = wr_data[2];
-  assign \en$361  = \en$356 ;
-  assign \d$362  = wr_data[3];
-  assign \en$363  = \en$356 ;
-  assign \d$364  = wr_data[4];
-  assign \en$365  = \en$356 ;
-  assign \d$366  = wr_data[0];
-  assign \$signal$368  = \en$367 ;
-  assign \d$369  = wr_data[1];
-  assign \en$370  = \en$367 ;
-  assign \d$371  = wr_data[2];
-  assign \en$372  = \en$367 ;
-  assign \d$373  = wr_data[3];
-  assign \en$374  = \en$367 ;
-  assign \d$375  = wr_data[4];
-  assign \en$376  = \en$367 ;
-  assign \d$377  = wr_data[0];
-  assign \$signal$379  = \en$378 ;
-  assign \d$380  = wr_data[1];
-  assign \en$381  = \en$378 ;
-  assign \d$382  = wr_data[2];
-  assign \en$383  = \en$378 ;
-  assign \d$384  = wr_data[3];
-  assign \en$385  = \en$378 ;
-  assign \d$386  = wr_data[4];
-  assign \en$387  = \en$378 ;
-  assign \d$388  = wr_data[0];
-  assign \$signal$390  = \en$389 ;
-  assign \d$391  = wr_data[1];
-  assign \en$392  = \en$389 ;
-  assign \d$393  = wr_data[2];
-  assign \en$394  = \en$389 ;
-  assign \d$395  = wr_data[3];
-  assign \en$396  = \en$389 ;
-  assign \d$397  = wr_data[4];
-  assign \en$398  = \en$389 ;
-  assign \d$399  = wr_data[0];
-  assign \$signal$401  = \en$400 ;
-  assign \d$402  = wr_data[1];
-  assign \en$403  = \en$400 ;
-  assign \d$404  = wr_data[2];
-  assign \en$405  = \en$400 ;
-  assign \d$406  = wr_data[3];
-  assign \en$407  = \en$400 ;
-  assign \d$408  = wr_data[4];
-  assign \en$409  = \en$400 ;
-  assign \d$410  = wr_data[0];
-  assign \$signal$412  = \en$411 ;
-  assign \d$413  = wr_data[1];
-  assign \en$414  = \en$411 ;
-  assign \d$415  = wr_data[2];
-  assign \en$416  = \en$411 ;
-  assign \d$417  = wr_data[3];
-  assign \en$418  = \en$411 ;
-  assign \d$419  = wr_data[4];
-  assign \en$420  = \en$411 ;
-  assign \d$421  = wr_data[0];
-  assign \$signal$423  = \en$422 ;
-  assign \d$424  = wr_data[1];
-  assign \en$425  = \en$422 ;
-  assign \d$426  = wr_data[2];
-  assign \en$427  = \en$422 ;
-  assign \d$428  = wr_data[3];
-  assign \en$429  = \en$422 ;
-  assign \d$430  = wr_data[4];
-  assign \en$431  = \en$422 ;
-  assign \d$432  = wr_data[0];
-  assign \$signal$434  = \en$433 ;
-  assign \d$435  = wr_data[1];
-  assign \en$436  = \en$433 ;
-  assign \d$437  = wr_data[2];
-  assign \en$438  = \en$433 ;
-  assign \d$439  = wr_data[3];
-  assign \en$440  = \en$433 ;
-  assign \d$441  = wr_data[4];
-  assign \en$442  = \en$433 ;
-  assign in_rtol = wr_data;
-  assign \$signal$150 [4] = \q$155 ;
-  assign \$signal$150 [3] = \q$154 ;
-  assign \$signal$150 [2] = \q$153 ;
-  assign \$signal$150 [1] = \q$152 ;
-  assign \$signal$150 [0] = \q$151 ;
-  assign \$signal$144 [4] = \q$149 ;
-  assign \$signal$144 [3] = \q$148 ;
-  assign \$signal$144 [2] = \q$147 ;
-  assign \$signal$144 [1] = \q$146 ;
-  assign \$signal$144 [0] = \q$145 ;
-  assign \$signal$138 [4] = \q$143 ;
-  assign \$signal$138 [3] = \q$142 ;
-  assign \$signal$138 [2] = \q$141 ;
-  assign \$signal$138 [1] = \q$140 ;
-  assign \$signal$138 [0] = \q$139 ;
-  assign \$signal$132 [4] = \q$137 ;
-  assign \$signal$132 [3] = \q$136 ;
-  assign \$signal$132 [2] = \q$135 ;
-  assign \$signal$132 [1] = \q$134 ;
-  assign \$signal$132 [0] = \q$133 ;
-  assign \$signal$126 [4] = \q$131 ;
-  assign \$signal$126 [3] = \q$130 ;
-  assign \$signal$126 [2] = \q$129 ;
-  assign \$signal$126 [1] = \q$128 ;
-  assign \$signal$126 [0] = \q$127 ;
-  assign \$signal$120 [4] = \q$125 ;
-  assign \$signal$120 [3] = \q$124 ;
-  assign \$signal$120 [2] = \q$123 ;
-  assign \$signal$120 [1] = \q$122 ;
-  assign \$signal$120 [0] = \q$121 ;
-  assign \$signal$114 [4] = \q$119 ;
-  assign \$signal$114 [3] = \q$118 ;
-  assign \$signal$114 [2] = \q$117 ;
-  assign \$signal$114 [1] = \q$116 ;
-  assign \$signal$114 [0] = \q$115 ;
-  assign \$signal$108 [4] = \q$113 ;
-  assign \$signal$108 [3] = \q$112 ;
-  assign \$signal$108 [2] = \q$111 ;
-  assign \$signal$108 [1] = \q$110 ;
-  assign \$signal$108 [0] = \q$109 ;
-  assign \$signal$102 [4] = \q$107 ;
-  assign \$signal$102 [3] = \q$106 ;
-  assign \$signal$102 [2] = \q$105 ;
-  assign \$signal$102 [1] = \q$104 ;
-  assign \$signal$102 [0] = \q$103 ;
-  assign \$signal$96 [4] = \q$101 ;
-  assign \$signal$96 [3] = \q$100 ;
-  assign \$signal$96 [2] = \q$99 ;
-  assign \$signal$96 [1] = \q$98 ;
-  assign \$signal$96 [0] = \q$97 ;
-  assign \$signal$90 [4] = \q$95 ;
-  assign \$signal$90 [3] = \q$94 ;
-  assign \$signal$90 [2] = \q$93 ;
-  assign \$signal$90 [1] = \q$92 ;
-  assign \$signal$90 [0] = \q$91 ;
-  assign \$signal$84 [4] = \q$89 ;
-  assign \$signal$84 [3] = \q$88 ;
-  assign \$signal$84 [2] = \q$87 ;
-  assign \$signal$84 [1] = \q$86 ;
-  assign \$signal$84 [0] = \q$85 ;
-  assign \$signal$78 [4] = \q$83 ;
-  assign \$signal$78 [3] = \q$82 ;
-  assign \$signal$78 [2] = \q$81 ;
-  assign \$signal$78 [1] = \q$80 ;
-  assign \$signal$78 [0] = \q$79 ;
-  assign \$signal$72 [4] = \q$77 ;
-  assign \$signal$72 [3] = \q$76 ;
-  assign \$signal$72 [2] = \q$75 ;
-  assign \$signal$72 [1] = \q$74 ;
-  assign \$signal$72 [0] = \q$73 ;
-  assign \$signal$66 [4] = \q$71 ;
-  assign \$signal$66 [3] = \q$70 ;
-  assign \$signal$66 [2] = \q$69 ;
-  assign \$signal$66 [1] = \q$68 ;
-  assign \$signal$66 [0] = \q$67 ;
-  assign \$signal$60 [4] = \q$65 ;
-  assign \$signal$60 [3] = \q$64 ;
-  assign \$signal$60 [2] = \q$63 ;
-  assign \$signal$60 [1] = \q$62 ;
-  assign \$signal$60 [0] = \q$61 ;
-  assign \$signal$54 [4] = \q$59 ;
-  assign \$signal$54 [3] = \q$58 ;
-  assign \$signal$54 [2] = \q$57 ;
-  assign \$signal$54 [1] = \q$56 ;
-  assign \$signal$54 [0] = \q$55 ;
-  assign \$signal$48 [4] = \q$53 ;
-  assign \$signal$48 [3] = \q$52 ;
-  assign \$signal$48 [2] = \q$51 ;
-  assign \$signal$48 [1] = \q$50 ;
-  assign \$signal$48 [0] = \q$49 ;
-  assign \$signal$42 [4] = \q$47 ;
-  assign \$signal$42 [3] = \q$46 ;
-  assign \$signal$42 [2] = \q$45 ;
-  assign \$signal$42 [1] = \q$44 ;
-  assign \$signal$42 [0] = \q$43 ;
-  assign \$signal$36 [4] = \q$41 ;
-  assign \$signal$36 [3] = \q$40 ;
-  assign \$signal$36 [2] = \q$39 ;
-  assign \$signal$36 [1] = \q$38 ;
-  assign \$signal$36 [0] = \q$37 ;
-  assign \$signal$30 [4] = \q$35 ;
-  assign \$signal$30 [3] = \q$34 ;
-  assign \$signal$30 [2] = \q$33 ;
-  assign \$signal$30 [1] = \q$32 ;
-  assign \$signal$30 [0] = \q$31 ;
-  assign \$signal$24 [4] = \q$29 ;
-  assign \$signal$24 [3] = \q$28 ;
-  assign \$signal$24 [2] = \q$27 ;
-  assign \$signal$24 [1] = \q$26 ;
-  assign \$signal$24 [0] = \q$25 ;
-  assign \$signal$18 [4] = \q$23 ;
-  assign \$signal$18 [3] = \q$22 ;
-  assign \$signal$18 [2] = \q$21 ;
-  assign \$signal$18 [1] = \q$20 ;
-  assign \$signal$18 [0] = \q$19 ;
-  assign \$signal$12 [4] = \q$17 ;
-  assign \$signal$12 [3] = \q$16 ;
-  assign \$signal$12 [2] = \q$15 ;
-  assign \$signal$12 [1] = \q$14 ;
-  assign \$signal$12 [0] = \q$13 ;
-  assign \$signal$6 [4] = \q$11 ;
-  assign \$signal$6 [3] = \q$10 ;
-  assign \$signal$6 [2] = \q$9 ;
-  assign \$signal$6 [1] = \q$8 ;
-  assign \$signal$6 [0] = \q$7 ;
-  assign \$signal [4] = \q$5 ;
-  assign \$signal [3] = \q$4 ;
-  assign \$signal [2] = \q$3 ;
-  assign \$signal [1] = \q$2 ;
-  assign \$signal [0] = q;
+  assign wr_data = d;
+  assign in_rtol = d;
+  assign \q[0]  = q[4:0];
+  assign \q[1]  = q[9:5];
+  assign \q[2]  = q[14:10];
+  assign \q[3]  = q[19:15];
+  assign \q[4]  = q[24:20];
+  assign \q[5]  = q[29:25];
+  assign \q[6]  = q[34:30];
+  assign \q[7]  = q[39:35];
+  assign \q[8]  = q[44:40];
+  assign \q[9]  = q[49:45];
+  assign \q[10]  = q[54:50];
+  assign \q[11]  = q[59:55];
+  assign \q[12]  = q[64:60];
+  assign \q[13]  = q[69:65];
+  assign \q[14]  = q[74:70];
+  assign \q[15]  = q[79:75];
+  assign \q[16]  = q[84:80];
+  assign \q[17]  = q[89:85];
+  assign \q[18]  = q[94:90];
+  assign \q[19]  = q[99:95];
+  assign \q[20]  = q[104:100];
+  assign \q[21]  = q[109:105];
+  assign \q[22]  = q[114:110];
+  assign \q[23]  = q[119:115];
+  assign \q[24]  = q[124:120];
+  assign \q[25]  = q[129:125];
   assign \$1  = { 1'h0, plug_limiter[4:1] };
 endmodule
 
-(* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:71" *)
+(* src = "/root/package/src/rotor.py:71" *)
 (* generator = "Amaranth" *)
 module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, ltor, load_start, load_ring, load_rotor_type, clk);
-  reg \$auto$verilog_backend.cc:2352:dump_module$5  = 0;
+  reg \$auto$verilog_backend.cc:2355:dump_module$5  = 0;
   wire \$1 ;
   reg [4:0] \$10 ;
   reg [4:0] \$11 ;
@@ -3471,150 +1339,150 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
   reg [4:0] \$8 ;
   reg [4:0] \$9 ;
   (* init = 5'h00 *)
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:36" *)
+  (* src = "/root/package/src/rotor.py:36" *)
   wire [4:0] \$signal ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:37" *)
+  (* src = "/root/package/src/rotor.py:37" *)
   reg [4:0] \$signal$13  = 5'h00;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:84" *)
+  (* src = "/root/package/src/rotor.py:84" *)
   reg [2:0] \$signal$17  = 3'h0;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:37" *)
+  (* src = "/root/package/src/rotor.py:37" *)
   reg [4:0] \$signal$20  = 5'h00;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:84" *)
+  (* src = "/root/package/src/rotor.py:84" *)
   reg [2:0] \$signal$21  = 3'h1;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:37" *)
+  (* src = "/root/package/src/rotor.py:37" *)
   reg [4:0] \$signal$22  = 5'h00;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:84" *)
+  (* src = "/root/package/src/rotor.py:84" *)
   reg [2:0] \$signal$23  = 3'h2;
   (* init = 5'h00 *)
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:36" *)
+  (* src = "/root/package/src/rotor.py:36" *)
   wire [4:0] \$signal$3 ;
   (* init = 5'h00 *)
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:36" *)
+  (* src = "/root/package/src/rotor.py:36" *)
   wire [4:0] \$signal$5 ;
-  (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_ir.py:215" *)
+  (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_ir.py:283" *)
   input clk;
   wire clk;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:75" *)
+  (* src = "/root/package/src/rotor.py:75" *)
   reg [4:0] cnt;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:81" *)
+  (* src = "/root/package/src/rotor.py:81" *)
   reg cnt_eq_25;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:76" *)
+  (* src = "/root/package/src/rotor.py:76" *)
   reg [4:0] cnt_ring_combined;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:87" *)
+  (* src = "/root/package/src/rotor.py:87" *)
   reg [4:0] cnts_debug0 = 5'h00;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:88" *)
+  (* src = "/root/package/src/rotor.py:88" *)
   reg [4:0] cnts_debug1 = 5'h00;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:89" *)
+  (* src = "/root/package/src/rotor.py:89" *)
   reg [4:0] cnts_debug2 = 5'h00;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:10" *)
+  (* src = "/root/package/src/rotor.py:10" *)
   input [4:0] din;
   wire [4:0] din;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:30" *)
+  (* src = "/root/package/src/rotor.py:30" *)
   input [1:0] din_sel;
   wire [1:0] din_sel;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:11" *)
+  (* src = "/root/package/src/rotor.py:11" *)
   output [4:0] dout;
   reg [4:0] dout = 5'h00;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:16" *)
+  (* src = "/root/package/src/rotor.py:16" *)
   input [2:0] en;
   wire [2:0] en;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:24" *)
+  (* src = "/root/package/src/rotor.py:24" *)
   input inc;
   wire inc;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:15" *)
+  (* src = "/root/package/src/rotor.py:15" *)
   output [2:0] is_at_turnover;
   wire [2:0] is_at_turnover;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:20" *)
+  (* src = "/root/package/src/rotor.py:20" *)
   input load_ring;
   wire load_ring;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:21" *)
+  (* src = "/root/package/src/rotor.py:21" *)
   input load_rotor_type;
   wire load_rotor_type;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:19" *)
+  (* src = "/root/package/src/rotor.py:19" *)
   input load_start;
   wire load_start;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:27" *)
+  (* src = "/root/package/src/rotor.py:27" *)
   input ltor;
   wire ltor;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:77" *)
+  (* src = "/root/package/src/rotor.py:77" *)
   reg [4:0] muxed_din;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:13" *)
+  (* src = "/root/package/src/rotor.py:13" *)
   input [4:0] reflector_in;
   wire [4:0] reflector_in;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:78" *)
+  (* src = "/root/package/src/rotor.py:78" *)
   reg [4:0] right_ptr;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:74" *)
+  (* src = "/root/package/src/rotor.py:74" *)
   reg [4:0] ring_setting;
-  (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_ir.py:215" *)
+  (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_ir.py:283" *)
   input rst;
   wire rst;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:140" *)
+  (* src = "/root/package/src/rotor.py:140" *)
   wire [5:0] s;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:161" *)
+  (* src = "/root/package/src/rotor.py:161" *)
   reg [4:0] swizz_l_minus_cnt_ring;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:157" *)
+  (* src = "/root/package/src/rotor.py:157" *)
   reg [4:0] swizz_minus_cnt_ring;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:80" *)
+  (* src = "/root/package/src/rotor.py:80" *)
   reg [4:0] wiring_ltor;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:79" *)
+  (* src = "/root/package/src/rotor.py:79" *)
   reg [4:0] wiring_rtol;
-  assign \$27  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:110" *) 5'h19;
-  assign \$41  = \$40  == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_ast.py:2368" *) cnts_debug0;
-  assign \$43  = \$42  == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_ast.py:2368" *) cnts_debug1;
-  assign \$45  = \$44  == (* src = "/home/virantha/tinytapeout/ttsetup/env/lib/python3.11/site-packages/amaranth/hdl/_ast.py:2368" *) cnts_debug2;
-  assign \$46  = ring_setting > (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:148" *) cnt;
-  assign \$47  = ring_setting - (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:149" *) cnt;
-  assign \$48  = $signed(6'h1a) - (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:149" *) $signed(\$47 );
-  assign \$49  = cnt - (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:151" *) ring_setting;
-  assign s = muxed_din + (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:141" *) cnt_ring_combined;
-  assign \$50  = s > (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:142" *) 5'h19;
-  assign \$51  = s - (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:143" *) 5'h1a;
-  assign \$52  = cnt_ring_combined > (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:148" *) wiring_rtol;
-  assign \$53  = cnt_ring_combined - (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:149" *) wiring_rtol;
-  assign \$54  = $signed(6'h1a) - (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:149" *) $signed(\$53 );
-  assign \$55  = wiring_rtol - (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:151" *) cnt_ring_combined;
-  assign \$56  = cnt_ring_combined > (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:148" *) wiring_ltor;
-  assign \$57  = cnt_ring_combined - (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:149" *) wiring_ltor;
-  assign \$58  = $signed(6'h1a) - (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:149" *) $signed(\$57 );
-  assign \$59  = wiring_ltor - (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:151" *) cnt_ring_combined;
-  assign \$60  = cnt + (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:125" *) 1'h1;
-  assign \$61  = cnt + (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:125" *) 1'h1;
-  assign \$62  = cnt + (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:125" *) 1'h1;
-  assign \$63  = ltor ? (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:165" *) swizz_l_minus_cnt_ring : swizz_minus_cnt_ring;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:36" *)
+  assign \$27  = cnt == (* src = "/root/package/src/rotor.py:110" *) 5'h19;
+  assign \$41  = \$40  == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_ast.py:2425" *) cnts_debug0;
+  assign \$43  = \$42  == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_ast.py:2425" *) cnts_debug1;
+  assign \$45  = \$44  == (* src = "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/amaranth/hdl/_ast.py:2425" *) cnts_debug2;
+  assign \$46  = ring_setting > (* src = "/root/package/src/rotor.py:148" *) cnt;
+  assign \$47  = ring_setting - (* src = "/root/package/src/rotor.py:149" *) cnt;
+  assign \$48  = $signed(6'h1a) - (* src = "/root/package/src/rotor.py:149" *) $signed(\$47 );
+  assign \$49  = cnt - (* src = "/root/package/src/rotor.py:151" *) ring_setting;
+  assign s = muxed_din + (* src = "/root/package/src/rotor.py:141" *) cnt_ring_combined;
+  assign \$50  = s > (* src = "/root/package/src/rotor.py:142" *) 5'h19;
+  assign \$51  = s - (* src = "/root/package/src/rotor.py:143" *) 5'h1a;
+  assign \$52  = cnt_ring_combined > (* src = "/root/package/src/rotor.py:148" *) wiring_rtol;
+  assign \$53  = cnt_ring_combined - (* src = "/root/package/src/rotor.py:149" *) wiring_rtol;
+  assign \$54  = $signed(6'h1a) - (* src = "/root/package/src/rotor.py:149" *) $signed(\$53 );
+  assign \$55  = wiring_rtol - (* src = "/root/package/src/rotor.py:151" *) cnt_ring_combined;
+  assign \$56  = cnt_ring_combined > (* src = "/root/package/src/rotor.py:148" *) wiring_ltor;
+  assign \$57  = cnt_ring_combined - (* src = "/root/package/src/rotor.py:149" *) wiring_ltor;
+  assign \$58  = $signed(6'h1a) - (* src = "/root/package/src/rotor.py:149" *) $signed(\$57 );
+  assign \$59  = wiring_ltor - (* src = "/root/package/src/rotor.py:151" *) cnt_ring_combined;
+  assign \$60  = cnt + (* src = "/root/package/src/rotor.py:125" *) 1'h1;
+  assign \$61  = cnt + (* src = "/root/package/src/rotor.py:125" *) 1'h1;
+  assign \$62  = cnt + (* src = "/root/package/src/rotor.py:125" *) 1'h1;
+  assign \$63  = ltor ? (* src = "/root/package/src/rotor.py:165" *) swizz_l_minus_cnt_ring : swizz_minus_cnt_ring;
+  (* src = "/root/package/src/rotor.py:36" *)
   always @(posedge clk)
     cnts_debug0 <= \$64 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:37" *)
+  (* src = "/root/package/src/rotor.py:37" *)
   always @(posedge clk)
     \$signal$13  <= \$65 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:84" *)
+  (* src = "/root/package/src/rotor.py:84" *)
   always @(posedge clk)
     \$signal$17  <= \$66 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:36" *)
+  (* src = "/root/package/src/rotor.py:36" *)
   always @(posedge clk)
     cnts_debug1 <= \$67 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:37" *)
+  (* src = "/root/package/src/rotor.py:37" *)
   always @(posedge clk)
     \$signal$20  <= \$68 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:84" *)
+  (* src = "/root/package/src/rotor.py:84" *)
   always @(posedge clk)
     \$signal$21  <= \$69 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:36" *)
+  (* src = "/root/package/src/rotor.py:36" *)
   always @(posedge clk)
     cnts_debug2 <= \$70 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:37" *)
+  (* src = "/root/package/src/rotor.py:37" *)
   always @(posedge clk)
     \$signal$22  <= \$71 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:84" *)
+  (* src = "/root/package/src/rotor.py:84" *)
   always @(posedge clk)
     \$signal$23  <= \$72 ;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:11" *)
+  (* src = "/root/package/src/rotor.py:11" *)
   always @(posedge clk)
     dout <= \$73 ;
-  assign \$1  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:110" *) 5'h19;
-  assign \$14  = cnt == (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:110" *) 5'h19;
+  assign \$1  = cnt == (* src = "/root/package/src/rotor.py:110" *) 5'h19;
+  assign \$14  = cnt == (* src = "/root/package/src/rotor.py:110" *) 5'h19;
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$28  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -3672,7 +1540,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$29  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -3730,7 +1598,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$30  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -3788,7 +1656,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$31  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -3846,7 +1714,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$32  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -3904,7 +1772,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$33  = 5'h00;
     casez (\$signal$23 )
       3'h0:
@@ -3920,7 +1788,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$34  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -3978,7 +1846,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$35  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -4036,7 +1904,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$36  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -4094,7 +1962,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$37  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -4152,7 +2020,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$38  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -4210,7 +2078,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$39  = 5'h00;
     casez (\$signal$23 )
       3'h0:
@@ -4226,7 +2094,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$40  = 5'h00;
     casez (\$signal$17 )
       3'h0:
@@ -4242,7 +2110,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$42  = 5'h00;
     casez (\$signal$21 )
       3'h0:
@@ -4258,7 +2126,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$44  = 5'h00;
     casez (\$signal$23 )
       3'h0:
@@ -4274,7 +2142,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     (* full_case = 32'd1 *)
     casez (din_sel)
       2'h1:
@@ -4286,7 +2154,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     (* full_case = 32'd1 *)
     casez (en)
       3'h1:
@@ -4300,7 +2168,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     (* full_case = 32'd1 *)
     casez (en)
       3'h1:
@@ -4314,7 +2182,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     cnt_eq_25 = 1'h0;
     casez (en)
       3'h1:
@@ -4326,7 +2194,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     wiring_rtol = 5'h00;
     casez (en)
       3'h1:
@@ -4338,7 +2206,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     wiring_ltor = 5'h00;
     casez (en)
       3'h1:
@@ -4350,7 +2218,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     (* full_case = 32'd1 *)
     if (\$46 ) begin
       cnt_ring_combined = \$48 [4:0];
@@ -4359,7 +2227,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     (* full_case = 32'd1 *)
     if (\$50 ) begin
       right_ptr = \$51 [4:0];
@@ -4368,7 +2236,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     (* full_case = 32'd1 *)
     if (\$52 ) begin
       swizz_minus_cnt_ring = \$54 [4:0];
@@ -4377,7 +2245,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     (* full_case = 32'd1 *)
     if (\$56 ) begin
       swizz_l_minus_cnt_ring = \$58 [4:0];
@@ -4386,7 +2254,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$64  = cnts_debug0;
     casez (en)
       3'h1:
@@ -4408,7 +2276,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$65  = \$signal$13 ;
     casez (en)
       3'h1:
@@ -4422,7 +2290,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$66  = \$signal$17 ;
     casez (en)
       3'h1:
@@ -4437,7 +2305,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$67  = cnts_debug1;
     casez (en)
       3'h1:
@@ -4461,7 +2329,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$68  = \$signal$20 ;
     casez (en)
       3'h1:
@@ -4477,7 +2345,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$69  = \$signal$21 ;
     casez (en)
       3'h1:
@@ -4494,7 +2362,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$70  = cnts_debug2;
     casez (en)
       3'h1:
@@ -4520,7 +2388,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$71  = \$signal$22 ;
     casez (en)
       3'h1:
@@ -4538,7 +2406,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$72  = \$signal$23 ;
     casez (en)
       3'h1:
@@ -4557,14 +2425,14 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$73  = \$63 ;
     if (rst) begin
       \$73  = 5'h00;
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$2  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -4622,7 +2490,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$3  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -4680,7 +2548,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$4  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -4738,7 +2606,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$5  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -4796,7 +2664,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$6  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -4854,7 +2722,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$7  = 5'h00;
     casez (\$signal$17 )
       3'h0:
@@ -4870,7 +2738,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$8  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -4928,7 +2796,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$9  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -4986,7 +2854,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$10  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5044,7 +2912,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$11  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5102,7 +2970,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$12  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5160,7 +3028,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$13  = 5'h00;
     casez (\$signal$17 )
       3'h0:
@@ -5176,7 +3044,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$15  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5234,7 +3102,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$16  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5292,7 +3160,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$17  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5350,7 +3218,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$18  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5408,7 +3276,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$19  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5466,7 +3334,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$20  = 5'h00;
     casez (\$signal$21 )
       3'h0:
@@ -5482,7 +3350,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$21  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5540,7 +3408,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$22  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5598,7 +3466,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$23  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5656,7 +3524,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$24  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5714,7 +3582,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$25  = 5'h00;
     casez (right_ptr)
       5'h00:
@@ -5772,7 +3640,7 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
     endcase
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$5 ) begin end
     \$26  = 5'h00;
     casez (\$signal$21 )
       3'h0:
@@ -5795,18 +3663,18 @@ module \top.r (rst, reflector_in, din, is_at_turnover, dout, en, inc, din_sel, l
   assign is_at_turnover[0] = \$41 ;
 endmodule
 
-(* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:178" *)
+(* src = "/root/package/src/rotor.py:178" *)
 (* generator = "Amaranth" *)
 module \top.ref (din, dout);
-  reg \$auto$verilog_backend.cc:2352:dump_module$6  = 0;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:174" *)
+  reg \$auto$verilog_backend.cc:2355:dump_module$6  = 0;
+  (* src = "/root/package/src/rotor.py:174" *)
   input [4:0] din;
   wire [4:0] din;
-  (* src = "/home/virantha/tinytapeout/tt10-enigma/src/rotor.py:175" *)
+  (* src = "/root/package/src/rotor.py:175" *)
   output [4:0] dout;
   reg [4:0] dout;
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$6 ) begin end
+    if (\$auto$verilog_backend.cc:2355:dump_module$6 ) begin end
     dout = 5'h00;
     casez (din)
       5'h00:
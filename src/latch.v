@@ -1,13 +1,22 @@
 
-module d_latch (
-    input wire d,
-    input wire clk,
-    output reg q
+// DEPTH words of WIDTH latches: word i of q follows d while en[i] is high
+module latch_array #(
+    parameter WIDTH = 5,
+    parameter DEPTH = 26
+) (
+    input wire [WIDTH-1:0] d,
+    input wire [DEPTH-1:0] en,
+    output reg [DEPTH*WIDTH-1:0] q
 );
 
-    always_latch begin
-        if (clk) begin
-            q = d;
+    genvar i;
+    generate
+        for (i = 0; i < DEPTH; i = i + 1) begin : word
+            always_latch begin
+                if (en[i]) begin
+                    q[i*WIDTH +: WIDTH] = d;
+                end
+            end
         end
-    end
-endmodule
\ No newline at end of file
+    endgenerate
+endmodule
@@ -1,30 +1,49 @@
-from amaranth import Signal, Module, unsigned, Mux, Instance, Array, ClockSignal
-from amaranth.lib import wiring
+from amaranth import Signal, Module, unsigned, Mux, Instance, Array
+from amaranth.lib import data, wiring
 from amaranth.lib.wiring import In, Out
 from amaranth.lib.memory import Memory
 
 from src.defines import PLUG_LIMIT
 
-class Latch(wiring.Component):
+class LatchArray(wiring.Component):
+    """depth words of width bits of latches, written a word at a time:  while
+       en[i] is high, word i of q follows d.
 
-    d: In(1)
-    q: Out(1)      
-    en: In(1)
+       For synthesis this is one latch_array instance (src/latch.v), so the
+       latches stay latches.  The Amaranth simulator cannot run a Verilog
+       instance, so with sim=True the words are reset-less flops instead,
+       which load d at the clock edge.  That is the same, cycle for cycle,
+       as long as en and d are held for the whole cycle of a write and q is
+       only read in the cycles after it, which is how Plugboard uses it.
+    """
+
+    def __init__(self, depth:int, width:int, sim:bool=False):
+        self.depth = depth
+        self.width = width
+        self.sim = sim
+        super().__init__({
+            'd': In(width),
+            'en': In(depth),
+            'q': Out(data.ArrayLayout(width, depth)),
+        })
 
     def elaborate(self, platform):
-        
-        return Instance("d_latch",
-                        i_d = self.d,
-                        i_clk = self.en,
-                        o_q = self.q,
-        
-        )
-        # if True:
-        #     return Instance("sky130_fd_sc_hd__dlxtp",
-        #                 i_D = self.d,
-        #                 i_GATE = ClockSignal(),
-        #                 o_Q = self.q,
-        #     )
+        if not self.sim:
+            return Instance("latch_array",
+                            p_WIDTH = self.width,
+                            p_DEPTH = self.depth,
+                            i_d = self.d,
+                            i_en = self.en,
+                            o_q = self.q.as_value(),
+            )
+
+        m = Module()
+        for i in range(self.depth):
+            word = Signal(self.width, name=f'word_{i}', reset_less=True)
+            with m.If(self.en[i]):
+                m.d.sync += word.eq(self.d)
+            m.d.comb += self.q[i].eq(word)
+        return m
 
 class Plugboard(wiring.Component):
     """In the ENIGMA, the plugboard allowed up to 10 keys to be swapped with a different key.
@@ -56,29 +75,21 @@ class Plugboard(wiring.Component):
     wr_data_en: In(1)
     wr_addr_en: In(1)
 
-    def __init__(self):
+    def __init__(self, sim:bool=False):
         self.plug_limiter = Signal(5)  # Counter to keep track of plugs
+        self.sim = sim                 # Flops in place of the latches, for the simulator
         super().__init__()
 
     def elaborate(self, platform):
         m = Module()
     
-        # Array of 5 columns of 32-rows 
-        self.mem = mem = Array([Signal(5) for i in range(26)])
-
-        bits = [[0]*5 for i in range(26)]
-        for i in range(26):
-            for j in range(5):
-                m.submodules[f'bits_{i}_{j}'] = bits[i][j] = Latch()
-                # Connect the memory signals
-                m.d.comb += mem[i][j].eq(bits[i][j].q)
+        # 26 words of 5 bits
+        m.submodules.latches = latches = LatchArray(26, 5, sim=self.sim)
+        self.mem = mem = Array([latches.q[i] for i in range(26)])
 
         # Make the write like a wordline/bitline
-        wl = [Signal(1) for i in range(26)]
-        for i in range(26):
-            for j in range(5):
-                m.d.comb += bits[i][j].d.eq(self.wr_data[j])
-                m.d.comb += bits[i][j].en.eq(wl[i])
+        wl = latches.en
+        m.d.comb += latches.d.eq(self.wr_data)
 
         addr = Signal(5)
         read = Signal(5)
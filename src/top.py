@@ -17,12 +17,14 @@ class Enigma(wiring.Component):
     #debug_out: Out(5)
     #debug_pen: Out(1)
 
-    def __init__(self):
-
+    def __init__(self, sim:bool=False):
+        """sim=True builds the plugboard latches out of flops, so the whole
+           design runs in the Amaranth simulator (see LatchArray)
+        """
         self.rotor = Rotor()
         self.reflector = Reflector_B()
         self.fsm = Control() 
-        self.plugboard = Plugboard()
+        self.plugboard = Plugboard(sim=sim)
         self.lcd = SevenSegmentAlpha()
         super().__init__()
 
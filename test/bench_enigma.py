@@ -0,0 +1,157 @@
+"""Benchmarks for the golden model.
+
+Usage:
+    bench_enigma.py [options]
+
+Options:
+    -h, --help              Show this screen
+    -d, --debug             Debug messages
+    --sizes=<nums>          Message lengths for process_message [default: 1000,100000,10000000]
+    --engines=<names>       Golden engines to run (see tb_utils.GOLDEN_ENGINES) [default: scalar,fast,numpy]
+    --max-scalar=<n>        Longest message for the (slowest) scalar engine [default: 1000000]
+    --repeat=<n>            Take the best of this many runs [default: 3]
+    --output=<file>         Save the results as JSON
+    --baseline=<file>       Compare with results saved by an earlier --output
+    --threshold=<percent>   Fail if a rate drops more than this below the baseline [default: 20]
+
+Times key construction (with 0, 5 and 10 plugs), per-letter cipher(),
+process_message() of each engine on each message length, and
+EnigmaNP.batch_encrypt.  Every benchmark reports its rate (letters/s, or
+constructions/s) and its peak traced memory, measured in a separate run
+under tracemalloc so it does not slow down the timed runs.
+
+With --baseline, exits with status 1 if any benchmark's rate fell by more
+than --threshold percent.
+"""
+import json, logging, platform, sys, time, tracemalloc
+from random import Random
+
+import numpy as np
+from docopt import docopt
+
+from enigma import Enigma
+from enigma_np import EnigmaNP
+from tb_utils import GOLDEN_ENGINES, random_text
+
+logger = logging.getLogger(__name__)
+
+ROTORS = [('I', 'P', 18), ('II', 'F', 5), ('III', 'B', 24)]
+PLUGBOARDS = {
+    0: [],
+    5: ['AN', 'DE', 'ZB', 'GX', 'HQ'],
+    10: ['AN', 'DE', 'ZB', 'GX', 'HQ', 'CV', 'FK', 'IJ', 'LM', 'OP'],
+}
+CONSTRUCTIONS = 200     # Machines built by each construction benchmark
+CIPHER_LETTERS = 10000  # Letters fed one at a time to cipher()
+BATCH_KEYS = 100        # Keys (of BATCH_LETTERS letters each) for batch_encrypt
+BATCH_LETTERS = 1000
+
+
+def measure(func, units:int, repeat:int):
+    """Run func repeat times and once more under tracemalloc.  Returns the
+       best time, the rate in units/s and the peak traced memory.
+    """
+    seconds = float('inf')
+    for i in range(repeat):
+        t_start = time.perf_counter()
+        func()
+        seconds = min(seconds, time.perf_counter() - t_start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'units': units, 'seconds': seconds, 'rate': units / seconds, 'peak_bytes': peak}
+
+
+def benchmarks(sizes, engines, max_scalar:int):
+    """Yield (name, function, units) for every benchmark"""
+    # The same text of each length for every engine
+    texts = {size: random_text(Random(0), size) for size in {CIPHER_LETTERS, *sizes}}
+    for engine in engines:
+        cls = GOLDEN_ENGINES[engine]
+        for plugs, plugboard in PLUGBOARDS.items():
+            yield (f'construct/{engine}/{plugs}_plugs',
+                   lambda cls=cls, plugboard=plugboard: [cls(ROTORS, 'B', plugboard) for i in range(CONSTRUCTIONS)],
+                   CONSTRUCTIONS)
+
+        if hasattr(cls, 'cipher'):
+            text = texts[CIPHER_LETTERS]
+            yield (f'cipher/{engine}',
+                   lambda cls=cls, text=text: [m.cipher(c) for m in [cls(ROTORS, 'B', PLUGBOARDS[5])] for c in text],
+                   CIPHER_LETTERS)
+
+        for size in sizes:
+            if engine == 'scalar' and size > max_scalar:
+                continue
+            text = texts[size]
+            yield (f'process_message/{engine}/{size}',
+                   lambda cls=cls, text=text: cls(ROTORS, 'B', PLUGBOARDS[5]).process_message(text),
+                   size)
+
+    if 'numpy' not in engines:
+        return
+    rng = np.random.default_rng(1)
+    keys = [([(t, chr(65 + int(s)), int(r)) for t, s, r in zip(rng.permutation(list(Enigma.ROTORS))[:3],
+                                                                 rng.integers(0, 26, 3), rng.integers(0, 26, 3))],
+             'B', PLUGBOARDS[10]) for i in range(BATCH_KEYS)]
+    messages = [random_text(Random(seed), BATCH_LETTERS) for seed in range(BATCH_KEYS)]
+    yield 'batch_encrypt/numpy', lambda: EnigmaNP.batch_encrypt(keys, messages), BATCH_KEYS*BATCH_LETTERS
+
+
+def run(sizes=(1000, 100000, 10000000), engines=('scalar', 'fast', 'numpy'), max_scalar=1000000, repeat=3):
+    """Run all the benchmarks and return the results, ready to save as JSON"""
+    results = {}
+    for name, func, units in benchmarks(sizes, engines, max_scalar):
+        results[name] = measure(func, units, repeat)
+        logger.info(f'{name:40} {results[name]["rate"]:14,.0f}/s {results[name]["peak_bytes"]/2**20:10.1f}MB')
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def compare(results, baseline, threshold:float):
+    """Return the names of the benchmarks whose rate fell by more than
+       threshold percent below the baseline.  Benchmarks missing from
+       either side are skipped.
+    """
+    regressions = []
+    for name, result in results['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        change = 100 * (result['rate'] / base['rate'] - 1)
+        logger.info(f'{name:40} {change:+7.1f}% vs baseline')
+        if change < -threshold:
+            regressions.append(name)
+    return regressions
+
+
+if __name__ == '__main__':
+    args = docopt(__doc__)
+    logging.basicConfig(level=logging.DEBUG if args['--debug'] else logging.INFO)
+    # The golden model logs every plugboard and message at INFO; its log
+    # calls are still timed, but nothing gets written out
+    logging.getLogger('enigma').setLevel(logging.WARNING)
+
+    results = run(sizes=[int(n) for n in args['--sizes'].split(',')],
+                  engines=args['--engines'].split(','),
+                  max_scalar=int(args['--max-scalar']),
+                  repeat=int(args['--repeat']))
+    if args['--output']:
+        with open(args['--output'], 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args['--baseline']:
+        with open(args['--baseline']) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, float(args['--threshold']))
+        if regressions:
+            logger.error(f'{len(regressions)} benchmarks slower than the baseline by more than '
+                         f'{args["--threshold"]}%: {", ".join(regressions)}')
+            sys.exit(1)
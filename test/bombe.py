@@ -0,0 +1,152 @@
+"""Turing-Welchman bombe simulator.
+
+Usage:
+    bombe.py [options] <CRIB> <CIPHERTEXT>
+
+Options:
+    -h, --help              Show this screen
+    -d, --debug             Debug messages
+    --offset=<n>            Letter position of the crib in the cipher text [default: 0]
+    --rotors=<types>        Rotor types to choose the order from [default: I,II,III,IV,V]
+    --rings=<nums>          Ring settings, rotor 0 first [default: 0,0,0]
+    --reflector=<type>      Reflector [default: B]
+    -j, --workers=<n>       Worker processes (default: all cores)
+
+The crib is the guessed plain text of the cipher text starting at --offset.
+Each pair of crib/cipher letters is an edge of the menu: at that key press
+the scrambler swaps the plugboard partners of the two letters.  Starting from
+a guess for the partner of the most connected menu letter, the bombe lights
+every (letter, partner) pair that the menu implies, plus the mirrored pair
+(the diagonal board).  If the guess does not light all 26 partners of the
+test letter, that rotor position is a stop.
+
+Every rotor order runs in its own worker, testing all 26^3 start positions
+at once with the full-cycle permutation tables.
+"""
+import logging, time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import permutations
+
+import numpy as np
+from docopt import docopt
+
+from defines import Rotors
+from enigma import Enigma, letter_to_num, num_to_letter
+from enigma_np import permutation_table, rotor_positions
+
+logger = logging.getLogger(__name__)
+
+# All 26^3 start positions, as rows s0, s1, s2
+ALL_STARTS = np.indices((26, 26, 26)).reshape(3, -1)
+
+
+def build_menu(crib:str, ciphertext:str, offset:int=0):
+    """Return the menu edges (a, b, i): crib letter a and cipher letter b at
+       key press offset+i+1, as letter numbers
+    """
+    cipher = ciphertext[offset:offset+len(crib)]
+    assert len(cipher) == len(crib), f'Crib of {len(crib)} letters runs past the end of the cipher text'
+    edges = []
+    for i, (a, b) in enumerate(zip(crib, cipher)):
+        if a == b:
+            raise ValueError(f'Crib letter {i} ({a}) encrypts to itself, which Enigma cannot do')
+        edges.append((letter_to_num[a], letter_to_num[b], offset + i))
+    return edges
+
+
+def most_connected(edges):
+    """The menu letter with the most edges"""
+    return Counter([a for a, _, _ in edges] + [b for _, b, _ in edges]).most_common(1)[0][0]
+
+
+def run_order(order, rings, reflector, edges, test:int, guess:int=0):
+    """Run the bombe over all start positions of one rotor order.
+
+       Returns the stops as (start positions, number of lit partners of the
+       test letter, steckered partner if it can be read off or None), plus
+       the run time.
+    """
+    t_start = time.perf_counter()
+    table = permutation_table(tuple(order), reflector)
+    turnovers = [letter_to_num[Enigma.ROTORS[rotor].turnover] for rotor in order[:2]]
+
+    # Scrambler permutation at each menu edge for every start position
+    first = min(i for _, _, i in edges)
+    presses = [i - first for _, _, i in edges]
+    positions, _ = rotor_positions(ALL_STARTS[..., None], turnovers, max(presses) + 1, first)
+    offsets = (positions - np.array(rings)[:, None, None]) % 26
+    perms = table[offsets[0][:, presses], offsets[1][:, presses], offsets[2][:, presses]].astype(np.intp)
+
+    # Flat indices into a (start, letter) array that apply each edge's
+    # scrambler permutation to all start positions at once
+    num_starts = ALL_STARTS.shape[1]
+    gathers = (np.arange(num_starts)[:, None, None]*26 + perms).transpose(1, 0, 2).reshape(len(edges), -1)
+
+    # lit[x, s, y]: at start position s, x is steckered to y
+    lit = np.zeros((26, num_starts, 26), dtype=bool)
+    lit[test, :, guess] = True
+    count = 1
+    while True:
+        for (a, b, _), gather in zip(edges, gathers):
+            # The scrambler is an involution: if a is steckered to y, then b
+            # is steckered to perm[y], and the other way around
+            lit[b] |= lit[a].ravel()[gather].reshape(num_starts, 26)
+            lit[a] |= lit[b].ravel()[gather].reshape(num_starts, 26)
+        lit |= lit.transpose(2, 1, 0)   # Diagonal board
+        new_count = int(lit.sum())
+        if new_count == count:
+            break
+        count = new_count
+
+    lit_partners = lit[test].sum(axis=1)
+    stops = []
+    for s in np.flatnonzero(lit_partners < 26):
+        n = int(lit_partners[s])
+        partner = guess if n == 1 else int(np.flatnonzero(~lit[test, s])[0]) if n == 25 else None
+        stops.append((ALL_STARTS[:, s].tolist(), n, partner))
+    return stops, time.perf_counter() - t_start
+
+
+def run(crib:str, ciphertext:str, offset:int=0, rotor_types=list(Rotors), rings=(0, 0, 0),
+        reflector='B', workers=None):
+    """Run the bombe over every rotor order and return the stops as dicts"""
+    crib, ciphertext = crib.upper(), ciphertext.upper()
+    edges = build_menu(crib, ciphertext, offset)
+    test = most_connected(edges)
+    logger.info(f'Menu: {len(edges)} edges on {len({a for a, _, _ in edges} | {b for _, b, _ in edges})} letters, '
+                f'test letter {num_to_letter(test)}')
+
+    stops = []
+    t_start = time.perf_counter()
+    with ProcessPoolExecutor(workers) as pool:
+        futures = {pool.submit(run_order, order, rings, reflector, edges, test): order
+                   for order in permutations(rotor_types, 3)}
+        for future in as_completed(futures):
+            order = futures[future]
+            order_stops, elapsed = future.result()
+            logger.info(f'Rotor order {"-".join(order)}: {len(order_stops)} stops in {elapsed:.2f}s')
+            for starts, lit_partners, partner in order_stops:
+                stop = {
+                    'rotors': [(rotor, num_to_letter(start), ring) for rotor, start, ring in zip(order, starts, rings)],
+                    'test_letter': num_to_letter(test),
+                    'lit': lit_partners,
+                    'stecker': None if partner is None else num_to_letter(partner),
+                    'time': elapsed,
+                }
+                logger.info(f'  Stop: {stop}')
+                stops.append(stop)
+    logger.info(f'{len(stops)} stops in {time.perf_counter() - t_start:.2f}s')
+    return stops
+
+
+if __name__ == '__main__':
+    args = docopt(__doc__)
+    logging.basicConfig(level=logging.DEBUG if args['--debug'] else logging.INFO)
+
+    run(args['<CRIB>'], args['<CIPHERTEXT>'],
+        offset=int(args['--offset']),
+        rotor_types=args['--rotors'].split(','),
+        rings=tuple(map(int, args['--rings'].split(','))),
+        reflector=args['--reflector'],
+        workers=int(args['--workers']) if args['--workers'] else None)
@@ -0,0 +1,176 @@
+"""Rejewski's card catalogue of Enigma cycle structures.
+
+Usage:
+    catalogue.py [options] build <DIR>
+    catalogue.py [options] lookup <DIR> <INDICATOR>...
+
+Options:
+    -h, --help              Show this screen
+    -d, --debug             Debug messages
+    --rotors=<types>        Rotor types to choose the order from [default: I,II,III,IV,V]
+    --reflector=<type>      Reflector [default: B]
+    -j, --workers=<n>       Worker processes for build (default: all cores)
+
+With a doubled message key enciphered at key presses 1-6 (the indicator),
+letters 1 and 4 of the indicators of one day give the permutation AD (and
+letters 2/5 give BE, 3/6 give CF).  The cycle structure of AD, BE and CF
+does not depend on the plugboard, so it identifies the rotor order and
+start position up to a handful of candidates.
+
+The build command computes the characteristic of every rotor order and all
+26^3 start positions (with ring settings AAA) into DIR: the distinct
+characteristics, an open-addressing hash table over them, and the list of
+keys for each one.  Everything is loaded memory-mapped, so a lookup is a
+hash probe and a slice, without reading the whole catalogue.
+"""
+import json, logging, os, time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import permutations
+
+import numpy as np
+from docopt import docopt
+
+from defines import Rotors
+from enigma import Enigma, letter_to_num, num_to_letter
+from enigma_np import permutation_table, rotor_positions
+
+logger = logging.getLogger(__name__)
+
+# All 26^3 start positions, as rows s0, s1, s2
+ALL_STARTS = np.indices((26, 26, 26)).reshape(3, -1)
+
+# Multipliers for hashing the 3x26 cycle counts of a characteristic
+HASH_MULTIPLIERS = np.random.default_rng(0x52656a).integers(1, 2**63, 3*26, dtype=np.uint64) | np.uint64(1)
+
+
+def cycle_counts(perms:np.ndarray):
+    """Return the number of cycles of each length 1-26 in each row of an
+       (N, 26) array of permutations, as an (N, 26) array
+    """
+    rows = np.arange(len(perms))[:, None]
+    letters = np.arange(26)
+    cur = perms
+    lengths = np.zeros(perms.shape, dtype=np.int64)
+    for k in range(1, 27):
+        lengths[(cur == letters) & (lengths == 0)] = k
+        cur = perms[rows, cur]
+    counts = np.bincount((rows*27 + lengths).ravel(), minlength=len(perms)*27).reshape(-1, 27)[:, 1:]
+    # Each cycle of length L was counted once for each of its L letters
+    return (counts // np.arange(1, 27)).astype(np.uint8)
+
+
+def characteristic(perms:np.ndarray):
+    """Characteristic (cycle counts of AD, BE, CF) of each row of an (N, 6, 26)
+       array with the permutations of key presses 1-6, as an (N, 78) array
+    """
+    composed = [np.take_along_axis(perms[:, i+3], perms[:, i], axis=1) for i in range(3)]
+    return np.concatenate([cycle_counts(p) for p in composed], axis=1)
+
+
+def characteristic_from_indicators(indicators):
+    """Characteristic of a day's doubled indicators (6-letter strings), as a
+       78 entry array.  There must be enough indicators to pin down AD, BE and CF.
+    """
+    perms = -np.ones((3, 26), dtype=np.int64)
+    for indicator in indicators:
+        n = [letter_to_num[c] for c in indicator.upper()]
+        for i in range(3):
+            perms[i, n[i]] = n[i+3]
+    if (perms < 0).any():
+        raise ValueError(f'{len(indicators)} indicators do not cover every letter of AD, BE and CF')
+    return np.concatenate([cycle_counts(p[None])[0] for p in perms])
+
+
+def to_cycles(signature:np.ndarray):
+    """Readable form of a characteristic: the cycle lengths of AD, BE, CF"""
+    return tuple(tuple(L for L in range(26, 0, -1) for _ in range(signature[i*26 + L-1])) for i in range(3))
+
+
+def signature_hash(signatures:np.ndarray):
+    return (signatures.astype(np.uint64) * HASH_MULTIPLIERS).sum(axis=-1, dtype=np.uint64)
+
+
+def order_characteristics(order, reflector:str):
+    """Characteristics of all start positions of one rotor order"""
+    table = permutation_table(tuple(order), reflector)
+    turnovers = [letter_to_num[Enigma.ROTORS[rotor].turnover] for rotor in order[:2]]
+    positions, _ = rotor_positions(ALL_STARTS[..., None], turnovers, 6)
+    return characteristic(table[positions[0], positions[1], positions[2]].astype(np.int64))
+
+
+def build(directory, rotor_types=list(Rotors), reflector='B', workers=None):
+    t_start = time.perf_counter()
+    orders = list(permutations(rotor_types, 3))
+    with ProcessPoolExecutor(workers) as pool:
+        signatures = np.concatenate(list(pool.map(order_characteristics, orders, [reflector]*len(orders))))
+
+    # Group the keys (order index * 26^3 + start index) by characteristic.
+    # Sorting the 64-bit hashes is much faster than sorting the rows.
+    hashes, first, ids = np.unique(signature_hash(signatures), return_index=True, return_inverse=True)
+    unique = signatures[first]
+    if not (unique[ids] == signatures).all():
+        raise RuntimeError('Characteristic hash collision: two characteristics share a hash')
+    keys = np.argsort(ids, kind='stable').astype(np.uint32)
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(ids, minlength=len(unique))))).astype(np.uint32)
+
+    # Open-addressing hash table from characteristic to its row in unique
+    size = 1 << int(2*len(unique) - 1).bit_length()
+    slots = -np.ones(size, dtype=np.int64)
+    for row, h in enumerate(signature_hash(unique)):
+        slot = int(h) & (size - 1)
+        while slots[slot] >= 0:
+            slot = (slot + 1) & (size - 1)
+        slots[slot] = row
+
+    os.makedirs(directory, exist_ok=True)
+    for name, array in [('signatures', unique), ('slots', slots), ('offsets', offsets), ('keys', keys)]:
+        np.save(os.path.join(directory, f'{name}.npy'), array)
+    with open(os.path.join(directory, 'catalogue.json'), 'w') as f:
+        json.dump({'orders': orders, 'reflector': reflector}, f)
+    logger.info(f'Catalogued {len(signatures)} keys with {len(unique)} characteristics '
+                f'in {time.perf_counter() - t_start:.1f}s')
+
+
+class Catalogue:
+
+    def __init__(self, directory):
+        for name in ['signatures', 'slots', 'offsets', 'keys']:
+            setattr(self, name, np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r'))
+        with open(os.path.join(directory, 'catalogue.json')) as f:
+            meta = json.load(f)
+        self.orders = meta['orders']
+        self.reflector = meta['reflector']
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def lookup(self, signature:np.ndarray):
+        """Return the keys (rotors as taken by Enigma()) with this characteristic"""
+        signature = np.asarray(signature, dtype=np.uint8)
+        mask = len(self.slots) - 1
+        slot = int(signature_hash(signature)) & mask
+        while (row := int(self.slots[slot])) >= 0:
+            if (self.signatures[row] == signature).all():
+                break
+            slot = (slot + 1) & mask
+        else:
+            return []
+        keys = []
+        for key in self.keys[self.offsets[row]:self.offsets[row+1]]:
+            order, start = divmod(int(key), ALL_STARTS.shape[1])
+            keys.append([(rotor, num_to_letter(s), 0) for rotor, s in zip(self.orders[order], ALL_STARTS[:, start])])
+        return keys
+
+
+if __name__ == '__main__':
+    args = docopt(__doc__)
+    logging.basicConfig(level=logging.DEBUG if args['--debug'] else logging.INFO)
+
+    if args['build']:
+        build(args['<DIR>'], args['--rotors'].split(','), args['--reflector'],
+              int(args['--workers']) if args['--workers'] else None)
+    else:
+        signature = characteristic_from_indicators(args['<INDICATOR>'])
+        print(f'Characteristic {to_cycles(signature)}')
+        for key in Catalogue(args['<DIR>']).lookup(signature):
+            print(key)
@@ -0,0 +1,418 @@
+"""Compiled simulation of the design with Yosys CXXRTL.
+
+Usage:
+    cxxrtl_sim.py [options]
+
+Options:
+    -h, --help              Show this screen
+    --length=<n>            Letters to encrypt with the fixed key [default: 100000]
+    --testbench-length=<n>  Letters for the Amaranth testbench [default: 1000]
+    --build=<dir>           Build directory [default: sim_build/cxxrtl]
+
+The Enigma in src/top.py is converted to RTLIL by Amaranth, and the Yosys
+that ships with Amaranth writes it out as C++ with write_cxxrtl, which g++
+compiles into a shared library.  The latch_array of the plugboard (a
+Verilog module, and Amaranth's Yosys has no Verilog frontend) gets a
+behavioral model in RTLIL, with $dlatch cells, so the latches simulate
+as latches.
+The library is cached in the build directory under the hash of everything
+that goes into it, so it is only rebuilt when the design changes, and a
+new build removes the libraries of earlier versions.
+
+CxxrtlSim drives the library through ctypes with a context like the one of
+Amaranth testbenches: set() and get() by signal name ('ui_in', 'uio_out',
+'rst', ...) and tick(), which runs whole clock cycles in C++.
+run_testbench() runs an Amaranth testbench itself on it, such as the bench
+of tb_enigma.py: ctx.set(dut.ui_in, ...), ctx.get(dut.fsm.ready) and await
+ctx.tick() go to the CXXRTL objects with the names Amaranth gives those
+signals ('ui_in', 'fsm ready').
+
+The command encrypts --length letters with the fixed key on CXXRTL and
+on the cycle model in rtl_model.py, checks them against the golden
+model, and reports the cycles per second of each, and of CXXRTL running
+the clock alone (which is what a C++ testbench would get).  Then it runs
+an Amaranth testbench encrypting --testbench-length letters on CXXRTL and
+on the Amaranth simulator, to compare the two.
+"""
+import ctypes, hashlib, logging, os, re, subprocess, time
+
+from docopt import docopt
+
+logger = logging.getLogger(__name__)
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BUILD_DIR = os.path.join(TEST_DIR, 'sim_build', 'cxxrtl')
+
+# Runs whole clock cycles without a round trip to Python for every edge.
+# The step at the falling edge settles the logic behind the registers, as
+# a step stops as soon as the logic before them has settled.
+TICK_CC = r'''
+#include <cxxrtl/capi/cxxrtl_capi.h>
+
+extern "C" void cxxrtl_sim_tick(cxxrtl_handle handle, struct cxxrtl_object *clk, size_t cycles) {
+    for (size_t i = 0; i < cycles; i++) {
+        clk->next[0] = 1;
+        cxxrtl_step(handle);
+        clk->next[0] = 0;
+        cxxrtl_step(handle);
+    }
+}
+
+// Runs at least one clock cycle, and then more until a bit of mask is set in
+// obj (a port, so not an outline), and returns the cycles it ran
+extern "C" size_t cxxrtl_sim_tick_until(cxxrtl_handle handle, struct cxxrtl_object *clk,
+                                        struct cxxrtl_object *obj, uint32_t mask) {
+    size_t cycles = 0;
+    do {
+        cxxrtl_sim_tick(handle, clk, 1);
+        cycles++;
+    } while (!(obj->curr[0] & mask));
+    return cycles;
+}
+'''
+
+
+class CxxrtlObject(ctypes.Structure):
+    # struct cxxrtl_object in cxxrtl_capi.h
+    _fields_ = [
+        ('type', ctypes.c_uint32),
+        ('flags', ctypes.c_uint32),
+        ('width', ctypes.c_size_t),
+        ('lsb_at', ctypes.c_size_t),
+        ('depth', ctypes.c_size_t),
+        ('zero_at', ctypes.c_size_t),
+        ('curr', ctypes.POINTER(ctypes.c_uint32)),
+        ('next', ctypes.POINTER(ctypes.c_uint32)),
+        ('outline', ctypes.c_void_p),
+        ('attrs', ctypes.c_void_p),
+    ]
+
+
+def runtime_dir():
+    """The CXXRTL runtime headers that come with Amaranth's Yosys"""
+    import amaranth_yosys
+    return os.path.join(os.path.dirname(amaranth_yosys.__file__), 'share', 'include', 'backends', 'cxxrtl', 'runtime')
+
+
+def latch_array_rtlil(depth:int, width:int):
+    """Behavioral model of latch_array in src/latch.v: a $dlatch per word"""
+    lines = ['module \\latch_array',
+             f'  wire width {width} input 1 \\d',
+             f'  wire width {depth} input 2 \\en',
+             f'  wire width {depth*width} output 3 \\q']
+    for i in range(depth):
+        lines += [f'  cell $dlatch $word_{i}',
+                  f'    parameter \\WIDTH {width}',
+                  '    parameter \\EN_POLARITY 1',
+                  '    connect \\D \\d',
+                  f'    connect \\EN \\en [{i}]',
+                  f'    connect \\Q \\q [{(i + 1)*width - 1}:{i*width}]',
+                  '  end']
+    return '\n'.join(lines + ['end', ''])
+
+
+def design_rtlil():
+    """The design, with a model of the latch_array it instantiates.  Yosys
+       only passes parameters to modules read from Verilog, so they are
+       taken off the instance and used to build the model.
+    """
+    from amaranth.back import rtlil
+    from src.top import Enigma
+
+    design = rtlil.convert(Enigma(), name='top')
+    instance = re.search(r'(cell \\latch_array \S+\n)\s+parameter \\WIDTH (\d+)\n\s+parameter \\DEPTH (\d+)\n', design)
+    width, depth = int(instance[2]), int(instance[3])
+    return design.replace(instance[0], instance[1]) + latch_array_rtlil(depth, width)
+
+
+def build(build_dir=BUILD_DIR, cxx='g++'):
+    """Compile the design into a shared library, unless it is already built,
+       and return its path
+    """
+    from amaranth._toolchain.yosys import find_yosys
+
+    design = design_rtlil()
+    digest = hashlib.sha256('\0'.join([design, TICK_CC]).encode()).hexdigest()[:16]
+    library = os.path.abspath(os.path.join(build_dir, f'top_{digest}.so'))
+    if os.path.exists(library):
+        return library
+
+    os.makedirs(build_dir, exist_ok=True)
+    with open(os.path.join(build_dir, 'tick.cc'), 'w') as f:
+        f.write(TICK_CC)
+
+    # The script goes in on stdin and the C++ comes out on stdout, as
+    # Amaranth's Yosys can only open files under the working directory
+    t_start = time.perf_counter()
+    yosys = find_yosys(lambda version: True)
+    cxx_source = yosys.run(['-q', '-'], '\n'.join([
+        'read_rtlil <<rtlil', design, 'rtlil',
+        'hierarchy -top top',
+        'write_cxxrtl',
+    ]))
+    with open(os.path.join(build_dir, 'top.cc'), 'w') as f:
+        f.write(cxx_source)
+    runtime = runtime_dir()
+    subprocess.run([cxx, '-O2', '-std=c++14', '-shared', '-fPIC', f'-I{runtime}',
+                    os.path.join(build_dir, 'top.cc'),
+                    os.path.join(runtime, 'cxxrtl', 'capi', 'cxxrtl_capi.cc'),
+                    os.path.join(build_dir, 'tick.cc'),
+                    '-o', f'{library}.tmp'], check=True)
+    os.replace(f'{library}.tmp', library)
+    for name in os.listdir(build_dir):
+        if re.fullmatch(r'top_[0-9a-f]+\.so', name) and name != os.path.basename(library):
+            os.remove(os.path.join(build_dir, name))
+    logger.info(f'Built {library} in {time.perf_counter() - t_start:.1f}s')
+    return library
+
+
+class CxxrtlSim:
+    """A compiled instance of the design, with a testbench-like context"""
+
+    def __init__(self, library=None):
+        self.lib = lib = ctypes.CDLL(library or build())
+        lib.cxxrtl_design_create.restype = ctypes.c_void_p
+        lib.cxxrtl_create.restype = ctypes.c_void_p
+        lib.cxxrtl_create.argtypes = [ctypes.c_void_p]
+        lib.cxxrtl_destroy.argtypes = [ctypes.c_void_p]
+        lib.cxxrtl_step.argtypes = [ctypes.c_void_p]
+        lib.cxxrtl_get_parts.restype = ctypes.POINTER(CxxrtlObject)
+        lib.cxxrtl_get_parts.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)]
+        lib.cxxrtl_outline_eval.argtypes = [ctypes.c_void_p]
+        lib.cxxrtl_sim_tick.argtypes = [ctypes.c_void_p, ctypes.POINTER(CxxrtlObject), ctypes.c_size_t]
+        lib.cxxrtl_sim_tick_until.restype = ctypes.c_size_t
+        lib.cxxrtl_sim_tick_until.argtypes = [ctypes.c_void_p, ctypes.POINTER(CxxrtlObject),
+                                              ctypes.POINTER(CxxrtlObject), ctypes.c_uint32]
+
+        self.handle = lib.cxxrtl_create(lib.cxxrtl_design_create())
+        self.objects = {}
+        self.cycles = 0
+        self.clk = self.object('clk')
+        self.uio_out = self.object('uio_out')
+        lib.cxxrtl_step(self.handle)
+
+    def __del__(self):
+        if getattr(self, 'handle', None):
+            self.lib.cxxrtl_destroy(self.handle)
+            self.handle = None
+
+    def object(self, name:str):
+        if name not in self.objects:
+            parts = ctypes.c_size_t()
+            obj = self.lib.cxxrtl_get_parts(self.handle, name.encode(), ctypes.byref(parts))
+            if not obj or parts.value != 1:
+                raise KeyError(name)
+            self.objects[name] = obj.contents
+        return self.objects[name]
+
+    def set(self, name:str, value:int):
+        obj = self.object(name)
+        assert obj.width <= 32, name
+        obj.next[0] = value
+        self.lib.cxxrtl_step(self.handle)
+
+    def get(self, name:str):
+        obj = self.object(name)
+        if obj.outline:
+            self.lib.cxxrtl_outline_eval(obj.outline)
+        return sum(obj.curr[i] << 32*i for i in range((obj.width + 31)//32))
+
+    def tick(self, cycles:int=1):
+        self.lib.cxxrtl_sim_tick(self.handle, ctypes.byref(self.clk), cycles)
+        self.cycles += cycles
+
+    def send(self, cmd, din:int=0):
+        """Set a command, clock until the FSM is ready again, and return the
+           cycles it took, like EnigmaRTL.send
+        """
+        from defines import Cmd
+        cmd = Cmd(cmd)
+        self.set('ui_in', cmd.value << 5 | din)
+        if cmd == Cmd.NOP:
+            self.tick()
+            return 1
+        cycles = self.lib.cxxrtl_sim_tick_until(self.handle, ctypes.byref(self.clk), ctypes.byref(self.uio_out), 1 << 5)
+        self.cycles += cycles
+        return cycles
+
+
+def signal_names(dut):
+    """The names of the signals of an Amaranth design, as Amaranth gives them
+       in the RTLIL, and so as CXXRTL has them: the path of the submodule and
+       the name in it, 'fsm ready' for dut.fsm.ready.  A signal gets a name
+       in every module that uses it, listed from the top down.
+    """
+    from amaranth.hdl import Fragment
+    from amaranth.hdl._ast import SignalDict
+
+    design = Fragment.get(dut, None).prepare()
+    names = SignalDict()
+    for info in design.fragments.values():
+        for signal, name in info.signal_names.items():
+            names.setdefault(signal, []).append(' '.join([*info.name[1:], name]))
+    return names
+
+
+class CxxrtlContext:
+    """The testbench context of the Amaranth simulator, on a CxxrtlSim: set()
+       and get() take the signals of an Amaranth design, or slices of them,
+       and tick() runs a clock cycle.  The design only has to have the same
+       hierarchy as the one compiled, as Enigma(sim=True) does.
+    """
+
+    def __init__(self, sim:CxxrtlSim, dut):
+        from amaranth.hdl._ast import SignalDict
+
+        self.sim = sim
+        self.names = signal_names(dut)
+        self.found = SignalDict()   # The first of the names that CXXRTL has
+
+    def target(self, value):
+        """(CXXRTL name, lsb, width) of a signal or a slice of one"""
+        from amaranth.hdl import Value
+        from amaranth.hdl._ast import Signal, Slice
+
+        value = Value.cast(value)
+        lsb, width = 0, len(value)
+        while isinstance(value, Slice):
+            lsb += value.start
+            value = value.value
+        if not isinstance(value, Signal):
+            raise TypeError(f'Only signals and slices of them, not {value!r}')
+        if value not in self.found:
+            for name in self.names.get(value, []):
+                try:
+                    self.sim.object(name)
+                except KeyError:
+                    continue
+                self.found[value] = name
+                break
+            else:
+                raise KeyError(value.name)
+        return self.found[value], lsb, width
+
+    def set(self, value, data):
+        from amaranth.hdl import Const
+
+        name, lsb, width = self.target(value)
+        mask = (1 << width) - 1
+        data = Const.cast(data).value & mask
+        if lsb or width != self.sim.object(name).width:
+            data = self.sim.get(name) & ~(mask << lsb) | data << lsb
+        self.sim.set(name, data)
+
+    def get(self, value):
+        name, lsb, width = self.target(value)
+        return self.sim.get(name) >> lsb & (1 << width) - 1
+
+    async def tick(self):
+        self.sim.tick()
+
+
+def run_testbench(sim:CxxrtlSim, dut, testbench):
+    """Run an Amaranth testbench (an async function of a context) on sim,
+       with the signals of dut.  It runs straight through, as tick() returns
+       at once.
+    """
+    coroutine = testbench(CxxrtlContext(sim, dut))
+    try:
+        coroutine.send(None)
+    except StopIteration:
+        return
+    coroutine.close()
+    raise RuntimeError('The testbench awaited something other than ctx.tick()')
+
+
+def encrypt(sim, rotors, plugboard, text:str):
+    """Reset sim (CxxrtlSim or EnigmaRTL), load a key (rotors as dicts, as in
+       tb_utils) and return the cipher text of text (A-Z only)
+    """
+    from defines import Cmd
+    from vectors import config_commands
+
+    reset, level = ('rst', 1) if isinstance(sim, CxxrtlSim) else ('rst_n', 0)
+    sim.set(reset, level)
+    sim.tick()
+    sim.set(reset, 1 - level)
+    sim.tick()
+    for ui_in in config_commands(rotors, plugboard):
+        sim.send(ui_in >> 5, ui_in & 0x1f)
+    cipher = []
+    for c in text:
+        sim.send(Cmd.SCRAMBLE, ord(c) - 65)
+        cipher.append(chr((sim.get('uio_out') & 0x1f) + 65))
+    return ''.join(cipher)
+
+
+def encrypt_testbench(dut, rotors, plugboard, text:str, cipher:list):
+    """An Amaranth testbench that loads a key into dut (an Enigma) from reset,
+       like encrypt(), and appends the cipher text letters of text to cipher
+    """
+    from defines import Cmd
+    from vectors import config_commands
+
+    async def send(ctx, ui_in:int):
+        ctx.set(dut.ui_in, ui_in)
+        await ctx.tick()
+        while not ctx.get(dut.fsm.ready):
+            await ctx.tick()
+
+    async def testbench(ctx):
+        for ui_in in config_commands(rotors, plugboard):
+            await send(ctx, ui_in)
+        for c in text:
+            await send(ctx, Cmd.SCRAMBLE.value << 5 | ord(c) - 65)
+            cipher.append(chr(ctx.get(dut.uio_out[0:5]) + 65))
+    return testbench
+
+
+if __name__ == '__main__':
+    import sys
+    from random import Random
+    # For src.top
+    sys.path.insert(0, os.path.join(TEST_DIR, '..'))
+    from rtl_model import EnigmaRTL
+    from tb_utils import get_fixed_plugboard_setting, get_fixed_rotor_setting, get_golden_cipher, random_text
+
+    args = docopt(__doc__)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    logging.getLogger('enigma').setLevel(logging.WARNING)
+    rotors, plugboard = get_fixed_rotor_setting(), get_fixed_plugboard_setting()
+    text = random_text(Random(0), int(args['--length']))
+    golden = get_golden_cipher(rotors, plugboard, text)
+
+    library = build(args['--build'])
+    for name, sim in [('cxxrtl', CxxrtlSim(library)), ('rtl_model', EnigmaRTL())]:
+        t_start = time.perf_counter()
+        cipher = encrypt(sim, rotors, plugboard, text)
+        seconds = time.perf_counter() - t_start
+        assert cipher == golden, name
+        logger.info(f'{name:10} {sim.cycles:12,} cycles {sim.cycles/seconds:14,.0f} cycles/s')
+
+    sim = CxxrtlSim(library)
+    t_start = time.perf_counter()
+    sim.tick(10*len(text))
+    logger.info(f'{"clock only":10} {sim.cycles:12,} cycles {sim.cycles/(time.perf_counter() - t_start):14,.0f} cycles/s')
+
+    # The same testbench on both, so the same cycles, counted by CXXRTL
+    from amaranth.sim import Simulator
+    from src.top import Enigma
+    text = text[:int(args['--testbench-length'])]
+    golden = get_golden_cipher(rotors, plugboard, text)
+    dut = Enigma(sim=True)
+    sim = CxxrtlSim(library)
+    for name in ['cxxrtl tb', 'amaranth']:
+        cipher = []
+        testbench = encrypt_testbench(dut, rotors, plugboard, text, cipher)
+        t_start = time.perf_counter()
+        if name == 'amaranth':
+            amaranth_sim = Simulator(dut)
+            amaranth_sim.add_clock(1e-6)
+            amaranth_sim.add_testbench(testbench)
+            amaranth_sim.run()
+        else:
+            run_testbench(sim, dut, testbench)
+        seconds = time.perf_counter() - t_start
+        assert ''.join(cipher) == golden, name
+        logger.info(f'{name:10} {sim.cycles:12,} cycles {sim.cycles/seconds:14,.0f} cycles/s')
+
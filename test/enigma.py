@@ -2,14 +2,24 @@
 """Enigma reference simulator.
 
 Usage:
-    enigma.py [options] <ARG>
+    enigma.py [options]
+    enigma.py [options] encrypt <INPUT> <OUTPUT>
 
 Options:
-    -h, --help       Show this screen
-    -d, --debug      Debug messages
+    -h, --help              Show this screen
+    -d, --debug             Debug messages
+    --rotors=<types>        Rotor types, rotor 0 first [default: I,II,III]
+    --start=<letters>       Start positions, rotor 0 first [default: PFB]
+    --rings=<nums>          Ring settings, rotor 0 first [default: 18,5,24]
+    --plugs=<pairs>         Plugboard wires [default: AN,DE,ZB,GX,HQ]
+    --reflector=<type>      Reflector [default: B]
+    -j, --workers=<n>       Worker processes for encrypt (default: all cores)
+    --chunk-size=<bytes>    Bytes of input per worker task [default: 67108864]
 """
 import logging, sys
-from docopt import docopt
+from array import array
+from functools import lru_cache
+from docopt import docopt, DocoptExit
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +37,69 @@ logger = logging.getLogger(__name__)
 
 letter_to_num = {chr(i): i - ord('A') for i in range(ord('A'), ord('Z') + 1)}  # Map letter to num
 num_to_letter = lambda x: chr(x+65)  # noqa: E731
+
+# bytes.translate tables that map A-Z and a-z to 0-25 and drop everything else
+LETTER_NUMBERS = bytes.maketrans(bytes(range(65, 91)) + bytes(range(97, 123)), bytes(range(26))*2)
+NON_LETTERS = bytes(c for c in range(256) if not (65 <= c <= 90 or 97 <= c <= 122))
 def rotate_left(l, num):
     num = num % len(l)
     return l[num:]+l[:num]
 
+# Number of key presses between two landings of the middle rotor on its
+# turnover letter (25 carries from rotor 0, since the double step skips one)
+DOUBLE_STEP_PERIOD = 25 * 26
+
+def first_steps(starts, turnovers):
+    """Return the first key press on which rotor 0 carries into rotor 1
+       (then every 26 presses), and the first press on which that carry
+       lands rotor 1 on its turnover (then every DOUBLE_STEP_PERIOD presses).
+
+       starts are the positions of rotors 0-2 (with no double step pending),
+       turnovers are the turnover positions of rotors 0 and 1.  Works the
+       same on ints and on numpy arrays.
+    """
+    s0, s1, _ = starts
+    t0, t1 = turnovers
+    first_carry = (t0 - s0) % 26 + 1
+    first_landing = first_carry + 26*((t1 - s1 - 1) % 26)
+    return first_carry, first_landing
+
+def step_state(starts, turnovers, n):
+    """Jump straight to the rotor positions after n key presses.
+
+       This is the closed form of the stepping in Enigma.cipher:
+        - rotor 0 moves on every key press
+        - rotor 1 moves when rotor 0 was at its turnover before the press
+        - if that carry lands rotor 1 on its turnover, the next key press
+          steps rotor 1 again and rotor 2 with it (the double step)
+
+       starts and turnovers are as in first_steps.  Returns the positions
+       and whether a double step is pending for the next press.  n (and the
+       starts) can also be numpy arrays, see enigma_np.rotor_positions.
+    """
+    s0, s1, s2 = starts
+    first_carry, first_landing = first_steps(starts, turnovers)
+    carries = (n - first_carry)//26 + 1
+    double_steps = ((n - first_landing - 1)//DOUBLE_STEP_PERIOD + 1) * (n > first_landing)
+    double_step_pending = (n >= first_landing) & ((n - first_landing) % DOUBLE_STEP_PERIOD == 0)
+
+    positions = [
+        (s0 + n) % 26,
+        (s1 + carries + double_steps) % 26,
+        (s2 + double_steps) % 26,
+    ]
+    return positions, double_step_pending
+
+def parse_rotors(types:str, starts:str, rings:str):
+    """Return the rotor list taken by Enigma() from the --rotors, --start
+       and --rings command line options, e.g. 'I,II,III', 'PFB', '18,5,24'
+    """
+    types, rings = types.split(','), rings.split(',')
+    if not len(types) == len(starts) == len(rings) == 3:
+        raise ValueError(f'Need 3 rotor types, start positions and ring settings, '
+                         f'got --rotors={",".join(types)} --start={starts} --rings={",".join(rings)}')
+    return list(zip(types, starts.upper(), map(int, rings)))
+
 class Rotor:
     base = 'ABC'
     def __init__(self, place, start_pos:str='A', ring_setting:int = 0):
@@ -86,7 +155,8 @@ class Rotor:
         result = result + self.ring_setting
         result = result % 26
 
-        self.message(right, result, r_to_l=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            self.message(right, result, r_to_l=True)
         return result
 
     def ltor(self, left:int ):
@@ -105,7 +175,8 @@ class Rotor:
         
         result = result % 26
 
-        self.message(left, result, r_to_l=False)
+        if logger.isEnabledFor(logging.DEBUG):
+            self.message(left, result, r_to_l=False)
         return result
 
     def message(self, in_offset, out_offset, r_to_l):
@@ -184,6 +255,8 @@ class Enigma:
 
         self.next_is_double_step = False
 
+        # Per rotor position translation tables for encrypt_bytes
+        self.position_tables = {}
 
     def cipher(self, letter):
         # Convert letter from keyboard to its number
@@ -210,7 +283,8 @@ class Enigma:
             l = rotor.ltor(l)
         end = num_to_letter(l)
         end = self.plugboard.traverse(end)
-        logger.debug(f'Cipher {letter} -> {end} {letter_to_num[end]}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'Cipher {letter} -> {end} {letter_to_num[end]}')
         return end
 
 
@@ -233,16 +307,259 @@ class Enigma:
         logger.info(output)
         return output
 
+    def stream(self, chunks):
+        """Encrypt an iterable of chunks (str, bytes or memoryview), yielding
+           the cipher text of each chunk as soon as it is done.  The rotors
+           carry over from one chunk to the next, so this is the same as
+           process_message on the concatenated chunks, without ever holding
+           the whole text.  bytes-like chunks give bytes back.
+
+           e.g. to encrypt a pipe: e.stream(iter(lambda: f.read(4096), b''))
+        """
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                yield ''.join([self.cipher(c) for c in chunk.upper() if 'A' <= c <= 'Z'])
+            else:
+                yield self.encrypt_bytes(chunk)
+
+    def encrypt_bytes(self, buf):
+        """Encrypt the letters in a bytes-like buffer and return the cipher
+           text as upper-case ASCII bytes.
+
+           Instead of walking every character through the rotors, this keeps
+           a 26-byte translation table for each rotor position (plugboard
+           included), filled in the first time an entry is needed.
+        """
+        letters = bytes(buf).translate(LETTER_NUMBERS, NON_LETTERS)
+        output = bytearray(len(letters))
+
+        r0, r1, r2 = self.rotors
+        p0, p1, p2 = r0.ptr, r1.ptr, r2.ptr
+        t0, t1 = letter_to_num[r0.turnover], letter_to_num[r1.turnover]
+        double_step = self.next_is_double_step
+        tables = self.position_tables
+
+        for i, x in enumerate(letters):
+            # Same stepping as in cipher()
+            if p0 == t0:
+                p1 = (p1 + 1) % 26
+                if p1 == t1:
+                    double_step = True
+            elif double_step:
+                p1 = (p1 + 1) % 26
+                p2 = (p2 + 1) % 26
+                double_step = False
+            p0 = (p0 + 1) % 26
+
+            position = (p0, p1, p2)
+            table = tables.get(position)
+            if table is None:
+                table = tables[position] = bytearray(26)
+            c = table[x]
+            if not c:
+                c = table[x] = self.scramble(position, x)
+            output[i] = c
+
+        r0.ptr, r1.ptr, r2.ptr = p0, p1, p2
+        self.next_is_double_step = double_step
+        return bytes(output)
+
+    def scramble(self, positions, num:int):
+        """Encrypt letter number num with the rotors at the given positions,
+           without logging or touching the machine state.
+           Returns the ASCII code of the cipher letter.
+        """
+        # Same arithmetic as Rotor.rtol and Rotor.ltor
+        l = letter_to_num[self.plugboard.traverse(num_to_letter(num))]
+        for rotor, ptr in zip(self.rotors, positions):
+            l = (rotor.right_to_left[(l + ptr) % 26] - ptr + rotor.ring_setting) % 26
+        l = self.reflector.right_to_left[l]
+        for rotor, ptr in zip(self.rotors[::-1], positions[::-1]):
+            l = (rotor.left_to_right[(l + ptr - rotor.ring_setting) % 26] - ptr) % 26
+        return ord(self.plugboard.traverse(num_to_letter(l)))
+
+    def state_at(self, n:int):
+        """Rotor positions (and pending double step) after n key presses
+           from the start positions, without stepping through them
+        """
+        return step_state([rotor.start_pos for rotor in self.rotors],
+                          [letter_to_num[rotor.turnover] for rotor in self.rotors[:2]], n)
+
+    def seek(self, n:int):
+        """Put the machine in the state it would be in after n key presses"""
+        positions, double_step_pending = self.state_at(n)
+        for rotor, ptr in zip(self.rotors, positions):
+            rotor.ptr = ptr
+        self.next_is_double_step = double_step_pending
+
+    def encrypt_range(self, text:str, offset:int):
+        """Encrypt (or decrypt) text that starts at letter number offset of
+           a message sent with this key
+        """
+        self.seek(offset)
+        return self.process_message(text)
+
+
+
+# Values recorded for each key press by FastEnigma.enable_trace
+TRACE_STAGES = (
+    'pos0', 'pos1', 'pos2',              # Rotor positions after stepping
+    'plug_in',                           # Letter after the plugboard
+    'rtol0', 'rtol1', 'rtol2',           # After each rotor, right to left
+    'reflector',
+    'ltor2', 'ltor1', 'ltor0',           # After each rotor, left to right
+    'plug_out',                          # Cipher letter
+)
+
+@lru_cache(maxsize=None)
+def offset_tables(rotor_type:str):
+    """Right to left and left to right mappings of a rotor type as [offset][contact]
+       lists, with the same arithmetic as Rotor.rtol and Rotor.ltor
+    """
+    wiring = [letter_to_num[c] for c in Enigma.ROTORS[rotor_type].wiring]
+    inverse = [wiring.index(i) for i in range(26)]
+    rtol = tuple([(wiring[(x + o) % 26] - o) % 26 for x in range(26)] for o in range(26))
+    ltor = tuple([(inverse[(x + o) % 26] - o) % 26 for x in range(26)] for o in range(26))
+    return rtol, ltor
+
+class FastEnigma:
+    """Same machine as Enigma, without the per-letter overhead.
+
+       Each rotor keeps its offset (ptr - ring_setting) instead of its
+       position, so rtol and ltor are a single lookup into a table per
+       offset, and the turnovers are compared as offsets too.  Nothing is
+       logged.  Enigma stays the readable reference; test_golden checks
+       that the two agree.
+
+       enable_trace records the TRACE_STAGES of each key press into a
+       preallocated array.  Tracing only costs anything while it is on.
+    """
+    __slots__ = ('rtol', 'ltor', 'reflector', 'plugs', 'rings', 'offsets', 'turnovers',
+                 'next_is_double_step', 'trace', 'trace_presses')
+
+    def __init__(self, rotors:list[str], reflector:str, plugboard=[]):
+        """ rotors are 0 (rightmost) to 2 (leftmost), as for Enigma
+        """
+        types = [Enigma.ROTORS[rotor] for rotor, _, _ in rotors]
+        self.rings = [ring_setting for _, _, ring_setting in rotors]
+        self.offsets = [(letter_to_num[start_pos] - ring_setting) % 26 for _, start_pos, ring_setting in rotors]
+        self.turnovers = [(letter_to_num[t.turnover] - ring_setting) % 26 for t, ring_setting in zip(types, self.rings)]
+
+        # Shared by all machines with the same rotor type, and never modified
+        self.rtol, self.ltor = zip(*[offset_tables(rotor) for rotor, _, _ in rotors])
+        self.reflector = [letter_to_num[c] for c in Enigma.REFLECTORS[reflector].wiring]
+
+        board = PlugBoard(plugboard).board
+        self.plugs = [letter_to_num[board.get(num_to_letter(i), num_to_letter(i))] for i in range(26)]
+
+        self.next_is_double_step = False
+        self.trace = None
+        self.trace_presses = 0
+
+    @property
+    def positions(self):
+        """Rotor positions, as Rotor.ptr of rotors 0-2"""
+        return [(o + r) % 26 for o, r in zip(self.offsets, self.rings)]
+
+    def enable_trace(self, presses:int):
+        """Record the next presses key presses (later ones are not recorded)"""
+        self.trace = array('B', bytes(presses * len(TRACE_STAGES)))
+        self.trace_presses = 0
+
+    def trace_rows(self):
+        """The recorded key presses, as one tuple of TRACE_STAGES each"""
+        n = len(TRACE_STAGES)
+        return [tuple(self.trace[i*n:(i+1)*n]) for i in range(self.trace_presses)]
+
+    def step(self):
+        """Same stepping as in Enigma.cipher"""
+        o0, o1, o2 = self.offsets
+        t0, t1, _ = self.turnovers
+        if o0 == t0:
+            o1 = (o1 + 1) % 26
+            if o1 == t1:
+                self.next_is_double_step = True
+        elif self.next_is_double_step:
+            o1 = (o1 + 1) % 26
+            o2 = (o2 + 1) % 26
+            self.next_is_double_step = False
+        self.offsets = [(o0 + 1) % 26, o1, o2]
+
+    def cipher(self, letter:str):
+        self.step()
+        stages = [*self.positions, self.plugs[letter_to_num[letter]]]
+        l = stages[-1]
+        for rtol, o in zip(self.rtol, self.offsets):
+            l = rtol[o][l]
+            stages.append(l)
+        l = self.reflector[l]
+        stages.append(l)
+        for ltor, o in zip(self.ltor[::-1], self.offsets[::-1]):
+            l = ltor[o][l]
+            stages.append(l)
+        l = self.plugs[l]
+        stages.append(l)
+
+        if self.trace is not None and (self.trace_presses + 1) * len(stages) <= len(self.trace):
+            self.trace[self.trace_presses*len(stages):(self.trace_presses+1)*len(stages)] = array('B', stages)
+            self.trace_presses += 1
+        return num_to_letter(l)
+
+    def process_message(self, message:str):
+        """Convert a string into cipher text.
+           Eliminate white space
+        """
+        letters = message.upper().encode('ascii', 'ignore').translate(LETTER_NUMBERS, NON_LETTERS)
+        if self.trace is not None:
+            return ''.join([self.cipher(num_to_letter(x)) for x in letters])
+
+        output = bytearray(len(letters))
+        (rtol0, rtol1, rtol2), (ltor0, ltor1, ltor2) = self.rtol, self.ltor
+        reflector, plugs = self.reflector, self.plugs
+        o0, o1, o2 = self.offsets
+        t0, t1, _ = self.turnovers
+        double_step = self.next_is_double_step
+        for i, x in enumerate(letters):
+            if o0 == t0:
+                o1 = (o1 + 1) % 26
+                if o1 == t1:
+                    double_step = True
+            elif double_step:
+                o1 = (o1 + 1) % 26
+                o2 = (o2 + 1) % 26
+                double_step = False
+            o0 = (o0 + 1) % 26
+
+            x = rtol2[o2][rtol1[o1][rtol0[o0][plugs[x]]]]
+            x = ltor0[o0][ltor1[o1][ltor2[o2][reflector[x]]]]
+            output[i] = plugs[x] + 65
+
+        self.offsets = [o0, o1, o2]
+        self.next_is_double_step = double_step
+        return output.decode('ascii')
+
 
 
 
 if __name__ == '__main__':
-    args = docopt(__doc__, sys.argv)    
+    args = docopt(__doc__)
     if args['--debug']:
         logging.basicConfig(level=logging.DEBUG)
     else:
         logging.basicConfig(level=logging.INFO)
 
+    if args['encrypt']:
+        from enigma_parallel import encrypt_file
+        try:
+            rotors = parse_rotors(args['--rotors'], args['--start'], args['--rings'])
+        except ValueError as e:
+            raise DocoptExit(str(e))
+        plugboard = [p for p in args['--plugs'].split(',') if p]
+        workers = int(args['--workers']) if args['--workers'] else None
+        encrypt_file(rotors, args['--reflector'], plugboard, args['<INPUT>'], args['<OUTPUT>'],
+                     workers=workers, chunk_size=int(args['--chunk-size']))
+        sys.exit(0)
+
     logger.info('Creating Enigma')
     e = Enigma([('I', 'P', 18), ('II', 'F', 5), ('III', 'B',24 )], 'B',
                  #plugboard= [ 'AN', 'DE', 'ZB', 'GX', 'HQ']
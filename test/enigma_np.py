@@ -0,0 +1,203 @@
+"""NumPy-vectorized Enigma reference simulator.
+
+Produces exactly the same output as enigma.Enigma, but instead of stepping
+the rotors one key press at a time, it computes the rotor positions for the
+whole message up front and then looks every character up in a precomputed
+table of scrambler permutations with array gathers.
+"""
+import logging
+from functools import lru_cache
+import numpy as np
+
+from enigma import Enigma, letter_to_num, step_state
+
+logger = logging.getLogger(__name__)
+
+# How many full-cycle permutation tables to keep around.  Each one is 26^4 bytes
+# (~450KB), and there are only 60 rotor orders per reflector
+PERMUTATION_CACHE_SIZE = 16
+
+# Upper bound on the number of (key, letter) elements that batch_encrypt
+# pushes through the tables at once
+BATCH_ELEMENTS = 1 << 22
+
+
+def to_nums(letters:str):
+    return np.array([letter_to_num[c] for c in letters], dtype=np.int64)
+
+
+@lru_cache(maxsize=None)
+def rotor_tables(rotor_type:str):
+    """Return the right to left and left to right mappings of a rotor type
+       as 26x26 arrays indexed by [offset, contact], where offset is the
+       rotor position minus its ring setting.
+    """
+    wiring = to_nums(Enigma.ROTORS[rotor_type].wiring)
+    offset = np.arange(26)[:, None]
+    contact = np.arange(26)[None, :]
+    rtol = (wiring[(contact + offset) % 26] - offset) % 26
+    ltor = (np.argsort(wiring)[(contact + offset) % 26] - offset) % 26
+    return rtol.astype(np.uint8), ltor.astype(np.uint8)
+
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def permutation_table(rotor_types:tuple[str], reflector:str):
+    """Return the scrambler permutation (everything between the two plugboard
+       passes) for every combination of rotor offsets, as a uint8 array indexed
+       by [offset0, offset1, offset2, letter].
+
+       The ring settings only shift a rotor's offset with respect to its
+       position, so one table covers every ring setting and start position of
+       a rotor order.  The plugboard just conjugates the permutation, so it
+       does not invalidate the table either.
+    """
+    offsets = np.ix_(*[np.arange(26)]*3)
+    l = np.arange(26).reshape(1, 1, 1, 26)
+    tables = [rotor_tables(rotor_type) for rotor_type in rotor_types]
+    for (rtol, ltor), offset in zip(tables, offsets):
+        l = rtol[offset[..., None], l]
+    l = to_nums(Enigma.REFLECTORS[reflector].wiring)[l]
+    for (rtol, ltor), offset in zip(tables[::-1], offsets[::-1]):
+        l = ltor[offset[..., None], l]
+    logger.debug(f'Built permutation table for rotors {rotor_types}, reflector {reflector}')
+    return l.astype(np.uint8)
+
+
+def letters_in(buf):
+    """Return the letters in a bytes-like buffer as numbers 0-25 (case-insensitive)"""
+    b = np.frombuffer(buf, dtype=np.uint8)
+    upper = b & 0xDF
+    return (upper[(upper >= ord('A')) & (upper <= ord('Z'))] - ord('A')).astype(np.uint8)
+
+
+def plug_array(plugboard):
+    """Return a PlugBoard as an array mapping each letter number to its plug"""
+    plugs = np.arange(26)
+    for a, b in plugboard.board.items():
+        plugs[letter_to_num[a]] = letter_to_num[b]
+    return plugs
+
+
+def rotor_positions(starts, turnovers, n:int, skip:int=0):
+    """Return the rotor positions for key presses skip+1..skip+n, plus the
+       double-step flag after each press.
+
+       Vectorized version of enigma.step_state: starts are the current
+       positions of rotors 0-2 (with no double step pending), turnovers are
+       the turnover positions of rotors 0 and 1.  These can also be (K, 1)
+       arrays to step K machines at once, giving (3, K, n) positions.
+    """
+    k = np.arange(skip+1, skip+n+1, dtype=np.int64)
+    positions, double_step_pending = step_state(starts, turnovers, k)
+    return np.stack(np.broadcast_arrays(*positions)), double_step_pending
+
+
+class EnigmaNP(Enigma):
+    """Drop-in replacement for Enigma that encrypts whole messages at once.
+
+       The rotor objects are the same as in the scalar model, so cipher()
+       still works one letter at a time and both paths share machine state.
+    """
+
+    def __init__(self, rotors:list[str], reflector:str, plugboard=[]):
+        super().__init__(rotors, reflector, plugboard)
+
+        self.table = permutation_table(tuple(rotor for rotor, _, _ in rotors), reflector)
+        self.turnovers = [letter_to_num[rotor.turnover] for rotor in self.rotors]
+
+        self.plugs = plug_array(self.plugboard)
+
+    def encrypt_nums(self, nums:np.ndarray):
+        """Encrypt an array of letter numbers (0-25), advancing the rotors"""
+        if len(nums) == 0:
+            return nums
+        if self.next_is_double_step:
+            # The closed form starts with no double step pending, so let the
+            # scalar path take the first key press
+            first = letter_to_num[self.cipher(chr(nums[0]+65))]
+            return np.concatenate(([first], self.encrypt_nums(nums[1:])))
+
+        positions, double_step_pending = rotor_positions(
+            [rotor.ptr for rotor in self.rotors], self.turnovers[:2], len(nums))
+        offsets = [(positions[i] - rotor.ring_setting) % 26 for i, rotor in enumerate(self.rotors)]
+        l = self.plugs[self.table[(*offsets, self.plugs[nums])]]
+
+        # Leave the machine where the scalar model would have left it
+        for rotor, ptr in zip(self.rotors, positions[:, -1]):
+            rotor.ptr = int(ptr)
+        self.next_is_double_step = bool(double_step_pending[-1])
+        return l
+
+    def process_message(self, message:str):
+        """Convert a string into cipher text.
+           Eliminate white space
+        """
+        text = np.frombuffer(message.upper().encode('ascii', 'ignore'), dtype=np.uint8)
+        text = text[(text >= ord('A')) & (text <= ord('Z'))]
+        output = (self.encrypt_nums(text.astype(np.int64) - ord('A')) + ord('A')).astype(np.uint8)
+        output = output.tobytes().decode('ascii')
+        logger.debug(f'Plaintext: {message}')
+        logger.debug(f'Output:    {output}')
+        return output
+
+    def stream(self, chunks):
+        """Same as Enigma.stream, but encrypts each chunk in one go"""
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                yield self.process_message(chunk)
+            else:
+                yield self.encrypt_bytes(chunk)
+
+    def encrypt_bytes(self, buf):
+        """Same as Enigma.encrypt_bytes, but uses the full-cycle permutation
+           table for all letters at once
+        """
+        nums = self.encrypt_nums(letters_in(buf).astype(np.int64))
+        return (nums + ord('A')).astype(np.uint8).tobytes()
+
+    @staticmethod
+    def batch_encrypt(keys, messages):
+        """Encrypt messages[i] under keys[i], for all keys in lockstep.
+
+           keys are (rotors, reflector, plugboard) tuples, as taken by
+           Enigma().  The keys are stacked along the first axis of every
+           array, so each key press of all K machines is resolved by one 2-D
+           gather into the stacked permutation tables of their rotor orders.
+           Returns the list of cipher texts.
+        """
+        assert len(keys) == len(messages), f'{len(keys)} keys given for {len(messages)} messages'
+        # Only parse the keys here, and fetch each rotor order's table once
+        machines = [Enigma(*key) for key in keys]
+        texts = [np.frombuffer(m.upper().encode('ascii', 'ignore'), dtype=np.uint8) for m in messages]
+        texts = [t[(t >= ord('A')) & (t <= ord('Z'))].astype(np.int64) - ord('A') for t in texts]
+        lengths = [len(t) for t in texts]
+        if not machines:
+            return []
+
+        # Stack everything that differs between keys, one row per key
+        orders = {}
+        for rotors, reflector, *_ in keys:
+            orders.setdefault((tuple(rotor for rotor, _, _ in rotors), reflector), len(orders))
+        tables = np.stack([permutation_table(*o) for o in orders])
+        order = np.array([orders[(tuple(rotor for rotor, _, _ in rotors), reflector)]
+                          for rotors, reflector, *_ in keys])[:, None]
+        starts = np.array([[r.ptr for r in m.rotors] for m in machines]).T[..., None]
+        rings = np.array([[r.ring_setting for r in m.rotors] for m in machines]).T[..., None]
+        turnovers = np.array([[letter_to_num[r.turnover] for r in m.rotors[:2]] for m in machines]).T[..., None]
+        plugs = np.stack([plug_array(m.plugboard) for m in machines])
+
+        nums = np.zeros((len(machines), max(lengths)), dtype=np.int64)
+        for i, t in enumerate(texts):
+            nums[i, :len(t)] = t
+
+        block = max(1, BATCH_ELEMENTS // len(machines))
+        for skip in range(0, nums.shape[1], block):
+            n = min(block, nums.shape[1] - skip)
+            positions, _ = rotor_positions(starts, turnovers, n, skip)
+            offsets = (positions - rings) % 26
+            l = np.take_along_axis(plugs, nums[:, skip:skip+n], axis=1)
+            l = tables[order, offsets[0], offsets[1], offsets[2], l]
+            nums[:, skip:skip+n] = np.take_along_axis(plugs, l, axis=1)
+
+        return [(row[:length] + ord('A')).astype(np.uint8).tobytes().decode('ascii')
+                for row, length in zip(nums, lengths)]
@@ -0,0 +1,72 @@
+"""Encrypt large files with the golden model across a pool of processes.
+
+The input file is memory-mapped and split into chunks.  Each worker first
+counts the A-Z letters in its chunk, which tells every chunk how many key
+presses come before it.  Then each worker seeks its own Enigma to that
+offset and writes its cipher text straight into a pre-sized memory-mapped
+output file.
+"""
+import logging, mmap, os, time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, repeat
+
+import numpy as np
+
+from enigma_np import EnigmaNP, letters_in
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 << 20   # Bytes of input per work item
+BLOCK_SIZE = 1 << 20    # Letters encrypted at once inside a worker, to bound memory
+
+
+def _map(path, access=mmap.ACCESS_READ):
+    with open(path, 'rb' if access == mmap.ACCESS_READ else 'r+b') as f:
+        return mmap.mmap(f.fileno(), 0, access=access)
+
+
+def _count_letters(input_path, start, end):
+    with _map(input_path) as m:
+        return len(letters_in(m[start:end]))
+
+
+def _encrypt_chunk(key, input_path, output_path, start, end, offset):
+    rotors, reflector, plugboard = key
+    machine = EnigmaNP(rotors, reflector, plugboard)
+    machine.seek(offset)
+    with _map(input_path) as src:
+        nums = letters_in(src[start:end])
+    with _map(output_path, mmap.ACCESS_WRITE) as dst:
+        for i in range(0, len(nums), BLOCK_SIZE):
+            block = machine.encrypt_nums(nums[i:i+BLOCK_SIZE].astype(np.int64))
+            dst[offset+i:offset+i+len(block)] = (block + ord('A')).astype(np.uint8).tobytes()
+    return len(nums)
+
+
+def encrypt_file(rotors, reflector, plugboard, input_path, output_path, workers=None, chunk_size=CHUNK_SIZE):
+    """Encrypt the letters in input_path into output_path (upper-case A-Z only,
+       no white space), exactly as Enigma.process_message would.
+
+       Returns the number of letters written.
+    """
+    t_start = time.perf_counter()
+    size = os.path.getsize(input_path)
+    chunks = [(start, min(start+chunk_size, size)) for start in range(0, size, chunk_size)]
+    key = (rotors, reflector, plugboard)
+
+    with ProcessPoolExecutor(workers) as pool:
+        counts = list(pool.map(_count_letters, repeat(input_path), *zip(*chunks))) if chunks else []
+        offsets = [0, *accumulate(counts)]
+        total = offsets.pop()
+
+        with open(output_path, 'wb') as f:
+            f.truncate(total)
+        if total:
+            starts, ends = zip(*chunks)
+            list(pool.map(_encrypt_chunk, repeat(key), repeat(input_path), repeat(output_path),
+                          starts, ends, offsets))
+
+    elapsed = time.perf_counter() - t_start
+    logger.info(f'Encrypted {total} letters from {input_path} in {elapsed:.2f}s '
+                f'({total/elapsed:.0f} letters/s, {len(chunks)} chunks)')
+    return total
@@ -0,0 +1,110 @@
+"""Cycle counts of the commands of the Control FSM (src/fsm.py).
+
+Every command is taken in the "Get command" state, where ready is high,
+and takes a fixed number of clock cycles to get back there:
+
+    RESET                               Initial                         2
+    LOAD_START, LOAD_RING, SET_ROTORS   Load start/ring, Set rotors     2
+    LOAD_PLUG_ADDR, LOAD_PLUG_DATA      Load plug addr/data, Delay plug 3
+    SCRAMBLE                            Scramble, Rotor 0-2, Rotor 2-0
+                                        back, Delay, Delay 2            10
+
+A SCRAMBLE takes the detour through "Inc Rotor 1" and "Check turnover"
+(2 more cycles) when rotor 0 is at its turnover letter or a double step is
+pending, and one more state after that: "Activate double step" when rotor
+1 lands on its turnover, or "Inc Rotor 2" for the double step itself.
+
+So the testbench can wait out a command with a single timer instead of
+watching ready, as long as it tracks the rotor positions the hardware
+turns over on.  LatencyModel does that from the commands alone.
+"""
+from defines import Cmd, Rotors
+from enigma import Enigma, letter_to_num
+
+# Turnover position of each rotor type, by the number SET_ROTORS takes
+TURNOVERS = [letter_to_num[Enigma.ROTORS[rotor].turnover] for rotor in Rotors]
+
+
+def turnover(slot:int):
+    """Turnover position of a rotor slot.  Like any out of range Array read
+       in the hardware, rotor type numbers past the last one read as 0.
+    """
+    return TURNOVERS[slot] if slot < len(TURNOVERS) else 0
+
+COMMAND_CYCLES = {
+    Cmd.RESET: 2,
+    Cmd.LOAD_START: 2,
+    Cmd.LOAD_RING: 2,
+    Cmd.SET_ROTORS: 2,
+    Cmd.LOAD_PLUG_ADDR: 3,
+    Cmd.LOAD_PLUG_DATA: 3,
+    Cmd.SCRAMBLE: 10,
+}
+CARRY_CYCLES = 2        # Inc Rotor 1, Check turnover
+DOUBLE_STEP_CYCLES = 1  # Activate double step, or Inc Rotor 2
+
+
+def inc(position:int):
+    """Rotor counter increment: 25 wraps to 0, as do the 5 bits past it"""
+    return 0 if position == 25 else (position + 1) & 0x1f
+
+
+class LatencyModel:
+    """Follows the Control FSM and rotor state that the latency of a
+       command depends on: the rotor slot that configuration commands go
+       to, the rotor types and positions, and the double step flag.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """State after a reset (or a RESET command)"""
+        self.cnt = 0                # Slot of the last configuration command, 1-3 (0 is none)
+        self.slots = [0, 1, 2]      # Rotor type number in each slot
+        self.positions = [0, 0, 0]
+        self.double_step = False
+
+    def is_at_turnover(self, rotor:int):
+        return self.positions[rotor] == turnover(self.slots[rotor])
+
+    def scramble(self):
+        """Step the rotors for a key press and return the cycles it takes"""
+        cycles = COMMAND_CYCLES[Cmd.SCRAMBLE]
+        carry = self.double_step or self.is_at_turnover(0)
+        self.positions[0] = inc(self.positions[0])
+        if carry:
+            cycles += CARRY_CYCLES
+            self.positions[1] = inc(self.positions[1])
+            if self.double_step:
+                cycles += DOUBLE_STEP_CYCLES
+                self.positions[2] = inc(self.positions[2])
+                self.double_step = False
+            elif self.is_at_turnover(1):
+                cycles += DOUBLE_STEP_CYCLES
+                self.double_step = True
+        return cycles
+
+    def command(self, cmd:Cmd, din:int):
+        """Update the state for a command taken while ready, and return the
+           number of clock cycles until ready is high again (0 for a NOP,
+           which leaves the FSM waiting)
+        """
+        cmd = Cmd(cmd)
+        if cmd == Cmd.NOP:
+            return 0
+        if cmd == Cmd.RESET:
+            # Only the FSM goes back to Initial, the rotors keep their settings
+            self.cnt = 0
+            self.double_step = False
+        elif cmd == Cmd.SCRAMBLE:
+            return self.scramble()
+        elif cmd in (Cmd.LOAD_START, Cmd.LOAD_RING, Cmd.SET_ROTORS):
+            self.cnt = self.cnt % 3 + 1
+            if cmd == Cmd.LOAD_START:
+                self.positions[self.cnt - 1] = din
+            elif cmd == Cmd.SET_ROTORS:
+                self.slots[self.cnt - 1] = din & 0x7
+            if self.cnt == 3:
+                self.cnt = 0
+        return COMMAND_CYCLES[cmd]
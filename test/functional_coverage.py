@@ -0,0 +1,98 @@
+"""Functional coverage of the commands sent to the design.
+
+Coverage follows the commands the testbench sends, and classifies each
+one by the rotor and plugboard state it acts on, the same way the golden
+model steps the rotors (see fsm_latency.py).  It counts hits in these bins:
+
+    rotor 0 turnover        a SCRAMBLE with rotor 0 at its turnover letter
+    double step             a SCRAMBLE that double steps the middle rotor
+    <type> in slot <n>      a SCRAMBLE with rotor type <type> in slot n
+    <n> plugs               a SCRAMBLE with n plugs in, for n up to PLUG_LIMIT
+    plug limit              plug_limiter reaching PLUG_LIMIT plugs, after
+                            which it blocks every plugboard write
+
+so a random test can stop once every bin is hit:
+
+    coverage = Coverage()
+    coverage.command(Cmd.SCRAMBLE, 7)
+    coverage.missing()      # Bins not hit yet
+"""
+from defines import Cmd, PLUG_LIMIT, Rotors
+from fsm_latency import LatencyModel
+
+N = 3   # Rotor slots
+
+
+def bins():
+    return (['rotor 0 turnover', 'double step'] +
+            [f'{rotor} in slot {slot}' for slot in range(N) for rotor in Rotors] +
+            [f'{n} plugs' for n in range(PLUG_LIMIT + 1)] +
+            ['plug limit'])
+
+
+class Coverage:
+    """Bins of functional coverage, and the design state that classifies
+       the commands into them
+    """
+
+    def __init__(self):
+        self.hits = dict.fromkeys(bins(), 0)
+        self.rotor = LatencyModel()
+        self.mem = list(range(26))  # Plugboard, which keeps its contents through a reset
+        self.reset()
+
+    def reset(self):
+        """State after a reset of the design (the bins are kept)"""
+        self.rotor.reset()
+        self.plug_addr = 0
+        self.plug_limiter = 0
+
+    def clear(self):
+        """Empty the bins"""
+        self.hits = dict.fromkeys(self.hits, 0)
+
+    def hit(self, name:str):
+        self.hits[name] += 1
+
+    def command(self, cmd:Cmd, din:int):
+        """Count a command taken by the design"""
+        cmd = Cmd(cmd)
+        if cmd == Cmd.SCRAMBLE:
+            self.scramble()
+        elif cmd == Cmd.LOAD_PLUG_ADDR:
+            self.plug_addr = din
+        elif cmd == Cmd.LOAD_PLUG_DATA and self.plug_limiter >> 1 < PLUG_LIMIT:
+            if self.plug_addr != din:
+                self.plug_limiter += 1
+                if self.plug_limiter >> 1 == PLUG_LIMIT:
+                    self.hit('plug limit')
+            if self.plug_addr < 26:
+                self.mem[self.plug_addr] = din
+        self.rotor.command(cmd, din)
+
+    def scramble(self):
+        rotor = self.rotor
+        if rotor.is_at_turnover(0):
+            self.hit('rotor 0 turnover')
+        if rotor.double_step:
+            self.hit('double step')
+        names = list(Rotors)
+        for slot, rotor_type in enumerate(rotor.slots):
+            if rotor_type < len(names):
+                self.hit(f'{names[rotor_type]} in slot {slot}')
+        plugs = sum(self.mem[i] != i for i in range(26)) // 2
+        if plugs <= PLUG_LIMIT:
+            self.hit(f'{plugs} plugs')
+
+    def missing(self):
+        """Bins not hit yet"""
+        return [name for name, count in self.hits.items() if not count]
+
+    def done(self):
+        return not self.missing()
+
+    def report(self):
+        hit = len(self.hits) - len(self.missing())
+        lines = [f'Coverage: {hit}/{len(self.hits)} bins']
+        lines += [f'    {name:20} {count}' for name, count in self.hits.items()]
+        return '\n'.join(lines)
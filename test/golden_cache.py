@@ -0,0 +1,113 @@
+"""Content-addressed disk cache for the golden cipher text.
+
+An entry's name is the sha256 of everything the cipher text depends on:
+the rotor settings, plugboard, reflector, plain text, and the class and
+source of the golden model that computed it.  Editing the golden model
+therefore misses the cache instead of returning stale results.
+
+Each entry holds the number of letters (8 bytes, little-endian) and then
+the letters packed at 5 bits each.  Entries are written atomically, so
+simulations running in parallel can share a cache directory.  A hit
+touches the file, and once the directory grows past its size limit the
+least recently used entries are deleted.
+"""
+import hashlib, json, logging, os, sys
+from functools import lru_cache
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+HEADER_SIZE = 8
+
+
+def pack_letters(text:str):
+    """Pack upper-case letters into 5 bits each"""
+    nums = np.frombuffer(text.encode('ascii'), dtype=np.uint8) - ord('A')
+    bits = np.unpackbits(nums[:, None], axis=1)[:, 3:]
+    return len(nums).to_bytes(HEADER_SIZE, 'little') + np.packbits(bits).tobytes()
+
+
+def unpack_letters(data:bytes):
+    n = int.from_bytes(data[:HEADER_SIZE], 'little')
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8, offset=HEADER_SIZE))[:n*5].reshape(n, 5)
+    nums = np.packbits(np.pad(bits, ((0, 0), (3, 0))), axis=1).ravel()
+    return (nums + ord('A')).tobytes().decode('ascii')
+
+
+@lru_cache(maxsize=None)
+def source_hash(cls):
+    """sha256 of the source files of a golden model class and its bases"""
+    h = hashlib.sha256()
+    for path in sorted({sys.modules[c.__module__].__file__ for c in cls.__mro__ if c.__module__ != 'builtins'}):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+class GoldenCache:
+
+    def __init__(self, directory, max_bytes:int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, cls, rotors, reflector:str, plugboard, plain_text:str):
+        settings = json.dumps([rotors, reflector, plugboard, cls.__qualname__, source_hash(cls)]).encode()
+        h = hashlib.sha256(settings)
+        h.update(plain_text.encode('utf-8', 'surrogatepass'))
+        return h.hexdigest()
+
+    def path(self, key:str):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key:str):
+        """Return the cached cipher text, or None"""
+        try:
+            with open(self.path(key), 'rb') as f:
+                data = f.read()
+            os.utime(self.path(key))
+        except FileNotFoundError:
+            return None
+        return unpack_letters(data)
+
+    def put(self, key:str, cipher_text:str):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f'{path}.{os.getpid()}.tmp', 'wb') as f:
+            f.write(pack_letters(cipher_text))
+        os.replace(f'{path}.{os.getpid()}.tmp', path)
+        self.evict()
+
+    def evict(self):
+        """Delete the least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith('.tmp'):
+                    continue
+                try:
+                    st = os.stat(os.path.join(root, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime_ns, st.st_size, os.path.join(root, name)))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            logger.debug(f'Evicted {path} from the golden cache')
+
+    def cipher(self, cls, rotors, reflector:str, plugboard, plain_text:str):
+        """Return the cipher text of cls(rotors, reflector, plugboard) for
+           plain_text, from the cache if it is there
+        """
+        key = self.key(cls, rotors, reflector, plugboard, plain_text)
+        golden = self.get(key)
+        if golden is None:
+            golden = cls(rotors, reflector, plugboard=plugboard).process_message(plain_text)
+            self.put(key, golden)
+        return golden
@@ -0,0 +1,163 @@
+"""Ciphertext-only rotor order and start position search.
+
+Usage:
+    keysearch.py [options] <CIPHERTEXT>
+
+Options:
+    -h, --help              Show this screen
+    -d, --debug             Debug messages
+    --rotors=<types>        Rotor types to choose the order from [default: I,II,III,IV,V]
+    --rings=<mode>          zero: only ring settings AAA, all: every ring setting [default: zero]
+    --reflector=<type>      Reflector [default: B]
+    -j, --workers=<n>       Worker processes (default: all cores)
+    --top=<n>               Number of best keys to report [default: 10]
+    --checkpoint=<file>     Save progress to this JSON file, and resume from it if it exists
+
+Tries every rotor order and start position (and optionally ring setting) on
+the cipher text in CIPHERTEXT, without a plugboard, and ranks the candidate
+decrypts by their index of coincidence.  Each worker takes one rotor order
+and ring setting, and scores all 26^3 start positions at once with the
+full-cycle permutation tables.
+"""
+import json, logging, os, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import permutations, product
+from multiprocessing import shared_memory
+
+import numpy as np
+from docopt import docopt
+
+from defines import Rotors
+from enigma import Enigma, letter_to_num, num_to_letter
+from enigma_np import permutation_table, rotor_positions, letters_in
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the number of (start position, letter) elements that a
+# worker pushes through the tables at once
+SCORE_ELEMENTS = 1 << 20
+
+# All 26^3 start positions, as rows s0, s1, s2
+ALL_STARTS = np.indices((26, 26, 26)).reshape(3, -1)
+
+
+def index_of_coincidence(letters:np.ndarray):
+    """Index of coincidence of each row of an (N, n) array of letter numbers"""
+    rows, n = letters.shape
+    counts = np.bincount((np.arange(rows)[:, None]*26 + letters).ravel(), minlength=rows*26)
+    counts = counts.reshape(rows, 26)
+    return (counts*(counts - 1)).sum(axis=1) / max(n*(n - 1), 1)
+
+
+def ring_settings(mode:str):
+    if mode == 'zero':
+        return [(0, 0, 0)]
+    elif mode == 'all':
+        # The leftmost rotor's ring setting only shifts its start position
+        # (it never carries), so it is left at 0
+        return [(r0, r1, 0) for r0, r1 in product(range(26), repeat=2)]
+    raise ValueError(f'Unknown ring setting mode {mode}')
+
+
+def to_key(order, starts, rings):
+    """Convert a candidate to the rotor list taken by Enigma()"""
+    return [(rotor, num_to_letter(start), ring) for rotor, start, ring in zip(order, starts, rings)]
+
+
+# Cipher text shared by all the workers, attached in _attach
+_shm = None
+_ciphertext = None
+
+def _attach(name:str, length:int):
+    global _shm, _ciphertext
+    _shm = shared_memory.SharedMemory(name=name)
+    _ciphertext = np.ndarray((length,), dtype=np.uint8, buffer=_shm.buf)
+
+
+def score_starts(ciphertext:np.ndarray, order, rings, reflector:str, top:int):
+    """Score every start position of one rotor order and ring setting, and
+       return the best [score, key] pairs
+    """
+    c = ciphertext.astype(np.int64)
+    table = permutation_table(tuple(order), reflector)
+    turnovers = [letter_to_num[Enigma.ROTORS[rotor].turnover] for rotor in order[:2]]
+    rings = np.array(rings)[:, None, None]
+
+    scores = np.empty(ALL_STARTS.shape[1])
+    block = max(1, SCORE_ELEMENTS // max(len(c), 1))
+    for i in range(0, ALL_STARTS.shape[1], block):
+        starts = ALL_STARTS[:, i:i+block, None]
+        positions, _ = rotor_positions(starts, turnovers, len(c))
+        offsets = (positions - rings) % 26
+        scores[i:i+block] = index_of_coincidence(table[offsets[0], offsets[1], offsets[2], c])
+
+    best = np.argsort(scores)[::-1][:top]
+    return [[float(scores[j]), to_key(order, ALL_STARTS[:, j].tolist(), rings.ravel().tolist())] for j in best]
+
+
+def _score_unit(order, rings, reflector, top):
+    return score_starts(_ciphertext, order, rings, reflector, top)
+
+
+def unit_name(order, rings):
+    return f'{"-".join(order)}/{",".join(map(str, rings))}'
+
+
+def search(ciphertext, rotor_types=list(Rotors), rings=[(0, 0, 0)], reflector='B',
+           workers=None, top=10, checkpoint=None):
+    """Search rotor orders, ring settings and start positions for the key of
+       ciphertext (str or bytes).  Returns the top [score, key] pairs, best first.
+
+       If checkpoint is a file name, progress is saved there after every
+       rotor order/ring setting, and work already in it is skipped.
+    """
+    c = letters_in(ciphertext.encode() if isinstance(ciphertext, str) else ciphertext)
+    units = {unit_name(order, r): (order, r) for order, r in product(permutations(rotor_types, 3), rings)}
+
+    state = {'done': [], 'best': []}
+    if checkpoint and os.path.exists(checkpoint):
+        with open(checkpoint) as f:
+            state = json.load(f)
+        logger.info(f'Resuming from {checkpoint}: {len(state["done"])} of {len(units)} done')
+    pending = [name for name in units if name not in state['done']]
+
+    shm = shared_memory.SharedMemory(create=True, size=max(len(c), 1))
+    try:
+        np.ndarray((len(c),), dtype=np.uint8, buffer=shm.buf)[:] = c
+        t_start = time.perf_counter()
+        with ProcessPoolExecutor(workers, initializer=_attach, initargs=(shm.name, len(c))) as pool:
+            futures = {pool.submit(_score_unit, *units[name], reflector, top): name for name in pending}
+            for i, future in enumerate(as_completed(futures), 1):
+                state['best'] = sorted(state['best'] + future.result(), key=lambda x: x[0], reverse=True)[:top]
+                state['done'].append(futures[future])
+                if checkpoint:
+                    with open(checkpoint + '.tmp', 'w') as f:
+                        json.dump(state, f)
+                    os.replace(checkpoint + '.tmp', checkpoint)
+
+                keys = i*ALL_STARTS.shape[1]
+                elapsed = time.perf_counter() - t_start
+                logger.info(f'{futures[future]} done ({len(state["done"])}/{len(units)}), '
+                            f'{keys/elapsed:.0f} keys/s, best {state["best"][0][0]:.4f}')
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return state['best']
+
+
+if __name__ == '__main__':
+    args = docopt(__doc__)
+    logging.basicConfig(level=logging.DEBUG if args['--debug'] else logging.INFO)
+
+    with open(args['<CIPHERTEXT>'], 'rb') as f:
+        ciphertext = f.read()
+    best = search(ciphertext,
+                  rotor_types=args['--rotors'].split(','),
+                  rings=ring_settings(args['--rings']),
+                  reflector=args['--reflector'],
+                  workers=int(args['--workers']) if args['--workers'] else None,
+                  top=int(args['--top']),
+                  checkpoint=args['--checkpoint'])
+    for score, key in best:
+        print(f'{score:.5f} {key}')
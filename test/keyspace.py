@@ -0,0 +1,144 @@
+"""Equivalence classes of Enigma keys for a given message length.
+
+Usage:
+    keyspace.py [options] <LENGTH>
+
+Options:
+    -h, --help              Show this screen
+    --rotors=<types>        Rotor types to choose the order from [default: I,II,III,IV,V]
+
+For a message of n letters, the cipher text of a key only depends on:
+ - the offset (position minus ring setting) of each rotor, which picks the
+   wiring every key press goes through, as in permutation_table
+ - the press on which rotor 0 first carries into rotor 1, if that is within
+   the message (later carries follow every 26 presses)
+ - the press on which the first double step happens, if that is within the
+   message (later ones follow every DOUBLE_STEP_PERIOD presses)
+
+Rotor 2 never carries, so its ring setting is redundant with its start
+position (26x fewer keys for any length).  For short messages most start
+positions of rotors 0 and 1 never reach a carry or double step either, so
+the classes shrink much further.
+
+canonical() maps keys to their class, and representatives() gives one key
+of every class, so an exhaustive search over representatives covers every
+cipher text that the full key space can produce.  The plugboard is not
+part of this and applies to every class alike.  The command prints the
+number of classes against the number of keys for a message length.
+"""
+from itertools import permutations
+
+import numpy as np
+from docopt import docopt
+
+from enigma import Enigma, first_steps, letter_to_num, num_to_letter
+
+
+def canonical(starts, rings, turnovers, n:int):
+    """Return the class of each key as rows (offset0, offset1, offset2,
+       first carry, first double step), for a message of n letters.  The
+       presses are counted from 1, and 0 means it does not happen within
+       the message.
+
+       starts and rings are the values of rotors 0-2 and turnovers those of
+       rotors 0 and 1, as in enigma_np.rotor_positions.  They can be arrays
+       to classify many keys at once.
+    """
+    first_carry, first_landing = first_steps(starts, turnovers)
+    # The double step is the press after the landing
+    first_double_step = first_landing + 1
+    offsets = [(s - r) % 26 for s, r in zip(starts, rings)]
+    return np.stack(np.broadcast_arrays(
+        *offsets,
+        np.where(first_carry <= n, first_carry, 0),
+        np.where(first_double_step <= n, first_double_step, 0),
+    ))
+
+
+def settings(classes, turnovers):
+    """Return (starts, rings) of the representative keys of classes (rows
+       as returned by canonical).  Rotor 2 always gets ring setting 0.
+    """
+    o0, o1, o2, carry, double_step = np.asarray(classes)
+    t0, t1 = turnovers
+    # The inverse of first_steps.  A carry that does not happen is put on
+    # press 26, past the message
+    s0 = np.where(carry > 0, t0 - carry + 1, t0 + 1) % 26
+    # Likewise, a double step that does not happen gets the most carries
+    # before it: rotor 1 starts on its turnover letter
+    carries_before = np.where(double_step > 0, (double_step - carry - 1)//26, 25)
+    s1 = (t1 - 1 - carries_before) % 26
+    starts = np.stack([s0, s1, o2])
+    rings = np.stack([(s0 - o0) % 26, (s1 - o1) % 26, np.zeros_like(o2)])
+    return starts, rings
+
+
+def steppings(n:int):
+    """All (first carry, first double step) pairs that a message of n
+       letters can tell apart, as two arrays
+    """
+    pairs = [] if n >= 26 else [(0, 0)]
+    for carry in range(1, min(n, 26) + 1):
+        # Rotor 1 lands on its turnover after 1-26 carries
+        last = carry + 26*25 + 1
+        pairs += [(carry, d) for d in range(carry + 1, min(n, last) + 1, 26)]
+        if last > n:
+            pairs.append((carry, 0))
+    return np.array(pairs, dtype=np.int64).reshape(-1, 2).T
+
+
+def num_classes(n:int):
+    """Number of key classes of one rotor order for a message of n letters"""
+    return 26**3 * steppings(n).shape[1]
+
+
+def representatives(turnovers, n:int):
+    """Return (starts, rings) of one key of every class, as (3, N) arrays,
+       for a rotor order with these turnovers and a message of n letters
+    """
+    carry, double_step = steppings(n)
+    offsets = np.indices((26, 26, 26)).reshape(3, 1, -1)
+    classes = np.broadcast_arrays(*offsets, carry[:, None], double_step[:, None])
+    return settings([c.ravel() for c in classes], turnovers)
+
+
+def order_turnovers(order):
+    return [letter_to_num[Enigma.ROTORS[rotor].turnover] for rotor in order[:2]]
+
+
+def to_key(order, starts, rings):
+    """Convert a start/ring setting to the rotor list taken by Enigma()"""
+    return [(rotor, num_to_letter(int(s)), int(r)) for rotor, s, r in zip(order, starts, rings)]
+
+
+def canonical_key(rotors, n:int):
+    """Class of a key (rotors as taken by Enigma()) as a hashable tuple"""
+    order = tuple(rotor for rotor, _, _ in rotors)
+    starts = [letter_to_num[start] for _, start, _ in rotors]
+    rings = [ring for _, _, ring in rotors]
+    return (order, *map(int, canonical(starts, rings, order_turnovers(order), n)))
+
+
+def representative(rotors, n:int):
+    """The representative key of the class of rotors"""
+    order, *classes = canonical_key(rotors, n)
+    starts, rings = settings(classes, order_turnovers(order))
+    return to_key(order, starts, rings)
+
+
+def keys(rotor_types, n:int):
+    """Yield one key (rotors as taken by Enigma()) of every class, for every
+       rotor order from rotor_types and a message of n letters
+    """
+    for order in permutations(rotor_types, 3):
+        starts, rings = representatives(order_turnovers(order), n)
+        for i in range(starts.shape[1]):
+            yield to_key(order, starts[:, i], rings[:, i])
+
+
+if __name__ == '__main__':
+    args = docopt(__doc__)
+    n = int(args['<LENGTH>'])
+    orders = len(list(permutations(args['--rotors'].split(','), 3)))
+    classes, keys_total = orders*num_classes(n), orders*26**6
+    print(f'{n} letters: {classes} classes for {keys_total} keys ({keys_total/classes:.1f}x fewer)')
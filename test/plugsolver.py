@@ -0,0 +1,149 @@
+"""Recover the plugboard by hill-climbing, once the rotor settings are known.
+
+Usage:
+    plugsolver.py [options] ngrams <CORPUS> <DIR>
+    plugsolver.py [options] solve <CIPHERTEXT> <DIR>
+
+Options:
+    -h, --help              Show this screen
+    -d, --debug             Debug messages
+    --rotors=<types>        Rotor types, rotor 0 first [default: I,II,III]
+    --start=<letters>       Start positions, rotor 0 first [default: PFB]
+    --rings=<nums>          Ring settings, rotor 0 first [default: 18,5,24]
+    --reflector=<type>      Reflector [default: B]
+    --max-plugs=<n>         Most plug wires to try (default: PLUG_LIMIT)
+
+The ngrams command builds bigram and trigram log-probability tables from a
+training text into DIR.  The solve command loads them (memory-mapped) and
+searches for the plugboard of the cipher text in CIPHERTEXT.
+
+The rotor settings are fixed, so the scrambler permutation of every key
+press is looked up once from the full-cycle permutation table.  Trying a
+plugboard is then just conjugating those permutations with it, which is
+two array gathers per candidate instead of a full Enigma run.
+"""
+import logging, os
+from itertools import combinations
+
+import numpy as np
+from docopt import docopt, DocoptExit
+
+from defines import PLUG_LIMIT
+from enigma import Enigma, num_to_letter, parse_rotors
+from enigma_np import EnigmaNP, letters_in, rotor_positions
+
+logger = logging.getLogger(__name__)
+
+
+def build_ngram_tables(corpus, directory):
+    """Count the bigrams and trigrams of a training text (str or bytes) and
+       save their log10 probabilities as bigrams.npy and trigrams.npy
+    """
+    c = letters_in(corpus.encode() if isinstance(corpus, str) else corpus).astype(np.int64)
+    os.makedirs(directory, exist_ok=True)
+    for name, n in [('bigrams', 2), ('trigrams', 3)]:
+        index = sum(c[i:len(c)-n+1+i]*26**(n-1-i) for i in range(n))
+        # Add-one smoothing so unseen n-grams are unlikely, not impossible
+        counts = np.bincount(index, minlength=26**n) + 1.0
+        table = np.log10(counts / counts.sum()).astype(np.float32).reshape((26,)*n)
+        np.save(os.path.join(directory, f'{name}.npy'), table)
+
+
+def load_ngram_tables(directory):
+    """Return the (bigram, trigram) tables, memory-mapped from directory"""
+    return tuple(np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')
+                 for name in ['bigrams', 'trigrams'])
+
+
+def to_pairs(plugs:np.ndarray):
+    """Convert a plug array to the list of pairs taken by Enigma()"""
+    return [num_to_letter(a) + num_to_letter(b) for a, b in enumerate(plugs) if a < b]
+
+
+class PlugboardSolver:
+
+    def __init__(self, ciphertext, rotors, reflector, ngrams, max_plugs=PLUG_LIMIT):
+        """rotors are the known rotor settings, as taken by Enigma()"""
+        self.c = letters_in(ciphertext.encode() if isinstance(ciphertext, str) else ciphertext).astype(np.int64)
+        self.bigrams, self.trigrams = (np.asarray(t) for t in ngrams)
+        self.max_plugs = max_plugs
+
+        # Scrambler permutation for each key press of the message
+        machine = EnigmaNP(rotors, reflector)
+        positions, _ = rotor_positions([r.ptr for r in machine.rotors], machine.turnovers[:2], len(self.c))
+        offsets = [(positions[i] - r.ring_setting) % 26 for i, r in enumerate(machine.rotors)]
+        self.perms = machine.table[offsets[0], offsets[1], offsets[2]]
+        self.index = np.arange(len(self.c))
+
+    def decrypt(self, plugs:np.ndarray):
+        return plugs[self.perms[self.index, plugs[self.c]]]
+
+    def score(self, plugs:np.ndarray, table:np.ndarray):
+        p = self.decrypt(plugs)
+        if table.ndim == 2:
+            return float(table[p[:-1], p[1:]].sum())
+        return float(table[p[:-2], p[1:-1], p[2:]].sum())
+
+    def candidates(self, plugs:np.ndarray):
+        """Yield every plugboard one change away: adding, removing or moving
+           a wire, or swapping the ends of two wires
+        """
+        num_plugs = int((plugs != np.arange(26)).sum()) // 2
+        for a, b in combinations(range(26), 2):
+            new = plugs.copy()
+            x, y = plugs[a], plugs[b]
+            if x == b:
+                new[a], new[b] = a, b                  # Remove the a-b wire
+            elif x == a and y == b:
+                if num_plugs >= self.max_plugs:
+                    continue
+                new[a], new[b] = b, a                  # New a-b wire
+            elif x != a and y != b:
+                new[a], new[b], new[x], new[y] = b, a, y, x   # a-x, b-y become a-b, x-y
+            else:
+                # Move the wire that is on one of a and b over to the pair
+                moved = x if x != a else y
+                new[moved] = moved
+                new[a], new[b] = b, a
+            yield new
+
+    def climb(self, plugs:np.ndarray, table:np.ndarray):
+        best = self.score(plugs, table)
+        improved = True
+        while improved:
+            improved = False
+            for candidate in self.candidates(plugs):
+                s = self.score(candidate, table)
+                if s > best:
+                    best, plugs, improved = s, candidate, True
+        return plugs, best
+
+    def solve(self):
+        """Return the most likely plug pairs and their trigram score"""
+        plugs = np.arange(26)
+        # Bigrams get the climb going from far away, trigrams finish it off
+        plugs, _ = self.climb(plugs, self.bigrams)
+        plugs, score = self.climb(plugs, self.trigrams)
+        logger.info(f'Best plugboard {to_pairs(plugs)}, score {score:.1f}')
+        return to_pairs(plugs), score
+
+
+if __name__ == '__main__':
+    args = docopt(__doc__)
+    logging.basicConfig(level=logging.DEBUG if args['--debug'] else logging.INFO)
+
+    if args['ngrams']:
+        with open(args['<CORPUS>'], 'rb') as f:
+            build_ngram_tables(f.read(), args['<DIR>'])
+    else:
+        try:
+            rotors = parse_rotors(args['--rotors'], args['--start'], args['--rings'])
+        except ValueError as e:
+            raise DocoptExit(str(e))
+        with open(args['<CIPHERTEXT>'], 'rb') as f:
+            ciphertext = f.read()
+        max_plugs = int(args['--max-plugs']) if args['--max-plugs'] else PLUG_LIMIT
+        plugs, score = PlugboardSolver(ciphertext, rotors, args['--reflector'],
+                                       load_ngram_tables(args['<DIR>']), max_plugs).solve()
+        print(' '.join(plugs))
+        print(Enigma(rotors, args['--reflector'], plugs).process_message(ciphertext.decode('ascii', 'ignore')))
@@ -0,0 +1,180 @@
+"""Run the cocotb regression as shards across parallel simulator processes.
+
+Usage:
+    regress.py [options]
+    regress.py [options] reproduce <SEED>
+
+Options:
+    -h, --help              Show this screen
+    -j, --jobs=<n>          Simulations to run at once (default: all cores)
+    --seed=<n>              Master seed the shard seeds come from (default: random)
+    --keys=<n>              Random keys in total [default: 10]
+    --keys-per-shard=<n>    Random keys run by each shard [default: 1]
+    --length=<n>            Letters of random text per key [default: 10000]
+    --testcases=<names>     Other tests to run, one shard each [default: test_load,test_enigma_fixed]
+    --gates                 Gate-level simulation (GATES=yes)
+    --out=<dir>             Directory for the shards' builds, logs and results [default: sim_build/regress]
+    --junit=<file>          Combined JUnit report [default: results.xml]
+    --json=<file>           Combined JSON report [default: results.json]
+
+The random keys of test_enigma_randomx10 are independent, so they are
+split into shards of --keys-per-shard keys.  Every shard is a separate
+simulation with its own SIM_BUILD and working directory (for its VCD,
+results.xml and log) under --out, and its own RANDOM_SEED, drawn from
+the master seed.  The other --testcases run as one shard each.
+
+The shards' results are merged into one JUnit file (one testsuite per
+shard) and a JSON summary, and the command is printed for every failing
+shard.  "reproduce <SEED>" runs a random shard again in the foreground,
+which is the same as:
+
+    RANDOM_SEED=<SEED> RANDOM_KEYS=<n> RANDOM_LENGTH=<n> make -B TESTCASE=test_enigma_randomx10
+"""
+import json, logging, os, subprocess, sys, time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from random import Random
+
+from docopt import docopt
+
+logger = logging.getLogger(__name__)
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+RANDOM_TESTCASE = 'test_enigma_randomx10'
+
+
+@dataclass
+class Shard:
+    name: str
+    testcase: str
+    seed: int
+    env: dict = field(default_factory=dict)   # Extra environment of the test
+    returncode: int = None
+    seconds: float = None
+    tests: int = 0
+    failures: int = 0
+
+    def reproduce(self, gates=False):
+        """Command line that runs this shard again from the test directory"""
+        env = ' '.join(f'{k}={v}' for k, v in {'RANDOM_SEED': self.seed, **self.env}.items())
+        return f'{env} make -B TESTCASE={self.testcase}' + (' GATES=yes' if gates else '')
+
+
+def random_shard(seed:int, keys:int, length:int, name=None):
+    return Shard(name or f'random_{seed}', RANDOM_TESTCASE, seed,
+                 {'RANDOM_KEYS': str(keys), 'RANDOM_LENGTH': str(length)})
+
+
+def plan(master_seed:int, keys:int=10, keys_per_shard:int=1, length:int=10000, testcases=()):
+    """Split the regression into shards, with seeds drawn from master_seed"""
+    rng = Random(master_seed)
+    shards = [Shard(testcase, testcase, rng.randrange(2**32)) for testcase in testcases]
+    for i, start in enumerate(range(0, keys, keys_per_shard)):
+        shards.append(random_shard(rng.randrange(2**32), min(keys_per_shard, keys - start), length,
+                                   name=f'random{i}'))
+    return shards
+
+
+def run_shard(shard:Shard, out_dir, gates=False, make='make'):
+    """Run one shard in its own directory under out_dir and fill in its
+       results from the results.xml it writes
+    """
+    shard_dir = os.path.abspath(os.path.join(out_dir, shard.name))
+    os.makedirs(shard_dir, exist_ok=True)
+    results = os.path.join(shard_dir, 'results.xml')
+    if os.path.exists(results):
+        os.remove(results)
+
+    # The Makefile finds tb.v and the sources from PWD, and the simulator
+    # writes its VCD and results to the working directory
+    env = {**os.environ, **shard.env,
+           'PWD': TEST_DIR,
+           'PYTHONPATH': os.pathsep.join([TEST_DIR, os.path.join(TEST_DIR, '..', 'src'), os.environ.get('PYTHONPATH', '')]),
+           'RANDOM_SEED': str(shard.seed),
+           'TESTCASE': shard.testcase,
+           'COCOTB_RESULTS_FILE': results}
+    args = [make, '-B', '-f', os.path.join(TEST_DIR, 'Makefile'), f'SIM_BUILD={os.path.join(shard_dir, "build")}']
+    if gates:
+        args.append('GATES=yes')
+
+    logger.info(f'{shard.name}: started ({shard.reproduce(gates)})')
+    t_start = time.perf_counter()
+    with open(os.path.join(shard_dir, 'sim.log'), 'w') as log:
+        shard.returncode = subprocess.run(args, cwd=shard_dir, env=env, stdout=log, stderr=subprocess.STDOUT).returncode
+    shard.seconds = time.perf_counter() - t_start
+
+    shard.tests, shard.failures = 0, 0
+    if os.path.exists(results):
+        for testcase in ET.parse(results).iter('testcase'):
+            shard.tests += 1
+            shard.failures += testcase.find('failure') is not None or testcase.find('error') is not None
+    logger.info(f'{shard.name}: {shard.tests} tests, {shard.failures} failed in {shard.seconds:.1f}s')
+    return shard
+
+
+def passed(shard:Shard):
+    # make succeeds even when tests fail, and a simulator crash leaves no results
+    return shard.returncode == 0 and shard.tests > 0 and shard.failures == 0
+
+
+def junit_report(shards, out_dir):
+    """Merge the shards' results.xml into one JUnit tree, a testsuite per shard"""
+    root = ET.Element('testsuites', name='regress')
+    for shard in shards:
+        suite = ET.SubElement(root, 'testsuite', name=shard.name, tests=str(shard.tests),
+                              failures=str(shard.failures), time=f'{shard.seconds or 0:.3f}')
+        props = ET.SubElement(suite, 'properties')
+        ET.SubElement(props, 'property', name='random_seed', value=str(shard.seed))
+        results = os.path.join(out_dir, shard.name, 'results.xml')
+        if os.path.exists(results):
+            suite.extend(ET.parse(results).iter('testcase'))
+        if not passed(shard) and shard.failures == 0:
+            # No test failed, so the simulation itself did
+            case = ET.SubElement(suite, 'testcase', name=shard.testcase, classname=shard.name)
+            ET.SubElement(case, 'error', message=f'simulation exited with {shard.returncode}, see {shard.name}/sim.log')
+    return ET.ElementTree(root)
+
+
+def json_report(shards, master_seed:int, gates=False):
+    return {
+        'master_seed': master_seed,
+        'gates': gates,
+        'passed': all(passed(shard) for shard in shards),
+        'shards': [{**asdict(shard), 'passed': passed(shard), 'reproduce': shard.reproduce(gates)} for shard in shards],
+    }
+
+
+def run(shards, out_dir, jobs=None, gates=False, make='make'):
+    with ThreadPoolExecutor(jobs or os.cpu_count()) as pool:
+        return list(pool.map(lambda shard: run_shard(shard, out_dir, gates, make), shards))
+
+
+if __name__ == '__main__':
+    args = docopt(__doc__)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    gates = args['--gates']
+    keys_per_shard, length = int(args['--keys-per-shard']), int(args['--length'])
+
+    if args['reproduce']:
+        seed = int(args['<SEED>'])
+        shard = random_shard(seed, keys_per_shard, length)
+        logger.info(f'Reproducing: {shard.reproduce(gates)}')
+        sys.exit(subprocess.run(shard.reproduce(gates), shell=True, cwd=TEST_DIR).returncode)
+
+    master_seed = int(args['--seed']) if args['--seed'] else Random().randrange(2**32)
+    logger.info(f'Master seed {master_seed}')
+    shards = plan(master_seed, int(args['--keys']), keys_per_shard, length,
+                  [t for t in args['--testcases'].split(',') if t])
+    shards = run(shards, args['--out'], int(args['--jobs']) if args['--jobs'] else None, gates)
+
+    junit_report(shards, args['--out']).write(args['--junit'], encoding='unicode')
+    report = json_report(shards, master_seed, gates)
+    with open(args['--json'], 'w') as f:
+        json.dump(report, f, indent=2)
+
+    failed = [shard for shard in shards if not passed(shard)]
+    for shard in failed:
+        logger.error(f'{shard.name} failed, reproduce with: {shard.reproduce(gates)}')
+    logger.info(f'{len(shards) - len(failed)}/{len(shards)} shards passed (master seed {master_seed})')
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,293 @@
+"""Cycle-accurate Python model of the design in src/.
+
+EnigmaRTL steps the same registers as the hardware, one clock at a time:
+the Control FSM (src/fsm.py) with its slot counter and double step flag,
+the Rotor registers (cnts, ring_settings, slot and the registered dout),
+the plugboard latches with their address counter and plug_limiter, and
+the registered cipher output in src/top.py.  It has the pins of
+tt_um_virantha_enigma (src/project.v), and a get/set/tick interface like
+an Amaranth testbench context:
+
+    m = EnigmaRTL()
+    m.set('ui_in', Cmd.SCRAMBLE.value << 5 | 7)
+    m.tick()
+    m.get('uio_out')
+
+Everything the hardware computes combinationally, including its quirks,
+is computed the same way: out of range Array reads give 0, rotor
+positions are 5 bits, and the plugboard limiter blocks every write once
+PLUG_LIMIT plugs are in.  The latches power up as 0 here, while the real
+ones power up undefined, so write all 26 plugboard entries before use
+(as the testbenches do).
+"""
+from defines import Cmd, Din, PLUG_LIMIT, Rotors
+from enigma import Enigma, letter_to_num
+from lcd import SevenSegmentAlpha
+
+N = 3   # Rotor slots
+
+# Wiring of each rotor type, by the number SET_ROTORS takes, in both directions
+RTOL = [[letter_to_num[c] for c in Enigma.ROTORS[rotor].wiring] for rotor in Rotors]
+LTOR = [[w.index(i) for i in range(26)] for w in RTOL]
+TURNOVERS = [letter_to_num[Enigma.ROTORS[rotor].turnover] for rotor in Rotors]
+REFLECTOR = [letter_to_num[c] for c in Enigma.REFLECTORS['B'].wiring]
+
+
+def _read(table, index:int):
+    """An Array read in the hardware: 0 when the index is out of range"""
+    return table[index] if index < len(table) else 0
+
+
+# 7-segment pattern of each letter on uo_out
+SEGMENTS = list(SevenSegmentAlpha().letters.values())
+
+
+def add_mod_26(a:int, b:int):
+    s = a + b
+    return (s - 26 if s > 25 else s) & 0x1f
+
+def sub_mod_26(a:int, b:int):
+    return (26 - (b - a) if b > a else a - b) & 0x1f
+
+
+# Control outputs of each FSM state, as in Control.elaborate.  Outputs not
+# listed are 0, and 'active' is the rotor slot to enable (1-3, 0 for
+# none, None for the slot counter).
+STATE_OUTPUTS = {
+    'Initial':              {},
+    'Get command':          {'ready': 1},
+    'Load plug addr':       {'plugboard_wr_addr': 1},
+    'Load plug data':       {'plugboard_wr_data': 1},
+    'Delay plug':           {},
+    'Load start':           {'load_start': 1, 'active': None},
+    'Load ring':            {'load_ring': 1, 'active': None},
+    'Set rotors':           {'set_rotors': 1, 'active': None},
+    'Scramble':             {'active': 1, 'inc': 1, 'plugboard_en': 1},
+    'Rotor 0':              {'din_sel': Din.DIN.value, 'active': 1, 'plugboard_en': 1},
+    'Rotor 1':              {'din_sel': Din.DOUT.value, 'active': 2, 'plugboard_en': 1},
+    'Rotor 2':              {'din_sel': Din.DOUT.value, 'active': 3, 'plugboard_en': 1},
+    'Rotor 2 back':         {'din_sel': Din.REF.value, 'active': 3, 'is_ltor': 1, 'plugboard_en': 1},
+    'Rotor 1 back':         {'din_sel': Din.DOUT.value, 'active': 2, 'is_ltor': 1, 'plugboard_en': 1},
+    'Rotor 0 back':         {'din_sel': Din.DOUT.value, 'active': 1, 'is_ltor': 1, 'plugboard_en': 1},
+    'Delay':                {'is_ltor': 1, 'plugboard_en': 1, 'result_ready': 1},
+    'Delay 2':              {'is_ltor': 1, 'plugboard_en': 1},
+    'Inc Rotor 1':          {'active': 2, 'inc': 1},
+    'Check turnover':       {},
+    'Inc Rotor 2':          {'active': 3, 'inc': 1},
+    'Activate double step': {},
+}
+CONTROL_OUTPUTS = ['ready', 'result_ready', 'en', 'load_start', 'load_ring', 'set_rotors', 'inc',
+                   'is_ltor', 'din_sel', 'plugboard_wr_addr', 'plugboard_wr_data', 'plugboard_en']
+
+NEXT_STATE = {
+    'Initial': 'Get command',
+    'Load plug addr': 'Delay plug',
+    'Load plug data': 'Delay plug',
+    'Delay plug': 'Get command',
+    'Load start': 'Get command',
+    'Load ring': 'Get command',
+    'Set rotors': 'Get command',
+    'Rotor 0': 'Rotor 1',
+    'Rotor 1': 'Rotor 2',
+    'Rotor 2': 'Rotor 2 back',
+    'Rotor 2 back': 'Rotor 1 back',
+    'Rotor 1 back': 'Rotor 0 back',
+    'Rotor 0 back': 'Delay',
+    'Delay': 'Delay 2',
+    'Delay 2': 'Get command',
+    'Inc Rotor 1': 'Check turnover',
+    'Inc Rotor 2': 'Rotor 0',
+    'Activate double step': 'Rotor 0',
+}
+COMMAND_STATE = {
+    Cmd.RESET.value: 'Initial',
+    Cmd.LOAD_START.value: 'Load start',
+    Cmd.LOAD_RING.value: 'Load ring',
+    Cmd.SET_ROTORS.value: 'Set rotors',
+    Cmd.LOAD_PLUG_ADDR.value: 'Load plug addr',
+    Cmd.LOAD_PLUG_DATA.value: 'Load plug data',
+    Cmd.SCRAMBLE.value: 'Scramble',
+}
+# Every (state, next state) transition of the FSM
+TRANSITIONS = {
+    *NEXT_STATE.items(),
+    ('Get command', 'Get command'),
+    *(('Get command', state) for state in COMMAND_STATE.values()),
+    ('Scramble', 'Rotor 0'),
+    ('Scramble', 'Inc Rotor 1'),
+    ('Check turnover', 'Rotor 0'),
+    ('Check turnover', 'Activate double step'),
+    ('Check turnover', 'Inc Rotor 2'),
+}
+
+
+class ControlModel:
+    """The Control FSM"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.state = 'Initial'
+        self.cnt = 0            # Slot of the configuration commands, 1-3 (0 is none)
+        self.double_step = 0
+
+    def outputs(self):
+        """The Control outputs in the current state, as a dict"""
+        out = dict.fromkeys(CONTROL_OUTPUTS, 0)
+        out.update(STATE_OUTPUTS[self.state])
+        active = out.pop('active', 0)
+        if active is None:
+            active = self.cnt
+        out['en'] = 1 << (active - 1) if active else 0
+        return out
+
+    def tick(self, cmd:int, is_at_turnover:int):
+        state = self.state
+        if state == 'Get command':
+            if cmd in (Cmd.LOAD_START.value, Cmd.LOAD_RING.value, Cmd.SET_ROTORS.value):
+                self.cnt = (self.cnt + 1) & 0x3
+            self.state = COMMAND_STATE.get(cmd, state)
+        elif state == 'Scramble':
+            self.state = 'Inc Rotor 1' if self.double_step or is_at_turnover & 1 else 'Rotor 0'
+        elif state == 'Check turnover':
+            if self.double_step:
+                self.state = 'Inc Rotor 2'
+            else:
+                self.state = 'Activate double step' if is_at_turnover & 2 else 'Rotor 0'
+        else:
+            if state == 'Initial':
+                self.cnt, self.double_step = 0, 0
+            elif state in ('Load start', 'Load ring', 'Set rotors') and self.cnt == 3:
+                self.cnt = 0
+            elif state == 'Inc Rotor 2':
+                self.double_step = 0
+            elif state == 'Activate double step':
+                self.double_step = 1
+            self.state = NEXT_STATE[state]
+
+
+class EnigmaRTL:
+    """The whole design, on the pins of tt_um_virantha_enigma"""
+
+    INPUTS = ('ui_in', 'uio_in', 'ena', 'rst_n')
+
+    def __init__(self):
+        self.ui_in, self.uio_in, self.ena, self.rst_n = 0, 0, 1, 1
+        self.mem = [0]*26       # Plugboard latches
+        self.cycles = 0
+        self.control = ControlModel()
+        self.reset()
+
+    def reset(self):
+        """Registers after a clock edge with rst_n low (the latches keep their values)"""
+        self.control.reset()
+        self.cnts = [0]*N
+        self.ring_settings = [0]*N
+        self.slot = list(range(N))
+        self.dout = 0           # Rotor output register
+        self.plug_addr = 0      # Plugboard address counter
+        self.plug_limiter = 0
+        self.result = 0         # uio_out[0:5]
+
+    def set(self, pin:str, value:int):
+        assert pin in self.INPUTS, pin
+        setattr(self, pin, value)
+
+    def get(self, pin:str):
+        return getattr(self, pin)
+
+    @property
+    def ready(self):
+        return int(self.control.state == 'Get command')
+
+    @property
+    def uio_out(self):
+        return self.ready << 5 | self.result
+
+    @property
+    def uio_oe(self):
+        return 0xff
+
+    @property
+    def uo_out(self):
+        return _read(SEGMENTS, self.result)
+
+    def is_at_turnover(self):
+        return sum(1 << i for i in range(N) if self.cnts[i] == _read(TURNOVERS, self.slot[i]))
+
+    def tick(self, cycles:int=1):
+        for i in range(cycles):
+            self._tick()
+
+    def _tick(self):
+        self.cycles += 1
+        if not self.rst_n:
+            self.reset()
+            return
+
+        control = self.control
+        c = control.outputs()
+        din, cmd = self.ui_in & 0x1f, self.ui_in >> 5
+
+        # Plugboard read port, and the rotor input mux
+        addr = self.dout if c['is_ltor'] else din
+        plug_out = _read(self.mem, addr) if c['plugboard_en'] else addr
+        if c['din_sel'] == Din.DOUT.value:
+            muxed_din = self.dout
+        elif c['din_sel'] == Din.REF.value:
+            muxed_din = _read(REFLECTOR, self.dout)
+        else:
+            muxed_din = plug_out
+
+        # The enabled rotor's wiring.  With none enabled, everything reads 0
+        rotor = {1: 0, 2: 1, 4: 2}.get(c['en'])
+        if rotor is None:
+            cnt, ring, wiring = 0, 0, None
+        else:
+            cnt, ring, slot = self.cnts[rotor], self.ring_settings[rotor], self.slot[rotor]
+            wiring = _read(LTOR if c['is_ltor'] else RTOL, slot)
+        offset = sub_mod_26(cnt, ring)
+        right_ptr = add_mod_26(muxed_din, offset)
+        swizzled = _read(wiring, right_ptr) if wiring else 0
+        # Registers: the result first, as it samples the plugboard output
+        # before the latches are written
+        if cmd == Cmd.SCRAMBLE.value and c['result_ready']:
+            self.result = plug_out
+        is_at_turnover = self.is_at_turnover()
+        self.dout = sub_mod_26(swizzled, offset)
+
+        if rotor is not None:
+            if c['load_start']:
+                self.cnts[rotor] = muxed_din
+            elif c['load_ring']:
+                self.ring_settings[rotor] = muxed_din
+            elif c['set_rotors']:
+                self.slot[rotor] = muxed_din & 0x7
+            elif c['inc']:
+                self.cnts[rotor] = 0 if cnt == 25 else (cnt + 1) & 0x1f
+
+        # Plugboard writes
+        allow_plug = (self.plug_limiter >> 1) < PLUG_LIMIT
+        if c['plugboard_wr_data'] and allow_plug:
+            if self.plug_addr != din:
+                self.plug_limiter = (self.plug_limiter + 1) & 0x1f
+            if self.plug_addr < 26:
+                self.mem[self.plug_addr] = din
+        if c['plugboard_wr_addr']:
+            self.plug_addr = din
+
+        control.tick(cmd, is_at_turnover)
+
+    def send(self, cmd:Cmd, din:int=0):
+        """Set a command, clock until the FSM is ready again, and return the
+           cycles it took.  uio_out then holds the result of a SCRAMBLE.
+        """
+        assert self.ready
+        cmd = Cmd(cmd)
+        self.ui_in = cmd.value << 5 | din
+        start = self.cycles
+        self.tick()
+        while not self.ready and cmd != Cmd.NOP:
+            self.tick()
+        return self.cycles - start
@@ -6,13 +6,39 @@
 */
 module tb ();
 
-  // Dump the signals to a VCD file. You can view it with gtkwave or surfer.
+  // Dump the signals with +trace (make TRACE=vcd or TRACE=fst), to tb.vcd, or
+  // tb.fst with +fst.  You can view it with gtkwave or surfer.  TRACE_SCOPES
+  // limits the dump to those scopes, and with +trace_window it only runs
+  // while the test holds trace_en high.
+  reg trace_en = 1'b0;
+  reg tracing = 1'b0;
   initial begin
-    $dumpfile("tb.vcd");
-    $dumpvars(0, tb);
+    if ($test$plusargs("trace")) begin
+      if ($test$plusargs("fst"))
+        $dumpfile("tb.fst");
+      else
+        $dumpfile("tb.vcd");
+`ifdef TRACE_SCOPES
+      $dumpvars(0, `TRACE_SCOPES);
+`else
+      $dumpvars(0, tb);
+`endif
+      tracing = 1'b1;
+      if ($test$plusargs("trace_window"))
+        $dumpoff;
+    end
     #1;
   end
 
+  always @(trace_en) begin
+    if (tracing) begin
+      if (trace_en)
+        $dumpon;
+      else
+        $dumpoff;
+    end
+  end
+
   // Wire up the inputs and outputs:
   reg clk;
   reg rst_n;
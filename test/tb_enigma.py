@@ -1,11 +1,13 @@
+import os
 from amaranth import Const, Cat, unsigned
 from amaranth.sim import Simulator
 
 from src.top import Enigma
 from src.fsm import Cmd
+from src.defines import PLUG_LIMIT
 from .enigma import Enigma as EnigmaPy
 
-dut = Enigma()
+dut = Enigma(sim=True)
 
 plain = """
 Lorem ipsum dolor sit amet, consectetur adipiscing elit. Aliquam tempus justo ac
@@ -99,13 +101,20 @@ async def bench(ctx):
     my_enigma = EnigmaPy(
         [ list(x.values()) for x in rotors ],
         'B', # Reflector
-        plugboard = plugboard
+        # The design blocks the plugs past PLUG_LIMIT
+        plugboard = plugboard[:PLUG_LIMIT]
     )
     golden = my_enigma.process_message(plain)
     # Remove spaces from result
     golden = golden.replace(' ', '')
 
     await ready(ctx)
+    # The plugboard latches come up as zeros, so first wire every letter to itself
+    for i in range(26):
+        for cmd in (Cmd.LOAD_PLUG_ADDR, Cmd.LOAD_PLUG_DATA):
+            ctx.set(dut.ui_in, Cat(Const(i, unsigned(5)), Const(cmd)))
+            await ready(ctx)
+
     # Load the plugboard settings
     scan_values = [31]*20
     for a,b in plugboard: 
@@ -170,14 +179,14 @@ async def bench(ctx):
         if c >= 'A' and c <= 'Z':
             input_val = ord(c)-65
             val = Const(input_val, unsigned(5))
-            cmd = Const(Cmd.ENCRYPT)
+            cmd = Const(Cmd.SCRAMBLE)
             ctx.set(dut.ui_in, Cat(val,cmd) )    
             await ready(ctx)
             await clk(ctx)
 
             #cipher_val = ord(cipher[i]) - 65
             golden_val = ord(golden[i]) - 65
-            out_val = ctx.get(dut.uo_out[0:5])
+            out_val = ctx.get(dut.uio_out[0:5])
 
             print(f'Round {i}: Input {c} (0x{input_val:x} / {input_val}) -> {golden[i]} (0x{golden_val:x} / {golden_val}) expected, actual 0x{out_val:x} / {out_val}')
             #if not cipher_val == out_val: break
@@ -188,8 +197,17 @@ async def bench(ctx):
     print('Test passed!')
 
 
-sim = Simulator(dut)
-sim.add_clock(100e-6)
-sim.add_testbench(bench)
-with sim.write_vcd("output/enigma.vcd"):
-    sim.run()
+if __name__ == '__main__' and os.getenv('SIM') == 'cxxrtl':
+    # The same bench on the design compiled with CXXRTL
+    from .cxxrtl_sim import CxxrtlSim, run_testbench
+    run_testbench(CxxrtlSim(), dut, bench)
+elif __name__ == '__main__':
+    sim = Simulator(dut)
+    sim.add_clock(100e-6)
+    sim.add_testbench(bench)
+    # Waveforms only on request (TRACE=vcd), as they are most of the run time
+    if os.getenv('TRACE'):
+        with sim.write_vcd("output/enigma.vcd"):
+            sim.run()
+    else:
+        sim.run()
@@ -1,6 +1,9 @@
 
-from enigma import Enigma as EnigmaPy
-from random import randint, sample
+import os
+from enigma import Enigma as EnigmaPy, FastEnigma
+from enigma_np import EnigmaNP
+from golden_cache import GoldenCache
+from random import Random, randint, sample
 from defines import Rotors, PLUG_LIMIT
 
 plain = """
@@ -131,13 +134,54 @@ def get_random_plugboard_setting():
             i+=1
     return plugboard
 
-def get_golden_cipher(rotors, plugboard, plain_text):
-    my_enigma = EnigmaPy(
+def random_key(rng:Random, max_plugs:int=10):
+    """Random rotors and plugboard (0-max_plugs plugs), as taken by the golden model"""
+    rotors = [(t, chr(rng.randint(0, 25)+65), rng.randint(0, 25)) for t in rng.sample(list(Rotors), 3)]
+    letters = rng.sample([chr(i+65) for i in range(26)], 2*rng.randint(0, max_plugs))
+    plugboard = [a+b for a, b in zip(letters[::2], letters[1::2])]
+    return rotors, plugboard
+
+def random_text(rng:Random, length:int):
+    return ''.join(chr(rng.randint(0, 25)+65) for i in range(length))
+
+# Golden model implementations, selectable with the GOLDEN_ENGINE env variable
+GOLDEN_ENGINES = {
+    'scalar': EnigmaPy,
+    'numpy': EnigmaNP,
+    'fast': FastEnigma,
+}
+
+# Golden cipher texts are cached on disk (see golden_cache.py), so re-runs
+# with the same keys and text skip the golden model.  GOLDEN_CACHE_DIR=''
+# turns the cache off, GOLDEN_CACHE_SIZE is its size limit in bytes.
+DEFAULT_GOLDEN_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.golden_cache')
+DEFAULT_GOLDEN_CACHE_SIZE = 256 << 20
+
+def get_golden_cache():
+    directory = os.getenv('GOLDEN_CACHE_DIR', DEFAULT_GOLDEN_CACHE_DIR)
+    if not directory:
+        return None
+    return GoldenCache(directory, int(os.getenv('GOLDEN_CACHE_SIZE', DEFAULT_GOLDEN_CACHE_SIZE)))
+
+def get_golden_machine(rotors, plugboard, engine=None):
+    """A golden model loaded with a key, to encrypt text a piece at a time
+       (its rotors carry over from one process_message to the next)
+    """
+    engine = engine or os.getenv('GOLDEN_ENGINE', 'scalar')
+    return GOLDEN_ENGINES[engine](
         [ list(x.values()) for x in rotors ],
         'B', # Reflector
         plugboard = plugboard
     )
-    golden = my_enigma.process_message(plain_text)
+
+def get_golden_cipher(rotors, plugboard, plain_text, engine=None):
+    engine = engine or os.getenv('GOLDEN_ENGINE', 'scalar')
+    cache = get_golden_cache()
+    if cache:
+        rotors = [ list(x.values()) for x in rotors ]
+        golden = cache.cipher(GOLDEN_ENGINES[engine], rotors, 'B', list(plugboard), plain_text)
+    else:
+        golden = get_golden_machine(rotors, plugboard, engine).process_message(plain_text)
     # Remove spaces from result
     golden = golden.replace(' ', '')
     return golden
@@ -2,31 +2,82 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
+from dataclasses import dataclass
 import cocotb
+from cocotb.queue import Queue
 from cocotb.types import LogicArray
 from cocotb.clock import Clock
 from cocotb.binary import BinaryValue
-from cocotb.triggers import ClockCycles, RisingEdge, FallingEdge, Edge, ReadOnly, NextTimeStep
+from cocotb.triggers import ClockCycles, RisingEdge, FallingEdge, Timer, Event
 from random import randint
-from defines import Cmd, Rotors
+from defines import Cmd, Rotors, PLUG_LIMIT
 from tb_utils import *
-
-async def ready(dut):
-    # So janky because I can't just await an edge on a bit on 
-    # multi-bit output; cocotb+iverilog throws an error
-    # So instead, I need to wait for the entire bus to change
-    # then check the one bit I want
-    await ClockCycles(dut.clk,1,rising=True)
-    rdy = dut.uio_out
-    prev = rdy[5].value
-    while True:
-        await Edge(rdy)
-        await ReadOnly()
-        if prev==0 and rdy[5].value==1:
-            await NextTimeStep()
-            break # rising edge
-        else:
-            prev = rdy[5].value
+from vectors import directed_sets, load_vectors, vector_set
+from fsm_latency import LatencyModel
+from functional_coverage import Coverage
+
+# Clock period of every test, which ready() needs to wait out commands
+CLOCK_PERIOD_US = 10
+
+# Tracks the rotor state the FSM latencies depend on (see fsm_latency.py)
+latency = LatencyModel()
+
+# Functional coverage of every command sent (see functional_coverage.py)
+coverage = Coverage()
+
+# Set by send_command when a SCRAMBLE is done, with its input letter as data
+scrambled = Event()
+
+class TraceWindow:
+    """Holds the waveform dump on (trace_en, with TRACE_LETTERS=<first>:<last>)
+       while send_command scrambles letters first to last.  They are numbered
+       from restart(), which Env and run_vectors call, like their rounds.
+    """
+    def __init__(self):
+        letters = os.getenv('TRACE_LETTERS')
+        self.window = tuple(int(x) for x in letters.split(':')) if letters else None
+        self.restart()
+
+    def restart(self):
+        self.letters = 0
+
+    def scramble(self, dut):
+        """Count a SCRAMBLE about to be sent"""
+        if self.window is not None:
+            first, last = self.window
+            if self.letters == first:
+                dut.trace_en.value = 1
+            elif self.letters == last + 1:
+                dut.trace_en.value = 0
+        self.letters += 1
+
+trace_window = TraceWindow()
+
+async def ready(dut, cycles:int):
+    """Wait until the FSM is ready again, cycles after taking a command.
+
+       Commands are set up on the falling edge of the clock and taken on the
+       next rising edge, so a single timer of cycles clock periods lands on
+       the falling edge of the cycle the FSM is back to ready.  With
+       CHECK_LATENCY set, ready is checked there, and only there.
+    """
+    if cycles == 0:
+        return
+    await Timer(cycles*CLOCK_PERIOD_US, units='us')
+    if os.getenv('CHECK_LATENCY'):
+        assert dut.uio_out.value.integer >> 5 & 1, f'Not ready {cycles} cycles after the command'
+
+async def send_command(dut, cmd:Cmd, val:int):
+    """Set a command while the FSM is ready and wait until it is done (a
+       cycle for a NOP, which the FSM takes by staying ready)
+    """
+    if cmd == Cmd.SCRAMBLE:
+        trace_window.scramble(dut)
+    dut.ui_in.value = get_ui_in(cmd.value, val)
+    coverage.command(cmd, val)
+    await ready(dut, latency.command(cmd, val) or 1)
+    if cmd == Cmd.SCRAMBLE:
+        scrambled.set(val)
 
 async def reset(dut):
     # Reset
@@ -38,6 +89,10 @@ async def reset(dut):
     await ClockCycles(dut.clk, 10)
     dut.rst_n.value = 1
     await ClockCycles(dut.clk, 1)
+    latency.reset()
+    coverage.reset()
+    # Line up with the falling edges that ready() waits for
+    await FallingEdge(dut.clk)
 
 def get_ui_in(cmd, val):
     cmd = BinaryValue(value=cmd, n_bits=3, bigEndian=False) 
@@ -53,7 +108,7 @@ async def test_load(dut):
         return
 
     # Set the clock period to 10 us (100 KHz)
-    clock = Clock(dut.clk, 10, units="us")
+    clock = Clock(dut.clk, CLOCK_PERIOD_US, units="us")
     cocotb.start_soon(clock.start())
 
     await reset(dut)
@@ -70,28 +125,20 @@ async def test_load(dut):
     prev_r2 = None
     for r0, r1, r2 in zip(*start_vals):
 
-        cmd = 1
-        val = get_ui_in(cmd,r0)
-        dut.ui_in.value = val
-        dut._log.info(f"Rotor 0: BINARY VALUE {val}")
-        
-        await ready(dut)
+        dut._log.info(f"Rotor 0: BINARY VALUE {get_ui_in(Cmd.LOAD_START.value, r0)}")
+        await send_command(dut, Cmd.LOAD_START, r0)
         if prev_r2:
             assert rotor.cnts_debug2.value == prev_r2
             #assert rotor.cnts[2].value == prev_r2
 
-        val = get_ui_in(cmd,r1)
-        dut.ui_in.value = val
-        dut._log.info(f"Rotor 1: BINARY VALUE {val}")
-        await ready(dut)
+        dut._log.info(f"Rotor 1: BINARY VALUE {get_ui_in(Cmd.LOAD_START.value, r1)}")
+        await send_command(dut, Cmd.LOAD_START, r1)
         assert rotor.cnts_debug0.value == r0
         #assert rotor.cnts[0].value == r0
 
 
-        val = get_ui_in(cmd,r2)
-        dut.ui_in.value = val
-        dut._log.info(f"Rotor 2: BINARY VALUE {val}")
-        await ready(dut)
+        dut._log.info(f"Rotor 2: BINARY VALUE {get_ui_in(Cmd.LOAD_START.value, r2)}")
+        await send_command(dut, Cmd.LOAD_START, r2)
         assert rotor.cnts_debug1.value == r1
         #assert rotor.cnts[1].value == r1
         prev_r2 = r2
@@ -100,37 +147,20 @@ async def test_load(dut):
 
 async def set_plugboard_setting(dut, a,b):
     dut._log.info(f"Setting plugboard {a} -> {b}")
-
-    cmd = Cmd.LOAD_PLUG_ADDR.value
-    val = to_val(a)
-    dut.ui_in.value = get_ui_in(cmd, val) 
-    await ready(dut)
-
-    cmd = Cmd.LOAD_PLUG_DATA.value
-    val = to_val(b)
-    dut.ui_in.value = get_ui_in(cmd, val) 
-    await ready(dut)
-
-    return
+    await send_command(dut, Cmd.LOAD_PLUG_ADDR, to_val(a))
+    await send_command(dut, Cmd.LOAD_PLUG_DATA, to_val(b))
 
 async def set_rotor_setting(dut, rotor_num, letter_setting):
     dut._log.info(f"Setting Rotor{rotor_num} start to {letter_setting}")
-    cmd = Cmd.LOAD_START.value
-    val = to_val(letter_setting)
-    dut.ui_in.value = get_ui_in(cmd, val) 
-    await ready(dut)
+    await send_command(dut, Cmd.LOAD_START, to_val(letter_setting))
 
 async def set_ring_setting(dut, rotor_num, val:int):
     dut._log.info(f"Setting Rotor{rotor_num} Ring setting to {val}")
-    cmd = Cmd.LOAD_RING.value
-    dut.ui_in.value = get_ui_in(cmd, val) 
-    await ready(dut)
+    await send_command(dut, Cmd.LOAD_RING, val)
 
 async def select_rotors(dut, rotor_num, rotor_type):
     dut._log.info(f"Setting Rotor{rotor_num} type to Rotor TYPE {rotor_type}")
-    cmd = Cmd.SET_ROTORS.value
-    dut.ui_in.value = get_ui_in(cmd, rotor_type) 
-    await ready(dut)
+    await send_command(dut, Cmd.SET_ROTORS, rotor_type)
 
 def iter_plain_text(plain):
     for c in plain:
@@ -140,56 +170,163 @@ def iter_plain_text(plain):
             yield c, input_val
 
 
-async def run_cipher(dut, rotors, plugboard, plain):
-    golden = get_golden_cipher(rotors, plugboard, plain)
-    IS_GATES = os.getenv('GATES')
-
-    # Reset the plugboard
-    for i in range(26):
-        await set_plugboard_setting(dut, to_letter(i), to_letter(i))
-
-    for a,b in plugboard:
-        await set_plugboard_setting(dut, a, b)
-        await set_plugboard_setting(dut, b, a)
-
-    rotor_types = Rotors
-    for rotor_num, rotor_type in enumerate(rotors):
-        await select_rotors(dut, rotor_num, rotor_types[rotor_type['type']])
-
-
-    for rotor_num, rotor in enumerate(rotors):
-        await set_rotor_setting(dut, rotor_num, rotor['start'])
-
-    for rotor_num, rotor in enumerate(rotors):
-        await set_ring_setting(dut, rotor_num, rotor['ring'])
-
-    # Encrypt and compare against the expected value
-    for i, (input_char, val) in enumerate(iter_plain_text(plain)):
-        cmd = Cmd.SCRAMBLE.value
-        dut.ui_in.value = get_ui_in(cmd, val)
-        await ready(dut)
-
-        cmd = Cmd.NOP.value
-        dut.ui_in.value = get_ui_in(cmd, val)
-        await ClockCycles(dut.clk,3)
-
-
-        golden_val = ord(golden[i]) - 65
-
-        out_val = LogicArray(dut.uio_out.value)[4:]
-
-        input_val = val
-        #dut._log.info(f'{golden_val:0b}, {out_val}, {out_val.integer}')
-        log_msg = f'Round {i}: Input {input_char} (0x{input_val:x} / {input_val}) -> {golden[i]} (0x{golden_val:x} / {golden_val}) expected, actual 0x{out_val.integer:x} / {out_val.integer}'
-        if IS_GATES:
-            dut._log.info(log_msg)
-        assert golden_val==out_val.integer, log_msg
+@dataclass
+class ConfigureKey:
+    """Clear the plugboard and load a key (rotors as dicts, as in tb_utils)"""
+    rotors: list
+    plugboard: list
+
+@dataclass
+class Scramble:
+    """Encrypt the letters of text, back to back"""
+    text: str
+
+    def __post_init__(self):
+        self.text = ''.join(c for c, _ in iter_plain_text(self.text))
+
+
+class Driver:
+    """Drives queued transactions into the DUT.  Each command goes out in
+       the cycle ready comes back, so scrambles run back to back.
+    """
+    def __init__(self, dut):
+        self.dut = dut
+        self.queue = Queue()
+        self.started = Queue()  # Transactions in the order they went out, for the scoreboard
+        self.idle = Event()
+
+    def send(self, txn):
+        self.idle.clear()
+        self.queue.put_nowait(txn)
+
+    async def run(self):
+        while True:
+            if self.queue.empty():
+                # Nothing left: stop the FSM from taking the last command again
+                self.dut.ui_in.value = get_ui_in(Cmd.NOP.value, 0)
+                self.idle.set()
+                txn = await self.queue.get()
+                # Line up with the falling edges that ready() waits for
+                await FallingEdge(self.dut.clk)
+            else:
+                txn = await self.queue.get()
+            self.started.put_nowait(txn)
+            if isinstance(txn, ConfigureKey):
+                await self.configure(txn)
+            else:
+                for c, val in iter_plain_text(txn.text):
+                    await send_command(self.dut, Cmd.SCRAMBLE, val)
+
+    async def configure(self, txn:ConfigureKey):
+        dut = self.dut
+        # Reset the plugboard
+        for i in range(26):
+            await set_plugboard_setting(dut, to_letter(i), to_letter(i))
+
+        for a,b in txn.plugboard:
+            await set_plugboard_setting(dut, a, b)
+            await set_plugboard_setting(dut, b, a)
+
+        for rotor_num, rotor in enumerate(txn.rotors):
+            await select_rotors(dut, rotor_num, Rotors[rotor['type']])
+        for rotor_num, rotor in enumerate(txn.rotors):
+            await set_rotor_setting(dut, rotor_num, rotor['start'])
+        for rotor_num, rotor in enumerate(txn.rotors):
+            await set_ring_setting(dut, rotor_num, rotor['ring'])
+
+
+class Monitor:
+    """Samples uio_out[0:5] once per scramble, when send_command says it is
+       done: at the falling edge where the latency model has the FSM ready
+       again, with the result registered.  Puts (input, result) pairs on
+       results.
+    """
+    def __init__(self, dut):
+        self.dut = dut
+        self.results = Queue()
+
+    async def run(self):
+        # Forget scrambles from before the monitor started
+        scrambled.clear()
+        while True:
+            await scrambled.wait()
+            scrambled.clear()
+            self.results.put_nowait((scrambled.data, self.dut.uio_out.value.integer & 0x1f))
+
+
+class Scoreboard:
+    """Checks the monitored results against the golden cipher of the driven
+       transactions.  Each key gets one golden model, which every Scramble
+       then goes through in turn, so the rotors carry over between them as
+       they do in the design.
+    """
+    def __init__(self, dut, started:Queue, results:Queue):
+        self.dut = dut
+        self.started = started
+        self.results = results
+        self.checked = 0
+        self.errors = []
+
+    async def run(self):
+        IS_GATES = os.getenv('GATES')
+        golden_model = None
+        while True:
+            txn = await self.started.get()
+            if isinstance(txn, ConfigureKey):
+                golden_model = get_golden_machine(txn.rotors, txn.plugboard)
+                continue
+
+            golden = golden_model.process_message(txn.text)
+            for input_char, golden_char in zip(txn.text, golden):
+                input_val, out_val = await self.results.get()
+                golden_val = to_val(golden_char)
+                log_msg = f'Round {self.checked}: Input {input_char} (0x{to_val(input_char):x} / {to_val(input_char)}) -> {golden_char} (0x{golden_val:x} / {golden_val}) expected, actual 0x{out_val:x} / {out_val}'
+                if IS_GATES:
+                    self.dut._log.info(log_msg)
+                if input_val != to_val(input_char) or out_val != golden_val:
+                    self.dut._log.error(log_msg)
+                    if not self.errors:
+                        self.dut._log.error(f'Dump waveforms around it with TRACE=fst TRACE_LETTERS={max(self.checked - 10, 0)}:{self.checked}')
+                    self.errors.append(log_msg)
+                self.checked += 1
+
+
+class Env:
+    """Driver, monitor and scoreboard of one test"""
+    def __init__(self, dut):
+        self.dut = dut
+        self.driver = Driver(dut)
+        self.monitor = Monitor(dut)
+        self.scoreboard = Scoreboard(dut, self.driver.started, self.monitor.results)
+        self.letters = 0
+        trace_window.restart()
+        for agent in [self.driver, self.monitor, self.scoreboard]:
+            cocotb.start_soon(agent.run())
+
+    def send(self, txn):
+        if isinstance(txn, Scramble):
+            self.letters += len(txn.text)
+        self.driver.send(txn)
+
+    async def finish(self):
+        """Wait for the driver to run dry and the last results to be checked"""
+        await self.driver.idle.wait()
+        await ClockCycles(self.dut.clk, 2)
+        assert not self.scoreboard.errors, f'{len(self.scoreboard.errors)} mismatches, first: {self.scoreboard.errors[0]}'
+        assert self.scoreboard.checked == self.letters, f'{self.letters} letters sent, {self.scoreboard.checked} checked'
+
+
+async def run_cipher(dut, rotors, plugboard, plain, env=None):
+    env = env or Env(dut)
+    env.send(ConfigureKey(rotors, plugboard))
+    env.send(Scramble(plain))
+    await env.finish()
 
 @cocotb.test()
 async def test_enigma_fixed(dut):
     dut._log.info("Start")
     # Set the clock period to 10 us (100 KHz)
-    clock = Clock(dut.clk, 10, units="us")
+    clock = Clock(dut.clk, CLOCK_PERIOD_US, units="us")
     cocotb.start_soon(clock.start())
 
     await reset(dut)
@@ -207,19 +344,96 @@ async def test_enigma_fixed(dut):
 
 @cocotb.test()
 async def test_enigma_randomx10(dut):
-    plain_text_length = 10000
+    """Random keys and text until every functional coverage bin is hit, or
+       RANDOM_KEYS times RANDOM_LENGTH letters are sent.  Each key gets up
+       to RANDOM_LENGTH letters, COVERAGE_CHUNK at a time, and is dropped
+       for a new one after a chunk that hits no new bins.
+    """
+    # regress.py shards the keys over several simulations with these
+    keys = int(os.getenv('RANDOM_KEYS', 10))
+    plain_text_length = int(os.getenv('RANDOM_LENGTH', 10000))
+    chunk = int(os.getenv('COVERAGE_CHUNK', 1000))
+    max_letters = keys*plain_text_length
     dut._log.info("Start")
-    dut._log.info(f"Length of plain text: {plain_text_length} chars")
+    dut._log.info(f"Up to {max_letters} chars of plain text, {plain_text_length} per key")
     # Set the clock period to 10 us (100 KHz)
-    clock = Clock(dut.clk, 10, units="us")
+    clock = Clock(dut.clk, CLOCK_PERIOD_US, units="us")
     cocotb.start_soon(clock.start())
 
-    for i in range(10):
+    coverage.clear()
+    env = None
+    while env is None or (env.letters < max_letters and not coverage.done()):
         await reset(dut)
-        random_text = [chr(randint(0,25)+65) for count in range(plain_text_length)]
-        random_text = ''.join(random_text)
+        env = env or Env(dut)
 
-        # Create a randomized Enigma settings
+        # Create a randomized Enigma settings, with 0 to PLUG_LIMIT plugs
         rotors = get_random_rotor_setting()
-        plugboard = get_random_plugboard_setting()
-        await run_cipher(dut, rotors, plugboard, random_text)
+        plugboard = get_random_plugboard_setting()[:randint(0, PLUG_LIMIT)]
+        env.send(ConfigureKey(rotors, plugboard))
+
+        length = min(plain_text_length, max_letters - env.letters)
+        while length > 0:
+            missing = len(coverage.missing())
+            random_text = ''.join(chr(randint(0,25)+65) for count in range(min(chunk, length)))
+            length -= len(random_text)
+            env.send(Scramble(random_text))
+            await env.finish()
+            if coverage.done() or len(coverage.missing()) == missing:
+                break
+
+    dut._log.info(coverage.report())
+    if not coverage.done():
+        dut._log.warning(f"Stopped after {env.letters} chars without hitting: {', '.join(coverage.missing())}")
+    else:
+        dut._log.info(f"Coverage closed after {env.letters} chars")
+
+
+async def run_vectors(dut, name, stimulus, expected):
+    """Stream a memory-mapped vector set (see vectors.py) into the design"""
+    IS_GATES = os.getenv('GATES')
+    scramble = Cmd.SCRAMBLE.value
+    i = 0
+    trace_window.restart()
+    for ui_in in stimulus:
+        ui_in = int(ui_in)
+        await send_command(dut, Cmd(ui_in >> 5), ui_in & 0x1f)
+        if ui_in >> 5 != scramble:
+            continue
+
+        out_val = dut.uio_out.value.integer & 0x1f
+        log_msg = f'{name} round {i}: input {ui_in & 0x1f} -> {expected[i]} expected, actual {out_val}'
+        if IS_GATES:
+            dut._log.info(log_msg)
+        assert out_val == expected[i], log_msg
+        i += 1
+    assert i == len(expected), f'{name}: {len(expected)} expected letters, {i} scrambled'
+
+@cocotb.test()
+async def test_enigma_vectors(dut):
+    vectors = os.getenv('VECTORS')
+    if not vectors:
+        dut._log.info("VECTORS is not set -- not testing this function")
+        return
+
+    clock = Clock(dut.clk, CLOCK_PERIOD_US, units="us")
+    cocotb.start_soon(clock.start())
+
+    for entry, stimulus, expected in load_vectors(vectors):
+        dut._log.info(f"Vector set {entry['name']}: {entry['commands']} commands, {entry['letters']} letters")
+        await reset(dut)
+        await run_vectors(dut, entry['name'], stimulus, expected)
+
+@cocotb.test()
+async def test_enigma_directed(dut):
+    """The short directed vector sets (see vectors.directed_sets), which
+       cover the whole FSM in about a thousand cycles.  The default test of
+       gate level simulations.
+    """
+    clock = Clock(dut.clk, CLOCK_PERIOD_US, units="us")
+    cocotb.start_soon(clock.start())
+
+    for name, rotors, plugboard, plain_text, prefix in directed_sets():
+        stimulus, expected = vector_set(rotors, plugboard, plain_text, prefix)
+        dut._log.info(f"Vector set {name}: {len(stimulus)} commands, {len(expected)} letters")
+        await reset(dut)
+        await run_vectors(dut, name, stimulus, expected)
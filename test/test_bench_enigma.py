@@ -0,0 +1,19 @@
+import copy
+
+from bench_enigma import compare, run
+
+
+def test_run_and_compare():
+    results = run(sizes=[100, 1000], engines=['scalar', 'fast'], max_scalar=100, repeat=1)
+    names = set(results['results'])
+    assert 'process_message/scalar/100' in names and 'process_message/scalar/1000' not in names
+    assert 'process_message/fast/1000' in names and 'construct/fast/10_plugs' in names
+    assert not any(name.startswith('batch_encrypt') for name in names)
+    for result in results['results'].values():
+        assert result['rate'] > 0 and result['peak_bytes'] >= 0
+
+    assert compare(results, results, 20) == []
+    baseline = copy.deepcopy(results)
+    baseline['results']['cipher/fast']['rate'] *= 2
+    del baseline['results']['cipher/scalar']
+    assert compare(results, baseline, 20) == ['cipher/fast']
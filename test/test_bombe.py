@@ -0,0 +1,40 @@
+import pytest
+
+from bombe import build_menu, run, run_order, most_connected
+from enigma import Enigma, letter_to_num
+
+ROTORS = [('II', 'K', 0), ('V', 'D', 0), ('III', 'R', 0)]
+PLUGBOARD = ['AT', 'EQ', 'RX']
+CRIB = 'WETTERVORHERSAGEBISKAYA'
+
+
+def ciphertext(offset=0):
+    return Enigma(ROTORS, 'B', PLUGBOARD).process_message('X'*offset + CRIB + 'UNDSOWEITER')
+
+
+def test_menu():
+    edges = build_menu(CRIB, ciphertext())
+    assert len(edges) == len(CRIB)
+    assert all(a != b for a, b, _ in edges)
+    with pytest.raises(ValueError):
+        build_menu('A', 'A')
+
+
+@pytest.mark.parametrize('offset', [0, 40])
+def test_bombe_stops_at_key(offset):
+    edges = build_menu(CRIB, ciphertext(offset), offset)
+    test = most_connected(edges)
+    right, _ = run_order(['II', 'V', 'III'], (0, 0, 0), 'B', edges, test)
+    starts = [letter_to_num[s] for _, s, _ in ROTORS]
+    stops = {tuple(s): partner for s, _, partner in right}
+    assert tuple(starts) in stops
+    # The test letter's partner can be read off at the right position
+    board = Enigma(ROTORS, 'B', PLUGBOARD).plugboard
+    assert stops[tuple(starts)] == letter_to_num[board.traverse(chr(test+65))]
+    # A long crib leaves only a handful of false stops
+    assert len(right) < 20
+
+
+def test_bombe_run():
+    stops = run(CRIB, ciphertext(), rotor_types=['II', 'V', 'III'], workers=1)
+    assert any(stop['rotors'] == ROTORS for stop in stops)
@@ -0,0 +1,50 @@
+from random import Random
+
+import numpy as np
+import pytest
+
+import catalogue
+from catalogue import Catalogue, build, characteristic_from_indicators, cycle_counts, to_cycles
+from enigma import Enigma
+
+DAILY_KEY = [('II', 'K', 0), ('I', 'D', 0), ('III', 'R', 0)]
+PLUGBOARD = ['AT', 'EQ', 'RX', 'BM']
+
+
+def indicators(count:int):
+    rng = Random(4)
+    keys = [''.join(chr(rng.randint(0, 25)+65) for i in range(3)) for n in range(count)]
+    return [Enigma(DAILY_KEY, 'B', PLUGBOARD).process_message(key*2) for key in keys]
+
+
+def test_cycle_counts():
+    # (0 1 2)(3 4)(5)...(25)
+    perm = np.arange(26)
+    perm[[0, 1, 2, 3, 4]] = [1, 2, 0, 4, 3]
+    counts = cycle_counts(perm[None])[0]
+    assert counts[0] == 21 and counts[1] == 1 and counts[2] == 1 and counts[3:].sum() == 0
+
+
+def test_catalogue_lookup(tmp_path):
+    build(tmp_path, rotor_types=['I', 'II', 'III'], workers=1)
+    catalogue = Catalogue(tmp_path)
+    signature = characteristic_from_indicators(indicators(200))
+    # The cycles of AD, BE and CF come in pairs of equal length
+    for cycles in to_cycles(signature):
+        assert sum(cycles) == 26
+        assert all(cycles[i] == cycles[i+1] for i in range(0, len(cycles), 2))
+    candidates = catalogue.lookup(signature)
+    assert DAILY_KEY in candidates
+    assert len(candidates) < 100
+    assert catalogue.lookup(np.zeros(78)) == []
+
+
+def test_build_hash_collision(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalogue, 'signature_hash', lambda signatures: np.zeros(len(signatures), dtype=np.uint64))
+    with pytest.raises(RuntimeError):
+        build(tmp_path, rotor_types=['I', 'II', 'III'], workers=1)
+
+
+def test_characteristic_needs_indicators():
+    with pytest.raises(ValueError):
+        characteristic_from_indicators(indicators(3))
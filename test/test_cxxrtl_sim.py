@@ -0,0 +1,48 @@
+import shutil
+from random import Random
+
+import pytest
+
+from cxxrtl_sim import CxxrtlSim, build, encrypt, run_testbench
+from defines import PLUG_LIMIT
+from rtl_model import EnigmaRTL
+from tb_utils import get_golden_cipher, random_key, random_text
+from test_rtl_model import random_stimulus
+from test.tb_enigma import bench, dut
+
+pytestmark = pytest.mark.skipif(shutil.which('g++') is None, reason='needs g++')
+
+
+@pytest.fixture(scope='module')
+def library():
+    return build()
+
+
+@pytest.mark.parametrize('seed', range(2))
+def test_against_golden(library, seed):
+    rng = Random(seed)
+    rotors, plugboard = random_key(rng, max_plugs=PLUG_LIMIT)
+    rotors = [{'type': t, 'start': start, 'ring': ring} for t, start, ring in rotors]
+    text = random_text(rng, 2000)
+    assert encrypt(CxxrtlSim(library), rotors, plugboard, text) == get_golden_cipher(rotors, plugboard, text)
+
+
+@pytest.mark.parametrize('seed', range(2))
+def test_against_rtl_model(library, seed):
+    sim = CxxrtlSim(library)
+    model = EnigmaRTL()
+    for cycle, (ui_in, rst_n) in enumerate(random_stimulus(Random(seed), 5000)):
+        sim.set('ui_in', ui_in)
+        sim.set('rst', not rst_n)
+        model.set('ui_in', ui_in)
+        model.set('rst_n', rst_n)
+        sim.tick()
+        model.tick()
+        assert sim.get('uio_out') == model.get('uio_out') & 0x3f, cycle
+        assert sim.get('uo_out') == model.get('uo_out'), cycle
+        assert sim.get('plugboard plug_limiter') == model.plug_limiter, cycle
+
+
+def test_tb_enigma(library):
+    """The Amaranth testbench of tb_enigma.py, on CXXRTL"""
+    run_testbench(CxxrtlSim(library), dut, bench)
@@ -0,0 +1,121 @@
+from random import Random
+
+import pytest
+from amaranth import Elaboratable, Module, Signal
+from amaranth.sim import Simulator
+
+from defines import Cmd, Rotors
+from enigma import step_state
+from fsm_latency import TURNOVERS, LatencyModel
+from src.fsm import Control
+from src.rotor import Rotor
+
+
+class ControlRotor(Elaboratable):
+    """Control and Rotor connected as in src/top.py, without the plugboard
+       (which is built from latches the simulator cannot run).  The command
+       din goes straight to the rotor.
+    """
+    def __init__(self):
+        self.fsm = Control()
+        self.rotor = Rotor()
+        self.din = Signal(5)
+
+    def elaborate(self, platform):
+        m = Module()
+        m.submodules.fsm = fsm = self.fsm
+        m.submodules.r = r = self.rotor
+        m.d.comb += [
+            r.din.eq(self.din),
+            r.en.eq(fsm.en),
+            r.load_start.eq(fsm.load_start),
+            r.load_ring.eq(fsm.load_ring),
+            r.load_rotor_type.eq(fsm.set_rotors),
+            r.inc.eq(fsm.inc),
+            r.ltor.eq(fsm.is_ltor),
+            r.din_sel.eq(fsm.din_sel),
+            fsm.is_at_turnover.eq(r.is_at_turnover),
+        ]
+        return m
+
+
+def run_control(commands):
+    """Run (cmd, din) commands through the Control FSM and rotors.  Returns
+       the cycles each command took to get back to ready, and the final
+       rotor positions.
+    """
+    dut = ControlRotor()
+    cycles = []
+
+    async def bench(ctx):
+        await ctx.tick()   # Initial
+        assert ctx.get(dut.fsm.ready)
+        for cmd, din in commands:
+            ctx.set(dut.fsm.cmd, cmd)
+            ctx.set(dut.din, din)
+            n = 0
+            while n == 0 or not ctx.get(dut.fsm.ready):
+                await ctx.tick()
+                n += 1
+                if cmd == Cmd.NOP:
+                    break
+            cycles.append(0 if cmd == Cmd.NOP else n)
+        positions.extend(ctx.get(dut.rotor.cnts[i]) for i in range(3))
+
+    positions = []
+    sim = Simulator(dut)
+    sim.add_clock(1e-6)
+    sim.add_testbench(bench)
+    sim.run()
+    return cycles, positions
+
+
+def configure(rotor_types, starts):
+    return ([(Cmd.SET_ROTORS, Rotors[rotor]) for rotor in rotor_types] +
+            [(Cmd.LOAD_START, start) for start in starts] +
+            [(Cmd.LOAD_RING, 0)]*3)
+
+
+def predict(commands):
+    model = LatencyModel()
+    return [model.command(cmd, din) for cmd, din in commands], model
+
+
+def test_double_step():
+    # Rotor 0 turns over on the first press, landing rotor 1 on its turnover
+    # (II turns over at E), and the next press is the double step
+    commands = configure(['I', 'II', 'III'], [16, 3, 7]) + [(Cmd.SCRAMBLE, 0)]*30
+    cycles, positions = run_control(commands)
+    expected, model = predict(commands)
+    assert cycles == expected
+    assert cycles[-30:-27] == [13, 13, 10]
+    assert positions == model.positions
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_scramble_latency(seed):
+    rng = Random(seed)
+    rotor_types = rng.sample(list(Rotors), 3)
+    starts = [rng.randrange(26) for i in range(3)]
+    n = rng.randrange(700, 800)
+    commands = configure(rotor_types, starts) + [(Cmd.SCRAMBLE, rng.randrange(26)) for i in range(n)]
+    cycles, positions = run_control(commands)
+    expected, model = predict(commands)
+    assert cycles == expected
+    assert positions == model.positions
+
+    # The positions the hardware turns over on are those of the golden model
+    turnovers = [TURNOVERS[Rotors[rotor]] for rotor in rotor_types[:2]]
+    assert positions == step_state(starts, turnovers, n)[0]
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_random_commands(seed):
+    # Any command in any order, including rotor types past the last one,
+    # positions past Z and RESETs in the middle of a configuration
+    rng = Random(seed)
+    commands = [(rng.choice(list(Cmd)), rng.randrange(32)) for i in range(300)]
+    cycles, positions = run_control(commands)
+    expected, model = predict(commands)
+    assert cycles == expected
+    assert positions == model.positions
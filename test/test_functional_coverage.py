@@ -0,0 +1,64 @@
+from random import Random
+
+import pytest
+
+from defines import Cmd, PLUG_LIMIT, Rotors
+from functional_coverage import Coverage, bins
+from rtl_model import EnigmaRTL
+from tb_utils import random_key, random_text
+from vectors import config_commands
+
+
+def rotor_dicts(rotors):
+    return [{'type': t, 'start': start, 'ring': ring} for t, start, ring in rotors]
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_against_rtl_model(seed):
+    """The bins count what the cycle model does with the same commands"""
+    rng = Random(seed)
+    coverage = Coverage()
+    model = EnigmaRTL()
+    expected = dict.fromkeys(bins(), 0)
+    names = list(Rotors)
+    for key in range(6):
+        model.set('rst_n', 0)
+        model.tick()
+        model.set('rst_n', 1)
+        model.tick()
+        coverage.reset()
+        # Up to one plug past the limit, which the design blocks
+        rotors, plugboard = random_key(rng, max_plugs=PLUG_LIMIT + 1)
+        for ui_in in config_commands(rotor_dicts(rotors), plugboard):
+            limited = model.plug_limiter >> 1 >= PLUG_LIMIT
+            model.send(ui_in >> 5, ui_in & 0x1f)
+            coverage.command(ui_in >> 5, ui_in & 0x1f)
+            expected['plug limit'] += not limited and model.plug_limiter >> 1 >= PLUG_LIMIT
+
+        plugs = sum(model.mem[i] != i for i in range(26)) // 2
+        for c in random_text(rng, 1000):
+            expected['rotor 0 turnover'] += model.is_at_turnover() & 1
+            expected['double step'] += model.control.double_step
+            for slot, rotor_type in enumerate(model.slot):
+                expected[f'{names[rotor_type]} in slot {slot}'] += 1
+            expected[f'{plugs} plugs'] += 1
+            model.send(Cmd.SCRAMBLE, ord(c) - 65)
+            coverage.command(Cmd.SCRAMBLE, ord(c) - 65)
+    assert coverage.hits == expected
+
+
+def test_missing():
+    coverage = Coverage()
+    assert coverage.missing() == bins()
+    rotors = [{'type': t, 'start': 'Q', 'ring': 0} for t in ['I', 'II', 'III']]
+    for ui_in in config_commands(rotors, ['AB']):
+        coverage.command(ui_in >> 5, ui_in & 0x1f)
+    coverage.command(Cmd.SCRAMBLE, 0)
+    assert 'rotor 0 turnover' not in coverage.missing()
+    assert 'I in slot 0' not in coverage.missing()
+    assert '1 plugs' not in coverage.missing()
+    assert 'double step' in coverage.missing()
+
+    coverage.clear()
+    assert coverage.missing() == bins()
+    assert not coverage.done()
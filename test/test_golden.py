@@ -0,0 +1,239 @@
+from itertools import count, islice
+from random import Random
+
+import numpy as np
+import pytest
+
+from enigma import Enigma, FastEnigma, TRACE_STAGES, parse_rotors
+from enigma_np import EnigmaNP, permutation_table
+from enigma_parallel import encrypt_file
+from tb_utils import plain, get_fixed_rotor_setting, get_fixed_plugboard_setting, get_golden_cipher, get_golden_machine, random_key, random_text
+
+@pytest.mark.parametrize('engine', ['numpy', 'fast'])
+# 'ſ' and 'ı' upper-case to ASCII 'S' and 'I'
+@pytest.mark.parametrize('text', [plain, 'ſıabc'])
+def test_engine_fixed(engine, text):
+    rotors = get_fixed_rotor_setting()
+    plugboard = get_fixed_plugboard_setting()
+    assert get_golden_cipher(rotors, plugboard, text, engine) == get_golden_cipher(rotors, plugboard, text, 'scalar')
+
+
+@pytest.mark.parametrize('engine', ['scalar', 'numpy', 'fast'])
+def test_golden_machine_chunks(engine):
+    # As the scoreboard uses it: one machine per key, text a chunk at a time
+    rotors = get_fixed_rotor_setting()
+    plugboard = get_fixed_plugboard_setting()
+    machine = get_golden_machine(rotors, plugboard, engine)
+    chunks = [plain[:100], plain[100:101], plain[101:1500], plain[1500:]]
+    assert ''.join(machine.process_message(chunk) for chunk in chunks) == get_golden_cipher(rotors, plugboard, plain, 'scalar')
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_numpy_engine_random(seed):
+    rng = Random(seed)
+    rotors, plugboard = random_key(rng)
+    # Long enough to go through a few double steps
+    text = random_text(rng, 2000)
+    assert EnigmaNP(rotors, 'B', plugboard).process_message(text) == Enigma(rotors, 'B', plugboard).process_message(text)
+
+
+@pytest.mark.parametrize('start', ['AA', 'QD', 'QE', 'PE', 'QF', 'ZZ'])
+def test_numpy_engine_turnovers(start):
+    # Rotor I turns over at Q, rotor II at E
+    rotors = [('I', start[0], 0), ('II', start[1], 0), ('III', 'A', 0)]
+    text = 'A' * 1500
+    assert EnigmaNP(rotors, 'B').process_message(text) == Enigma(rotors, 'B').process_message(text)
+
+
+def test_numpy_engine_chunks():
+    # Machine state is carried across calls, including a pending double step
+    rng = Random(1)
+    rotors, plugboard = random_key(rng)
+    text = random_text(rng, 3000)
+    scalar = Enigma(rotors, 'B', plugboard)
+    vectorized = EnigmaNP(rotors, 'B', plugboard)
+    pos = 0
+    while pos < len(text):
+        n = rng.randint(0, 700)
+        assert vectorized.process_message(text[pos:pos+n]) == scalar.process_message(text[pos:pos+n])
+        assert [r.ptr for r in vectorized.rotors] == [r.ptr for r in scalar.rotors]
+        assert vectorized.next_is_double_step == scalar.next_is_double_step
+        pos += n
+
+
+def test_numpy_engine_non_letters():
+    rotors = [('III', 'Z', 3), ('I', 'Q', 7), ('V', 'C', 11)]
+    text = 'Hello, World! 123 The quick brown fox\njumps over the lazy dog.'
+    assert EnigmaNP(rotors, 'B', ['AB']).process_message(text) == Enigma(rotors, 'B', ['AB']).process_message(text)
+
+
+def test_permutation_table_shared():
+    # Different ring settings, start positions and plugs reuse the same table
+    a = EnigmaNP([('I', 'A', 0), ('II', 'B', 1), ('III', 'C', 2)], 'B', ['AB'])
+    b = EnigmaNP([('I', 'X', 5), ('II', 'Y', 6), ('III', 'Z', 7)], 'B', ['CD', 'EF'])
+    assert a.table is b.table
+    assert a.table.dtype == np.uint8 and a.table.shape == (26, 26, 26, 26)
+    # Every position is an involution with no fixed points
+    letters = np.arange(26)
+    flat = a.table.reshape(-1, 26)
+    assert (np.take_along_axis(flat, flat.astype(np.intp), axis=1) == letters).all()
+    assert (flat != letters).all()
+    assert permutation_table(('I', 'II', 'III'), 'B') is a.table
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_state_at(seed):
+    rng = Random(seed)
+    rotors, plugboard = random_key(rng)
+    scalar = Enigma(rotors, 'B', plugboard)
+    for n in range(1, 2000):
+        scalar.cipher('A')
+        positions, double_step_pending = scalar.state_at(n)
+        assert positions == [r.ptr for r in scalar.rotors], n
+        assert double_step_pending == scalar.next_is_double_step, n
+
+
+@pytest.mark.parametrize('engine', [Enigma, EnigmaNP])
+def test_encrypt_range(engine):
+    rng = Random(7)
+    rotors, plugboard = random_key(rng)
+    text = random_text(rng, 3000)
+    cipher = Enigma(rotors, 'B', plugboard).process_message(text)
+    machine = engine(rotors, 'B', plugboard)
+    for offset, length in [(0, 10), (1234, 700), (25, 1), (2999, 1), (650, 2350)]:
+        assert machine.encrypt_range(text[offset:offset+length], offset) == cipher[offset:offset+length]
+
+
+@pytest.mark.parametrize('chunk_size', [1000, 1 << 20])
+def test_encrypt_file(tmp_path, chunk_size):
+    rng = Random(3)
+    rotors, plugboard = random_key(rng)
+    text = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyzQRSTUVWXYZ ,.\n') for i in range(20000))
+    (tmp_path / 'plain.txt').write_text(text)
+    n = encrypt_file(rotors, 'B', plugboard, tmp_path / 'plain.txt', tmp_path / 'cipher.txt',
+                     workers=2, chunk_size=chunk_size)
+    golden = Enigma(rotors, 'B', plugboard).process_message(text)
+    assert n == len(golden)
+    assert (tmp_path / 'cipher.txt').read_text() == golden
+
+
+def test_encrypt_empty_file(tmp_path):
+    (tmp_path / 'plain.txt').write_text('')
+    assert encrypt_file([('I', 'A', 0), ('II', 'A', 0), ('III', 'A', 0)], 'B', [],
+                        tmp_path / 'plain.txt', tmp_path / 'cipher.txt', workers=1) == 0
+    assert (tmp_path / 'cipher.txt').read_text() == ''
+
+
+def test_parse_rotors():
+    assert parse_rotors('I,II,III', 'pfb', '18,5,24') == [('I', 'P', 18), ('II', 'F', 5), ('III', 'B', 24)]
+    for args in [('I,II,III', 'PF', '18,5,24'), ('I,II', 'PFB', '18,5,24'), ('I,II,III', 'PFB', '18,5')]:
+        with pytest.raises(ValueError):
+            parse_rotors(*args)
+
+
+def random_chunks(rng:Random, text:str):
+    pos = 0
+    while pos < len(text):
+        n = rng.randint(0, 300)
+        yield text[pos:pos+n]
+        pos += n
+
+
+@pytest.mark.parametrize('engine', [Enigma, EnigmaNP])
+@pytest.mark.parametrize('kind', [str, bytes, memoryview])
+def test_stream(engine, kind):
+    rng = Random(11)
+    rotors, plugboard = random_key(rng)
+    text = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyzQRSTUVWXYZ ,.\n') for i in range(3000))
+    golden = Enigma(rotors, 'B', plugboard).process_message(text)
+    chunks = (kind(c) if kind is str else kind(c.encode()) for c in random_chunks(rng, text))
+    output = list(engine(rotors, 'B', plugboard).stream(chunks))
+    assert all(isinstance(c, str if kind is str else bytes) for c in output)
+    assert (''.join(output) if kind is str else b''.join(output).decode()) == golden
+
+
+@pytest.mark.parametrize('engine', [Enigma, EnigmaNP])
+def test_stream_unbounded(engine):
+    rotors = [('I', 'A', 0), ('II', 'A', 0), ('III', 'A', 0)]
+    chunks = (b'HELLO WORLD ' for i in count())
+    output = b''.join(islice(engine(rotors, 'B').stream(chunks), 100))
+    assert output.decode() == Enigma(rotors, 'B').process_message('HELLOWORLD'*100)
+
+
+@pytest.mark.parametrize('engine', [Enigma, EnigmaNP])
+def test_encrypt_bytes(engine):
+    rng = Random(5)
+    rotors, plugboard = random_key(rng)
+    text = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyzQRSTUVWXYZ ,.\n\xe9') for i in range(20000))
+    machine = engine(rotors, 'B', plugboard)
+    scalar = Enigma(rotors, 'B', plugboard)
+    data = text.encode('latin-1')
+    # Mix byte and character paths to check the rotor state is shared
+    half = len(data)//2
+    output = machine.encrypt_bytes(data[:half]) + machine.process_message(data[half:].decode('latin-1')).encode()
+    assert output.decode() == scalar.process_message(text.replace('\xe9', ''))
+    assert [r.ptr for r in machine.rotors] == [r.ptr for r in scalar.rotors]
+
+
+def test_batch_encrypt():
+    rng = Random(9)
+    keys, messages = [], []
+    for i in range(50):
+        rotors, plugboard = random_key(rng)
+        keys.append((rotors, 'B', plugboard))
+        messages.append(random_text(rng, rng.randint(0, 2000)) + ' abc, xyz!')
+    golden = [Enigma(*key).process_message(m) for key, m in zip(keys, messages)]
+    assert EnigmaNP.batch_encrypt(keys, messages) == golden
+    assert EnigmaNP.batch_encrypt([], []) == []
+
+
+def test_batch_encrypt_blocks(monkeypatch):
+    # Force the messages to be split into several blocks of key presses
+    import enigma_np
+    monkeypatch.setattr(enigma_np, 'BATCH_ELEMENTS', 3*100)
+    rng = Random(10)
+    keys = [(random_key(rng)[0], 'B', random_key(rng)[1]) for i in range(3)]
+    messages = [random_text(rng, 1500) for key in keys]
+    assert EnigmaNP.batch_encrypt(keys, messages) == [Enigma(*key).process_message(m) for key, m in zip(keys, messages)]
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_fast_engine(seed):
+    rng = Random(seed)
+    rotors, plugboard = random_key(rng)
+    text = random_text(rng, 2000) + ' abc, xyz!'
+    reference, fast = Enigma(rotors, 'B', plugboard), FastEnigma(rotors, 'B', plugboard)
+    for chunk in [text[:700], text[700:701], text[701:]]:
+        assert fast.process_message(chunk) == reference.process_message(chunk)
+        assert fast.positions == [rotor.ptr for rotor in reference.rotors]
+        assert fast.next_is_double_step == reference.next_is_double_step
+    assert fast.cipher('Q') == reference.cipher('Q')
+
+
+def test_fast_engine_trace():
+    rng = Random(5)
+    rotors, plugboard = random_key(rng)
+    text = random_text(rng, 800)
+    reference, fast = Enigma(rotors, 'B', plugboard), FastEnigma(rotors, 'B', plugboard)
+    fast.enable_trace(700)
+    assert fast.process_message(text) == reference.process_message(text)
+    rows = fast.trace_rows()
+    assert len(rows) == 700
+
+    # Replay the stages with the reference rotors
+    reference = Enigma(rotors, 'B', plugboard)
+    for c, row in zip(text, rows):
+        out = reference.cipher(c)
+        stage = dict(zip(TRACE_STAGES, row))
+        assert [stage['pos0'], stage['pos1'], stage['pos2']] == [rotor.ptr for rotor in reference.rotors]
+        l = stage['plug_in']
+        assert chr(l + 65) == reference.plugboard.traverse(c)
+        for i, rotor in enumerate(reference.rotors):
+            l = rotor.rtol(l)
+            assert stage[f'rtol{i}'] == l
+        l = reference.reflector.rtol(l)
+        assert stage['reflector'] == l
+        for i, rotor in reversed(list(enumerate(reference.rotors))):
+            l = rotor.ltor(l)
+            assert stage[f'ltor{i}'] == l
+        assert chr(stage['plug_out'] + 65) == out
@@ -0,0 +1,64 @@
+import os
+from random import Random
+
+import pytest
+
+import tb_utils
+from enigma import Enigma
+from golden_cache import GoldenCache, pack_letters, unpack_letters
+from tb_utils import get_fixed_rotor_setting, get_fixed_plugboard_setting, get_golden_cipher, plain, random_text
+
+
+@pytest.mark.parametrize('length', [0, 1, 7, 8, 1001])
+def test_pack_letters(length):
+    text = random_text(Random(length), length)
+    data = pack_letters(text)
+    assert len(data) == 8 + (5*length + 7)//8
+    assert unpack_letters(data) == text
+
+
+def test_golden_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('GOLDEN_CACHE_DIR', str(tmp_path))
+    rotors, plugboard = get_fixed_rotor_setting(), get_fixed_plugboard_setting()
+    golden = get_golden_cipher(rotors, plugboard, plain, 'scalar')
+    assert len(list(tmp_path.rglob('*'))) == 2   # One subdirectory and its entry
+
+    calls = []
+    monkeypatch.setattr(Enigma, 'process_message', lambda self, text: calls.append(text) or '')
+    assert get_golden_cipher(rotors, plugboard, plain, 'scalar') == golden
+    assert calls == []
+    # Anything that changes the cipher text misses the cache
+    get_golden_cipher(rotors, plugboard, plain[:-20], 'scalar')
+    get_golden_cipher(rotors, plugboard[:-1], plain, 'scalar')
+    assert len(calls) == 2
+
+
+def test_golden_cache_source_hash(tmp_path, monkeypatch):
+    monkeypatch.setenv('GOLDEN_CACHE_DIR', str(tmp_path))
+    rotors, plugboard = get_fixed_rotor_setting(), get_fixed_plugboard_setting()
+    keys = set()
+    for engine in tb_utils.GOLDEN_ENGINES:
+        assert get_golden_cipher(rotors, plugboard, plain, engine) == get_golden_cipher(rotors, plugboard, plain, 'scalar')
+        keys |= {p.name for p in tmp_path.rglob('*') if p.is_file()}
+    assert len(keys) == len(tb_utils.GOLDEN_ENGINES)
+
+
+def test_golden_cache_eviction(tmp_path):
+    cache = GoldenCache(tmp_path, max_bytes=3*(8 + 625))
+    rng = Random(1)
+    keys = [f'{i:064x}' for i in range(5)]
+    for i, key in enumerate(keys):
+        cache.put(key, random_text(rng, 1000))
+        os.utime(cache.path(key), ns=(i*10**9, i*10**9))
+        if i == 2:
+            # A hit makes the first entry the most recently used one
+            assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None and cache.get(keys[2]) is None
+    assert all(cache.get(key) is not None for key in [keys[0], keys[3], keys[4]])
+
+
+def test_golden_cache_off(tmp_path, monkeypatch):
+    monkeypatch.setenv('GOLDEN_CACHE_DIR', '')
+    assert tb_utils.get_golden_cache() is None
+    rotors, plugboard = get_fixed_rotor_setting(), get_fixed_plugboard_setting()
+    assert get_golden_cipher(rotors, plugboard, plain, 'fast') == get_golden_cipher(rotors, plugboard, plain, 'scalar')
@@ -0,0 +1,44 @@
+import json
+
+import keysearch
+
+from enigma import Enigma
+from keysearch import score_starts, search, ring_settings, unit_name
+from enigma_np import letters_in
+from tb_utils import plain
+
+KEY = [('II', 'K', 0), ('IV', 'D', 0), ('I', 'R', 0)]
+CIPHERTEXT = Enigma(KEY, 'B').process_message(plain)[:400]
+
+
+def test_search_finds_key():
+    best = search(CIPHERTEXT, rotor_types=['I', 'II', 'IV'], workers=2, top=3)
+    assert [tuple(r) for r in best[0][1]] == KEY
+    assert best[0][0] > best[1][0]
+
+
+def test_search_resumes(tmp_path):
+    checkpoint = str(tmp_path / 'search.json')
+    # Pretend everything but the right rotor order was already searched
+    done = [unit_name(order, (0, 0, 0)) for order in [('I', 'II', 'IV'), ('IV', 'II', 'I')]]
+    with open(checkpoint, 'w') as f:
+        json.dump({'done': done, 'best': []}, f)
+    best = search(CIPHERTEXT, rotor_types=['I', 'II', 'IV'], workers=2, top=3, checkpoint=checkpoint)
+    assert [tuple(r) for r in best[0][1]] == KEY
+    with open(checkpoint) as f:
+        state = json.load(f)
+    assert sorted(state['done']) == sorted(unit_name(o, (0, 0, 0)) for o in
+        [('I', 'II', 'IV'), ('I', 'IV', 'II'), ('II', 'I', 'IV'), ('II', 'IV', 'I'), ('IV', 'I', 'II'), ('IV', 'II', 'I')])
+
+
+def test_ring_settings():
+    assert ring_settings('zero') == [(0, 0, 0)]
+    assert len(ring_settings('all')) == 26*26
+
+
+def test_score_starts_blocks(monkeypatch):
+    c = letters_in(CIPHERTEXT[:100].encode())
+    best = score_starts(c, ('II', 'IV', 'I'), (0, 0, 0), 'B', 5)
+    # Blocks of 7 start positions, which do not divide 26^3
+    monkeypatch.setattr(keysearch, 'SCORE_ELEMENTS', 700)
+    assert score_starts(c, ('II', 'IV', 'I'), (0, 0, 0), 'B', 5) == best
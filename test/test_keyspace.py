@@ -0,0 +1,54 @@
+from itertools import islice
+from random import Random
+
+import numpy as np
+import pytest
+
+from enigma_np import EnigmaNP
+from keyspace import canonical, canonical_key, keys, num_classes, order_turnovers, representative, representatives, settings, steppings
+from tb_utils import random_key, random_text
+
+TURNOVERS = order_turnovers(('I', 'II', 'III'))
+
+
+@pytest.mark.parametrize('n', [0, 5, 25, 26, 27, 100, 676, 677, 678, 1000])
+def test_steppings(n):
+    # Every start position of rotors 0 and 1 (the ring settings and rotor 2
+    # only shift the offsets) falls into one of the steppings
+    s0, s1 = np.indices((26, 26)).reshape(2, -1)
+    all_steppings = canonical([s0, s1, 0], [0, 0, 0], TURNOVERS, n)[3:]
+    carry, double_step = steppings(n)
+    assert {tuple(c) for c in all_steppings.T} == set(zip(carry, double_step))
+    assert len(carry) == len(set(zip(carry, double_step)))
+
+    # And the representative of each stepping has that stepping
+    zeros = np.zeros_like(carry)
+    starts, rings = settings([zeros, zeros, zeros, carry, double_step], TURNOVERS)
+    assert (canonical(starts, rings, TURNOVERS, n)[3:] == [carry, double_step]).all()
+
+
+@pytest.mark.parametrize('n', [0, 30])
+def test_representatives_cover_every_class(n):
+    starts, rings = representatives(TURNOVERS, n)
+    codes = np.ravel_multi_index(canonical(starts, rings, TURNOVERS, n), (26, 26, 26, 27, n + 1))
+    assert len(np.unique(codes)) == starts.shape[1] == num_classes(n)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_equivalent_keys_encrypt_alike(seed):
+    rng = Random(seed)
+    rotors, plugboard = random_key(rng)
+    n = rng.choice([rng.randint(0, 30), rng.randint(0, 1500)])
+    text = random_text(rng, n)
+    same = representative(rotors, n)
+    assert canonical_key(same, n) == canonical_key(rotors, n)
+    assert same[2][2] == 0
+    assert EnigmaNP(same, 'B', plugboard).process_message(text) == EnigmaNP(rotors, 'B', plugboard).process_message(text)
+
+
+def test_keys():
+    first = list(islice(keys(['I', 'II', 'III'], 0), num_classes(0) + 1))
+    orders = [tuple(rotor for rotor, _, _ in key) for key in first]
+    assert set(orders[:-1]) == {('I', 'II', 'III')}
+    assert orders[-1] != orders[0]
+    assert len({canonical_key(key, 0) for key in first[:-1]}) == num_classes(0)
@@ -0,0 +1,31 @@
+import numpy as np
+
+from enigma import Enigma
+from plugsolver import PlugboardSolver, build_ngram_tables, load_ngram_tables, to_pairs
+from tb_utils import plain
+
+ROTORS = [('III', 'M', 4), ('I', 'C', 17), ('V', 'X', 9)]
+
+
+def test_ngram_tables(tmp_path):
+    build_ngram_tables(plain, tmp_path)
+    bigrams, trigrams = load_ngram_tables(tmp_path)
+    assert isinstance(bigrams, np.memmap) and bigrams.shape == (26, 26)
+    assert trigrams.shape == (26, 26, 26)
+    assert np.isclose((10.0**trigrams.astype(np.float64)).sum(), 1)
+    # 'QU' is common in Latin, 'QQ' is not
+    assert bigrams[16, 20] > bigrams[16, 16]
+
+
+def test_solve_plugboard(tmp_path):
+    build_ngram_tables(plain, tmp_path)
+    plugboard = ['AN', 'DT', 'ZB']
+    ciphertext = Enigma(ROTORS, 'B', plugboard).process_message(plain)[:600]
+    solver = PlugboardSolver(ciphertext, ROTORS, 'B', load_ngram_tables(tmp_path))
+    # Conjugating the cached permutations gives the same decrypt as the machine
+    plugs = np.arange(26)
+    plugs[[0, 13, 3, 19, 25, 1]] = [13, 0, 19, 3, 1, 25]
+    assert to_pairs(plugs) == ['AN', 'BZ', 'DT']
+    assert ''.join(chr(x+65) for x in solver.decrypt(plugs)) == Enigma(ROTORS, 'B', plugboard).process_message(ciphertext)
+    pairs, score = solver.solve()
+    assert sorted(pairs) == ['AN', 'BZ', 'DT']
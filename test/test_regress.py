@@ -0,0 +1,55 @@
+import json, stat
+
+from regress import RANDOM_TESTCASE, json_report, junit_report, passed, plan, run
+
+# Stands in for make: writes a cocotb-style results.xml, failing odd seeds
+FAKE_MAKE = '''#!/bin/sh
+[ "$TESTCASE" = crash ] && exit 2
+if [ $((RANDOM_SEED % 2)) = 1 ]; then
+    result='<failure message="mismatch"/>'
+fi
+cat > "$COCOTB_RESULTS_FILE" <<EOF
+<testsuites><testsuite name="all"><testcase name="$TESTCASE" classname="test">$result</testcase></testsuite></testsuites>
+EOF
+pwd > cwd.txt
+echo "$@ $RANDOM_KEYS $RANDOM_LENGTH" > args.txt
+'''
+
+
+def test_plan():
+    shards = plan(1, keys=10, keys_per_shard=3, length=50, testcases=['test_load'])
+    assert shards == plan(1, keys=10, keys_per_shard=3, length=50, testcases=['test_load'])
+    assert [shard.name for shard in shards] == ['test_load', 'random0', 'random1', 'random2', 'random3']
+    assert [shard.env.get('RANDOM_KEYS') for shard in shards] == [None, '3', '3', '3', '1']
+    assert len({shard.seed for shard in shards}) == len(shards)
+    assert {shard.seed for shard in shards}.isdisjoint(shard.seed for shard in plan(2, keys=10, keys_per_shard=3))
+
+    assert shards[1].testcase == RANDOM_TESTCASE
+    assert shards[1].reproduce(gates=True) == \
+        f'RANDOM_SEED={shards[1].seed} RANDOM_KEYS=3 RANDOM_LENGTH=50 make -B TESTCASE={RANDOM_TESTCASE} GATES=yes'
+
+
+def test_run(tmp_path):
+    make = tmp_path / 'make'
+    make.write_text(FAKE_MAKE)
+    make.chmod(make.stat().st_mode | stat.S_IEXEC)
+
+    shards = plan(3, keys=6, keys_per_shard=2, length=50, testcases=['crash'])
+    shards = run(shards, tmp_path / 'out', jobs=3, make=str(make))
+    for shard in shards[1:]:
+        shard_dir = tmp_path / 'out' / shard.name
+        assert (shard_dir / 'cwd.txt').read_text().strip() == str(shard_dir)
+        assert f'SIM_BUILD={shard_dir}/build' in (shard_dir / 'args.txt').read_text()
+        assert (shard_dir / 'args.txt').read_text().split()[-2:] == ['2', '50']
+        assert shard.tests == 1 and passed(shard) == (shard.seed % 2 == 0)
+    assert shards[0].returncode == 2 and not passed(shards[0])
+
+    junit = junit_report(shards, tmp_path / 'out').getroot()
+    assert [suite.get('name') for suite in junit] == [shard.name for shard in shards]
+    assert junit[0].find('testcase/error') is not None
+    failures = sum(shard.seed % 2 for shard in shards[1:])
+    assert len(junit.findall('testsuite/testcase/failure')) == failures
+
+    report = json.loads(json.dumps(json_report(shards, 3)))
+    assert not report['passed']
+    assert [shard['passed'] for shard in report['shards']] == [passed(shard) for shard in shards]
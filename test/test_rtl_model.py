@@ -0,0 +1,113 @@
+from random import Random
+
+import pytest
+from amaranth import ClockDomain, Module
+from amaranth.sim import Simulator
+
+from defines import Cmd, PLUG_LIMIT
+from fsm_latency import LatencyModel
+from rtl_model import CONTROL_OUTPUTS, ControlModel, EnigmaRTL
+from src.fsm import Control
+from src.top import Enigma
+from tb_utils import get_golden_cipher, random_key, random_text
+from vectors import config_commands
+
+
+def random_stimulus(rng, cycles:int):
+    """(ui_in, rst_n) for every cycle: mostly commands held until ready, as
+       a testbench would send them, with random pins and resets mixed in
+    """
+    for i in range(cycles):
+        if rng.random() < 0.005:
+            yield rng.randrange(256), 0
+        elif rng.random() < 0.3:
+            yield rng.randrange(256), 1
+        else:
+            yield rng.choice(list(Cmd)).value << 5 | rng.randrange(26), 1
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_against_amaranth(seed):
+    dut = Enigma(sim=True)
+    model = EnigmaRTL()
+    stimulus = list(random_stimulus(Random(seed), 3000))
+    # An explicit sync domain, to drive its reset
+    top = Module()
+    top.domains.sync = sync = ClockDomain()
+    top.submodules.enigma = dut
+
+    async def bench(ctx):
+        for cycle, (ui_in, rst_n) in enumerate(stimulus):
+            ctx.set(dut.ui_in, ui_in)
+            ctx.set(sync.rst, not rst_n)
+            model.set('ui_in', ui_in)
+            model.set('rst_n', rst_n)
+            await ctx.tick()
+            model.tick()
+            assert ctx.get(dut.uio_out) == model.get('uio_out') & 0x3f, cycle
+            assert ctx.get(dut.uo_out) == model.get('uo_out'), cycle
+            for name in ['cnts', 'ring_settings', 'slot']:
+                assert [ctx.get(getattr(dut.rotor, name)[i]) for i in range(3)] == getattr(model, name), (cycle, name)
+            assert ctx.get(dut.rotor.dout) == model.dout, cycle
+            assert ctx.get(dut.plugboard.plug_limiter) == model.plug_limiter, cycle
+            assert [ctx.get(dut.plugboard.mem[i]) for i in range(26)] == model.mem, cycle
+
+    sim = Simulator(top)
+    sim.add_clock(1e-6)
+    sim.add_testbench(bench)
+    sim.run()
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_control_against_amaranth(seed):
+    rng = Random(seed)
+    dut = Control()
+    model = ControlModel()
+
+    async def bench(ctx):
+        for cycle in range(3000):
+            cmd, is_at_turnover = rng.randrange(8), rng.randrange(8)
+            ctx.set(dut.cmd, cmd)
+            ctx.set(dut.is_at_turnover, is_at_turnover)
+            assert {name: ctx.get(getattr(dut, name)) for name in CONTROL_OUTPUTS} == model.outputs(), cycle
+            await ctx.tick()
+            model.tick(cmd, is_at_turnover)
+
+    sim = Simulator(dut)
+    sim.add_clock(1e-6)
+    sim.add_testbench(bench)
+    sim.run()
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_against_golden(seed):
+    rng = Random(seed)
+    rotors, plugboard = random_key(rng, max_plugs=PLUG_LIMIT)
+    rotors = [{'type': t, 'start': start, 'ring': ring} for t, start, ring in rotors]
+    text = random_text(rng, 2000)
+
+    model = EnigmaRTL()
+    model.set('rst_n', 0)
+    model.tick()
+    model.set('rst_n', 1)
+    model.tick()
+    latency = LatencyModel()
+    for ui_in in config_commands(rotors, plugboard):
+        assert model.send(ui_in >> 5, ui_in & 0x1f) == latency.command(Cmd(ui_in >> 5), ui_in & 0x1f)
+
+    cipher = ''
+    for c in text:
+        assert model.send(Cmd.SCRAMBLE, ord(c) - 65) == latency.command(Cmd.SCRAMBLE, ord(c) - 65)
+        cipher += chr(model.get('uio_out') % 32 + 65)
+    assert cipher == get_golden_cipher(rotors, plugboard, text)
+
+
+def test_plug_limit():
+    model = EnigmaRTL()
+    model.tick()
+    for a, b in [(0, 1), (1, 0), (2, 3), (3, 2), (4, 5), (5, 4), (6, 7), (7, 6), (8, 8)]:
+        model.send(Cmd.LOAD_PLUG_ADDR, a)
+        model.send(Cmd.LOAD_PLUG_DATA, b)
+    # The fourth plug and then any write at all are blocked
+    assert model.plug_limiter == 2*PLUG_LIMIT
+    assert model.mem[:9] == [1, 0, 3, 2, 5, 4, 0, 0, 0]
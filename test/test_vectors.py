@@ -0,0 +1,64 @@
+import json
+
+import numpy as np
+
+from defines import Cmd, Rotors
+from enigma import Enigma
+from functional_coverage import Coverage
+from rtl_model import TRANSITIONS, EnigmaRTL
+from vectors import default_sets, directed_sets, load_vectors, write_vectors
+
+
+def test_vectors(tmp_path):
+    sets = list(default_sets(random=3, length=500, seed=2))
+    write_vectors(tmp_path, sets)
+    with open(tmp_path / 'manifest.json') as f:
+        assert [entry['name'] for entry in json.load(f)] == ['fixed', 'random0', 'random1', 'random2']
+
+    for (name, rotors, plugboard, plain_text), (entry, stimulus, expected) in zip(sets, load_vectors(tmp_path)):
+        assert isinstance(stimulus, np.memmap) and entry['name'] == name
+        cmds, dins = stimulus >> 5, stimulus & 0x1f
+        config = 52 + 4*len(plugboard) + 9
+        assert len(stimulus) == entry['commands'] == config + entry['letters']
+        assert list(cmds[:52:2]) == [Cmd.LOAD_PLUG_ADDR.value]*26 and list(dins[:52:2]) == list(range(26))
+        assert list(cmds[config-9:config]) == [Cmd.SET_ROTORS.value]*3 + [Cmd.LOAD_START.value]*3 + [Cmd.LOAD_RING.value]*3
+        assert list(dins[config-9:config-6]) == [Rotors[rotor['type']] for rotor in rotors]
+        assert (cmds[config:] == Cmd.SCRAMBLE.value).all()
+
+        # The expected letters are the golden cipher text of the scrambled letters
+        text = (dins[config:] + 65).tobytes().decode()
+        golden = Enigma([list(rotor.values()) for rotor in rotors], 'B', plugboard).process_message(text)
+        assert (expected + 65).tobytes().decode() == golden
+
+
+def test_directed_sets(tmp_path):
+    """The directed sets cover every FSM transition and coverage bin, and the
+       cycle model gives the expected letters for them
+    """
+    manifest = write_vectors(tmp_path, directed_sets())
+    coverage = Coverage()
+    visited = set()
+    for entry, stimulus, expected in load_vectors(tmp_path):
+        model = EnigmaRTL()
+        model.set('rst_n', 0)
+        model.tick()
+        model.set('rst_n', 1)
+        model.tick()
+        coverage.reset()
+        cipher = []
+        for ui_in in stimulus:
+            model.set('ui_in', int(ui_in))
+            coverage.command(ui_in >> 5, ui_in & 0x1f)
+            while True:
+                state = model.control.state
+                model.tick()
+                visited.add((state, model.control.state))
+                if model.ready:
+                    break
+            if ui_in >> 5 == Cmd.SCRAMBLE.value:
+                cipher.append(model.get('uio_out') & 0x1f)
+        assert cipher == list(expected), entry['name']
+
+    assert visited == TRANSITIONS
+    assert coverage.done(), coverage.missing()
+    assert sum(entry['commands'] for entry in manifest) < 500
@@ -0,0 +1,161 @@
+"""Precompute stimulus/response vector files for the testbenches.
+
+Usage:
+    vectors.py [options] <DIR>
+
+Options:
+    -h, --help              Show this screen
+    --random=<n>            Number of random keys [default: 10]
+    --length=<n>            Letters of random text per key [default: 10000]
+    --seed=<n>              Seed for the random keys and texts [default: 0]
+    --directed              Write the short directed sets for gate level simulation instead
+
+Writes one vector set for the fixed key and Lorem ipsum text of
+test_enigma_fixed, plus --random sets of random keys (with at most
+PLUG_LIMIT plugs) and random text.  Each set NAME is two files:
+
+    NAME.stim   one byte per command, the ui_in value (cmd << 5 | din)
+    NAME.exp    one byte per SCRAMBLE command, the expected cipher letter (0-25)
+
+and manifest.json lists the sets with their keys and sizes.  The commands
+are the same ones run_cipher sends: clear the plugboard, load the plugs,
+rotor types, start positions and ring settings, then scramble the text.
+
+The files are plain uint8 arrays, so any testbench can memory-map them
+with load_vectors and stream them into the design without calling the
+golden model during simulation.  Run the cocotb test on them with:
+
+    VECTORS=<DIR> make -B TESTCASE=test_enigma_vectors
+
+With --directed it writes directed_sets instead, a few hundred commands that
+cover the whole FSM, which test_enigma_directed runs without any files.
+"""
+import hashlib, json, os
+from random import Random
+
+import numpy as np
+from docopt import docopt
+
+from defines import Cmd, Rotors, PLUG_LIMIT
+from fsm_latency import TURNOVERS
+from tb_utils import get_fixed_rotor_setting, get_fixed_plugboard_setting, get_golden_cipher, plain, random_key, random_text
+
+MANIFEST = 'manifest.json'
+
+
+def to_ui_in(cmd:Cmd, din:int):
+    return cmd.value << 5 | din
+
+
+def config_commands(rotors, plugboard):
+    """ui_in values that load a key (rotors as dicts, as in tb_utils)"""
+    commands = []
+    def plug(a:int, b:int):
+        commands.extend([to_ui_in(Cmd.LOAD_PLUG_ADDR, a), to_ui_in(Cmd.LOAD_PLUG_DATA, b)])
+
+    # Reset the plugboard, then the wires in both directions
+    for i in range(26):
+        plug(i, i)
+    for a, b in plugboard:
+        plug(ord(a) - 65, ord(b) - 65)
+        plug(ord(b) - 65, ord(a) - 65)
+
+    commands += [to_ui_in(Cmd.SET_ROTORS, Rotors[rotor['type']]) for rotor in rotors]
+    commands += [to_ui_in(Cmd.LOAD_START, ord(rotor['start']) - 65) for rotor in rotors]
+    commands += [to_ui_in(Cmd.LOAD_RING, rotor['ring']) for rotor in rotors]
+    return commands
+
+
+def vector_set(rotors, plugboard, plain_text:str, prefix=()):
+    """Return the (stimulus, expected) uint8 arrays of a key and text, after
+       the ui_in values in prefix.  The design blocks plugs past PLUG_LIMIT
+       (until a reset), so they do not change the expected cipher text.
+    """
+    golden = get_golden_cipher(rotors, plugboard[:PLUG_LIMIT], plain_text)
+    letters = np.frombuffer(plain_text.upper().encode('ascii', 'ignore'), dtype=np.uint8)
+    letters = letters[(letters >= ord('A')) & (letters <= ord('Z'))] - ord('A')
+    stimulus = np.concatenate([
+        np.array([*prefix, *config_commands(rotors, plugboard)], dtype=np.uint8),
+        (Cmd.SCRAMBLE.value << 5 | letters).astype(np.uint8),
+    ])
+    expected = np.frombuffer(golden.encode('ascii'), dtype=np.uint8) - ord('A')
+    return stimulus, expected
+
+
+def write_vectors(directory, sets):
+    """Write (name, rotors, plugboard, plain text[, prefix]) sets and their manifest"""
+    os.makedirs(directory, exist_ok=True)
+    manifest = []
+    for name, rotors, plugboard, plain_text, *prefix in sets:
+        stimulus, expected = vector_set(rotors, plugboard, plain_text, *prefix)
+        entry = {'name': name, 'rotors': rotors, 'plugboard': plugboard,
+                 'commands': len(stimulus), 'letters': len(expected)}
+        for kind, array in [('stim', stimulus), ('exp', expected)]:
+            array.tofile(os.path.join(directory, f'{name}.{kind}'))
+            entry[f'{kind}_sha256'] = hashlib.sha256(array.tobytes()).hexdigest()
+        manifest.append(entry)
+    with open(os.path.join(directory, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def default_sets(random:int=10, length:int=10000, seed:int=0):
+    """The fixed key and text of test_enigma_fixed, then random keys and texts"""
+    yield 'fixed', get_fixed_rotor_setting(), get_fixed_plugboard_setting(), plain
+    rng = Random(seed)
+    for i in range(random):
+        rotors, plugboard = random_key(rng, max_plugs=PLUG_LIMIT)
+        rotors = [{'type': t, 'start': start, 'ring': ring} for t, start, ring in rotors]
+        yield f'random{i}', rotors, plugboard, random_text(rng, length)
+
+
+def directed_sets():
+    """The fewest commands that take the Control FSM through every state and
+       transition, put every rotor type in every slot, and load 0 to
+       PLUG_LIMIT + 1 plugs, for gate level simulation.  One set per
+       rotor type, each a few letters long:
+
+         - the first set starts with RESET and NOP commands
+         - rotor 0 starts on its turnover, so the first letter carries
+         - in the first set, that carry lands rotor 1 on its turnover, so
+           it activates a double step and the second letter steps rotor 2,
+           and in the others the carry goes straight back to "Rotor 0"
+         - set k has k plugs (mod PLUG_LIMIT + 2), so the last is blocked
+           by the plug limiter and the text goes through every plug
+    """
+    names = list(Rotors)
+    for k in range(len(names)):
+        types = [names[(k + slot) % len(names)] for slot in range(3)]
+        turnovers = [TURNOVERS[Rotors[t]] for t in types]
+        starts = [turnovers[0], (turnovers[1] - 1 if k == 0 else turnovers[1]) % 26, k]
+        rotors = [{'type': t, 'start': chr(start + 65), 'ring': k} for t, start in zip(types, starts)]
+        plugboard = [chr(65 + i) + chr(90 - i) for i in range(k % (PLUG_LIMIT + 2))]
+        prefix = [to_ui_in(Cmd.RESET, 0), to_ui_in(Cmd.NOP, 0)] if k == 0 else []
+        yield f'directed{k}', rotors, plugboard, 'ENIGMA' + ''.join(plugboard), prefix
+
+
+def load_vectors(directory):
+    """Yield (manifest entry, stimulus, expected) for every set in directory,
+       with the arrays memory-mapped read-only
+    """
+    with open(os.path.join(directory, MANIFEST)) as f:
+        manifest = json.load(f)
+    for entry in manifest:
+        arrays = []
+        for kind in ['stim', 'exp']:
+            path = os.path.join(directory, f'{entry["name"]}.{kind}')
+            # np.memmap cannot map empty files
+            arrays.append(np.memmap(path, dtype=np.uint8, mode='r') if os.path.getsize(path)
+                          else np.zeros(0, dtype=np.uint8))
+        yield entry, *arrays
+
+
+if __name__ == '__main__':
+    args = docopt(__doc__)
+    if args['--directed']:
+        sets = directed_sets()
+    else:
+        sets = default_sets(int(args['--random']), int(args['--length']), int(args['--seed']))
+    manifest = write_vectors(args['<DIR>'], sets)
+    for entry in manifest:
+        print(f'{entry["name"]}: {entry["commands"]} commands, {entry["letters"]} letters')